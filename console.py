@@ -4,7 +4,7 @@ import cmd
 import sys
 import shlex
 from models.base_model import BaseModel
-from models.__init__ import storage
+from models import storage
 from models.user import User
 from models.place import Place
 from models.state import State
@@ -128,24 +128,26 @@ class HBNBCommand(cmd.Cmd):
         # Create an instance of the specified class
         new_instance = HBNBCommand.classes[arguments[0]]()
 
-        # Process each attribute=value pair
-        for arg in arguments[1:]:
-            if '=' not in arg:
-                print("** attribute format error **: {} (expected key=value)"
-                      .format(arg))
-                continue
-            key, value = arg.split('=', 1)
-            if not key or not value:
-                print("** attribute format error **: {} (expected key=value)"
-                      .format(arg))
-                continue
-            # Assign the parsed value to the new instance
-            setattr(new_instance, key, self.parse_value(value))
+        # Assign each parsed attribute=value pair to the new instance
+        for key, value in self.parse_params(arguments[1:]).items():
+            setattr(new_instance, key, value)
 
         # Save the new instance and print its id
         new_instance.save()
         print(new_instance.id)
 
+    def parse_params(self, arguments):
+        """Parse key=value arguments into a dict of typed values."""
+        params = {}
+        for arg in arguments:
+            key, _, value = arg.partition('=')
+            if not key or not value:
+                print("** attribute format error **: {} (expected key=value)"
+                      .format(arg))
+                continue
+            params[key] = self.parse_value(value)
+        return params
+
     # Task 2. Console improvements
     def parse_value(self, value):
         """Parse a string value to the correct type."""
@@ -170,6 +172,46 @@ class HBNBCommand(cmd.Cmd):
         print("Creates a class of any type")
         print("[Usage]: create <className>\n")
 
+    # Number of objects bulk_create hands to storage.bulk_save() at once
+    bulk_batch = 10000
+
+    def do_bulk_create(self, args):
+        """Create many objects of a class from key=value lines on stdin."""
+        c_name = args.strip()
+        if not c_name:
+            print("** class name missing **")
+            return
+        if c_name not in HBNBCommand.classes:
+            print("** class doesn't exist **")
+            return
+        cls = HBNBCommand.classes[c_name]
+        batch = []
+        count = 0
+        # One commit (or one file write) for the whole input
+        with storage.transaction():
+            while True:
+                line = self.stdin.readline()
+                if not line.strip():  # EOF or blank line ends the input
+                    break
+                new_instance = cls()
+                for key, value in self.parse_params(line.split()).items():
+                    setattr(new_instance, key, value)
+                batch.append(new_instance)
+                if len(batch) >= HBNBCommand.bulk_batch:
+                    count += storage.bulk_new(batch)
+                    storage.bulk_save()
+                    batch = []
+            if batch:
+                count += storage.bulk_new(batch)
+                storage.bulk_save()
+        print(count)
+
+    def help_bulk_create(self):
+        """ Help information for the bulk_create method """
+        print("Creates one object per key=value line read from stdin,")
+        print("until a blank line or EOF, and prints how many were created")
+        print("[Usage]: bulk_create <className>\n")
+
     def do_show(self, args):
         """ Method to show an individual object """
         new = args.partition(" ")
@@ -192,11 +234,11 @@ class HBNBCommand(cmd.Cmd):
             print("** instance id missing **")
             return
 
-        key = c_name + "." + c_id
-        try:
-            print(storage._FileStorage__objects[key])
-        except KeyError:
+        obj = storage.get(HBNBCommand.classes[c_name], c_id)
+        if obj is None:
             print("** no instance found **")
+            return
+        print(obj)
 
     def help_show(self):
         """ Help information for the show command """
@@ -223,13 +265,12 @@ class HBNBCommand(cmd.Cmd):
             print("** instance id missing **")
             return
 
-        key = c_name + "." + c_id
-
-        try:
-            del (storage.all()[key])
-            storage.save()
-        except KeyError:
+        obj = storage.get(HBNBCommand.classes[c_name], c_id)
+        if obj is None:
             print("** no instance found **")
+            return
+        storage.delete(obj)
+        storage.save()
 
     def help_destroy(self):
         """ Help information for the destroy command """
@@ -261,11 +302,11 @@ class HBNBCommand(cmd.Cmd):
 
     def do_count(self, args):
         """Count current number of class instances"""
-        count = 0
-        for k, v in storage._FileStorage__objects.items():
-            if args == k.split('.')[0]:
-                count += 1
-        print(count)
+        if args in HBNBCommand.classes:
+            # Instances of the class itself, not of its subclasses
+            print(storage.count(HBNBCommand.classes[args], exact=True))
+        else:
+            print(0)
 
     def help_count(self):
         """ """
@@ -294,11 +335,9 @@ class HBNBCommand(cmd.Cmd):
             print("** instance id missing **")
             return
 
-        # generate key from class and id
-        key = c_name + "." + c_id
-
-        # determine if key is present
-        if key not in storage.all():
+        # determine if the instance is present
+        new_dict = storage.get(HBNBCommand.classes[c_name], c_id)
+        if new_dict is None:
             print("** no instance found **")
             return
 
@@ -331,9 +370,6 @@ class HBNBCommand(cmd.Cmd):
 
             args = [att_name, att_val]
 
-        # retrieve dictionary of current objects
-        new_dict = storage.all()[key]
-
         # iterate through attr names and values
         for i, att_name in enumerate(args):
             # block only runs on even iterations
@@ -5,27 +5,77 @@ Author: TheWatcher01
 Date: 2024-03-27
 Description: This module is responsible for initializing the storage engine.
 The type of storage engine is determined by the 'HBNB_TYPE_STORAGE' environment
-variable. It supports 'db' for DBStorage (database storage) and 'file' for
+variable. It supports 'db' for DBStorage (database storage), 'mmap' for
+MMapStorage (lazily loaded, memory-mapped snapshot) and 'file' for
 FileStorage (file storage).
+
+The engine is created and reloaded on the first access to models.storage,
+not when the package is imported: importing a model (or models itself)
+neither connects to the database nor parses file.json. A process forked
+after storage was created (a worker of a preforking WSGI server) resets
+it with storage.after_fork(), so it never shares the connections, locks
+or threads of its parent.
 """
 
 # Importing the getenv function from the os module. This function is used to
 # read the environment variable.
 from os import getenv
+import threading
+import os
+
+# Serializes the creation of the storage engine between threads
+_storage_lock = threading.RLock()
+
+
+def _create_storage():
+    """Creates the storage engine chosen by HBNB_TYPE_STORAGE and loads it"""
+    # Checking the value of the 'HBNB_TYPE_STORAGE' environment variable. If
+    # it's 'db', DBStorage engine is used. Otherwise, FileStorage engine is
+    # used.
+    if getenv('HBNB_TYPE_STORAGE') == "db":
+        # Importing the DBStorage class from models.engine.db_storage module.
+        from models.engine.db_storage import DBStorage
+        # Creating an instance of the DBStorage class.
+        storage = DBStorage()
+    elif getenv('HBNB_TYPE_STORAGE') == "mmap":
+        # Importing the MMapStorage class from models.engine.mmap_storage.
+        from models.engine.mmap_storage import MMapStorage
+        # Creating an instance of the MMapStorage class.
+        storage = MMapStorage()
+    else:
+        # Importing FileStorage class from models.engine.file_storage module.
+        from models.engine.file_storage import FileStorage
+        # Creating an instance of the FileStorage class.
+        storage = FileStorage()
+
+    # Calling the reload method of the storage instance. This method is
+    # responsible for deserializing the JSON file to objects.
+    storage.reload()
+    # Attribute assignments on the models mark stored objects as changed
+    from models import base_model
+    base_model.on_change = getattr(storage, 'changed', None)
+    return storage
+
+
+def __getattr__(name):
+    """Creates models.storage on its first access (PEP 562)"""
+    if name != 'storage':
+        raise AttributeError(
+            "module {!r} has no attribute {!r}".format(__name__, name))
+    with _storage_lock:
+        if 'storage' not in globals():
+            globals()['storage'] = _create_storage()
+    return globals()['storage']
+
+
+def _after_fork():
+    """Resets the storage inherited by a forked child process"""
+    global _storage_lock
+    # The parent may have held the lock while forking
+    _storage_lock = threading.RLock()
+    storage = globals().get('storage')
+    if storage is not None:
+        storage.after_fork()
+
 
-# Checking the value of the 'HBNB_TYPE_STORAGE' environment variable. If it's
-# 'db', DBStorage engine is used. Otherwise, FileStorage engine is used.
-if getenv('HBNB_TYPE_STORAGE') == "db":
-    # Importing the DBStorage class from the models.engine.db_storage module.
-    from models.engine.db_storage import DBStorage
-    # Creating an instance of the DBStorage class.
-    storage = DBStorage()
-else:
-    # Importing FileStorage class from models.engine.file_storage module.
-    from models.engine.file_storage import FileStorage
-    # Creating an instance of the FileStorage class.
-    storage = FileStorage()
-
-# Calling the reload method of the storage instance. This method is responsible
-# for deserializing the JSON file to objects.
-storage.reload()
+os.register_at_fork(after_in_child=_after_fork)
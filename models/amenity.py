@@ -9,9 +9,9 @@ and maps it to a database table.
 """
 
 # Importing necessary classes from SQLAlchemy and models
-from models.base_model import Base, BaseModel
-from sqlalchemy.orm import relationship
-from sqlalchemy import Column, String
+from models.base_model import Base, BaseModel, relationship
+from models.base_model import Column, String
+from os import getenv
 
 # Importing the association table for the many-to-many relationship between
 # Place and Amenity. Make sure this import is correct.
@@ -25,9 +25,11 @@ class Amenity(BaseModel, Base):
     relationship.
     """
     __tablename__ = 'amenities'
-    name = Column(String(128), nullable=False)
+    name = Column(String(128), nullable=False, index=True)
 
-    # Many-to-many relationship with Place
-    # Make sure 'back_populates' matches exactly the property in Place
-    place_amenities = relationship("Place", secondary=place_amenity,
-                                   back_populates="amenities", viewonly=False)
+    if getenv('HBNB_TYPE_STORAGE') == 'db':
+        # Many-to-many relationship with Place
+        # Make sure 'back_populates' matches exactly the property in Place
+        place_amenities = relationship("Place", secondary=place_amenity,
+                                       back_populates="amenities",
+                                       viewonly=False)
@@ -6,14 +6,33 @@ Date: 2024-03-27
 Description: Defines the BaseModel class, serving as the base class for all
 other model classes in the hbnb project, facilitating the conversion of Python
 classes into SQLAlchemy Table objects for database storage.
+
+The declarations the models are built with (Base, Column, the column types,
+ForeignKey, Table, relationship) are exported from here: SQLAlchemy's in DB
+mode, the stand-ins of models/columns.py otherwise, so the file-based
+engines never import SQLAlchemy.
+
+Assigning an attribute of an object calls on_change with it: models sets it
+to the changed() method of the storage engine, when the engine has one, so
+that the next storage.save() writes a stored object again.
 """
 
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy import Column, String, DateTime
 from datetime import datetime
+from os import getenv
 import uuid
 
-Base = declarative_base()
+if getenv('HBNB_TYPE_STORAGE') == 'db':
+    from sqlalchemy import Column, String, Integer, Float, DateTime
+    from sqlalchemy import ForeignKey, Table
+    from sqlalchemy.orm import declarative_base, relationship
+    Base = declarative_base()
+else:
+    from models.columns import Column, String, Integer, Float, DateTime
+    from models.columns import ForeignKey, Table
+    from models.columns import Base, relationship
+
+# Called with an object after one of its attributes is assigned, or None
+on_change = None
 
 
 class BaseModel:
@@ -29,22 +48,32 @@ class BaseModel:
 
     def __init__(self, *args, **kwargs):
         """Initializes a new BaseModel instance."""
+        # Not in storage yet: no change to report from __setattr__
+        set_attr = super().__setattr__
         if 'id' not in kwargs:
-            self.id = str(uuid.uuid4())
+            set_attr('id', str(uuid.uuid4()))
         else:
-            self.id = kwargs['id']
+            set_attr('id', kwargs['id'])
 
-        self.created_at = kwargs.get('created_at', datetime.utcnow())
-        if isinstance(self.created_at, str):
-            self.created_at = datetime.fromisoformat(self.created_at)
+        created_at = kwargs.get('created_at', datetime.utcnow())
+        if isinstance(created_at, str):
+            created_at = datetime.fromisoformat(created_at)
+        set_attr('created_at', created_at)
 
-        self.updated_at = kwargs.get('updated_at', datetime.utcnow())
-        if isinstance(self.updated_at, str):
-            self.updated_at = datetime.fromisoformat(self.updated_at)
+        updated_at = kwargs.get('updated_at', datetime.utcnow())
+        if isinstance(updated_at, str):
+            updated_at = datetime.fromisoformat(updated_at)
+        set_attr('updated_at', updated_at)
 
         for key, value in kwargs.items():
             if key not in ['id', 'created_at', 'updated_at', '__class__']:
-                setattr(self, key, value)
+                set_attr(key, value)
+
+    def __setattr__(self, name, value):
+        """Sets an attribute and reports the change to storage."""
+        super().__setattr__(name, value)
+        if on_change is not None:
+            on_change(self)
 
     def __str__(self):
         """Returns a string representation of the instance."""
@@ -6,15 +6,25 @@ Date: 2024-03-27
 Description: Defines the City class in the HBNB project. Represents cities
 with name and state_id attributes, extending functionality from BaseModel.
 """
-from sqlalchemy import Column, String, ForeignKey
-from models.base_model import BaseModel, Base
-from sqlalchemy.orm import relationship
+from models.base_model import Column, String, ForeignKey
+from models.base_model import BaseModel, Base, relationship
+from os import getenv
 
 
 class City(BaseModel, Base):
     """ The city class, contains state ID and name """
     __tablename__ = 'cities'
 
-    name = Column(String(128), nullable=False)
+    name = Column(String(128), nullable=False, index=True)
     state_id = Column(String(60), ForeignKey('states.id'), nullable=False)
-    places = relationship("Place", backref="cities", cascade="all, delete")
+
+    if getenv('HBNB_TYPE_STORAGE') == 'db':
+        places = relationship("Place", backref="cities",
+                              cascade="all, delete", lazy="selectin")
+    else:
+        @property
+        def places(self):
+            """Returns the Place objects located in this City"""
+            from models import storage
+            from models.place import Place
+            return storage.related(Place, 'city_id', self.id)
@@ -0,0 +1,146 @@
+#!/usr/bin/python3
+"""
+Module: columns.py
+Author: TheWatcher01
+Date: 2026-10-18
+Description: Stand-ins for the SQLAlchemy declarations the models use
+(declarative Base, Column, ForeignKey, Table, column types), picked by
+models/base_model.py when HBNB_TYPE_STORAGE is not 'db'. The file-based
+engines never touch a database, and importing SQLAlchemy alone costs far
+more than the rest of a console run; with these the models are plain
+classes and SQLAlchemy is not imported at all.
+
+They keep what those engines read from the mapping: a column reads None
+on an instance that did not set it, as an unset mapped attribute does,
+and every class gets a __table__ whose columns carry their foreign keys
+(FileStorage indexes related objects by them) and their type's
+python_type. Base.metadata.sorted_tables lists the tables parents first,
+as SQLAlchemy does.
+"""
+
+from datetime import datetime
+
+
+class _Type:
+    """Column type marker: the file engines store values as they are"""
+    python_type = str
+
+    def __init__(self, *args, **kwargs):
+        """Accepts the arguments of the SQLAlchemy type"""
+
+
+class String(_Type):
+    """Text column"""
+
+
+class Integer(_Type):
+    """Integer column"""
+    python_type = int
+
+
+class Float(_Type):
+    """Floating point column"""
+    python_type = float
+
+
+class DateTime(_Type):
+    """Timestamp column"""
+    python_type = datetime
+
+
+class ForeignKey:
+    """Reference to the 'table.column' a column points to"""
+
+    def __init__(self, column, **kwargs):
+        """Records the referenced column"""
+        self.column = column
+
+
+class Column:
+    """
+    Column declaration: a non-data descriptor reading None on instances
+    that do not set the attribute, and itself on the class.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Takes the optional name, the type and the foreign keys"""
+        self.name = args[0] if args and isinstance(args[0], str) else None
+        self.key = self.name
+        self.type = String()
+        for arg in args:
+            if isinstance(arg, type) and issubclass(arg, _Type):
+                arg = arg()
+            if isinstance(arg, _Type):
+                self.type = arg
+        self.foreign_keys = {arg for arg in args
+                             if isinstance(arg, ForeignKey)}
+
+    def __set_name__(self, owner, name):
+        """Names the column after the attribute it is assigned to"""
+        if self.name is None:
+            self.name = self.key = name
+
+    def __get__(self, obj, owner=None):
+        """Returns None on instances, the Column on the class"""
+        return self if obj is None else None
+
+
+class Table:
+    """Named list of columns registered in a MetaData"""
+
+    def __init__(self, name, metadata, *columns, **kwargs):
+        """Registers the table in metadata"""
+        self.name = name
+        self.columns = list(columns)
+        metadata.tables[name] = self
+
+
+class MetaData:
+    """Registry of the tables of the models"""
+
+    def __init__(self):
+        """Starts with no table"""
+        self.tables = {}
+
+    @property
+    def sorted_tables(self):
+        """Returns the tables sorted by name, referenced tables first"""
+        ordered = []
+        visited = set()
+
+        def visit(table):
+            """Appends table after the tables it references"""
+            if table.name in visited:
+                return
+            visited.add(table.name)
+            for column in table.columns:
+                for fk in column.foreign_keys:
+                    parent = self.tables.get(fk.column.split('.')[0])
+                    if parent is not None:
+                        visit(parent)
+            ordered.append(table)
+
+        for name in sorted(self.tables):
+            visit(self.tables[name])
+        return ordered
+
+
+def relationship(*args, **kwargs):
+    """Relationships are properties of the models outside DB mode"""
+    return None
+
+
+class Base:
+    """Declarative base: builds the __table__ of each model class"""
+    metadata = MetaData()
+
+    def __init_subclass__(cls, **kwargs):
+        """Collects the columns of cls and its bases into its __table__"""
+        super().__init_subclass__(**kwargs)
+        columns = {}
+        for klass in reversed(cls.__mro__):
+            for value in vars(klass).values():
+                if isinstance(value, Column):
+                    columns[value.name] = value
+        cls.__table__ = Table(cls.__tablename__, Base.metadata,
+                              *columns.values())
@@ -0,0 +1,127 @@
+#!/usr/bin/python3
+"""
+Module: async_db_storage.py
+Author: TheWatcher01
+Date: 2026-10-18
+Description: Read-only asyncio facade over the DBStorage database, for the
+asynchronous web_flask pages (web_flask/asgi.py). Queries run on an async
+SQLAlchemy engine (aiomysql for MySQL, aiosqlite for SQLite) so a single
+event loop serves many requests while their queries wait on the database,
+instead of one blocked thread per request.
+
+Writes keep going through DBStorage. The models must be mapped, that is
+HBNB_TYPE_STORAGE=db. Relationships cannot be lazy loaded from async code:
+what a page renders is loaded with the query, through load (see
+DBStorage.options()) or the eager defaults of the relationships.
+"""
+
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import StaticPool
+from sqlalchemy import event, func, select
+from models.engine.db_storage import DBStorage, _sqlite_pragmas
+from models.amenity import Amenity
+from models.review import Review
+from models.place import Place
+from models.state import State
+from models.user import User
+from models.city import City
+from os import getenv
+
+# Async drivers replacing the sync ones of DBStorage.url()
+ASYNC_DRIVERS = {'mysql': 'mysql+aiomysql', 'sqlite': 'sqlite+aiosqlite'}
+
+
+class AsyncDBStorage:
+    """Reads hbnb models from the database with async SQLAlchemy"""
+
+    def __init__(self, url=None):
+        """
+        Creates the engine for url, by default HBNB_ASYNC_DB_URL or the
+        database of DBStorage.url() with its async driver. The pool is
+        tuned by the HBNB_MYSQL_POOL_* variables, as for DBStorage.
+        """
+        if url is None:
+            url = getenv('HBNB_ASYNC_DB_URL') or self.async_url(
+                DBStorage.url())
+        self.__engine = self.create_engine(url)
+        self.__sessions = async_sessionmaker(self.__engine,
+                                             expire_on_commit=False)
+
+    @staticmethod
+    def async_url(url):
+        """Returns url with the async driver of its database"""
+        url = make_url(url)
+        return url.set(drivername=ASYNC_DRIVERS.get(url.get_backend_name(),
+                                                    url.drivername))
+
+    @staticmethod
+    def create_engine(url):
+        """Returns the async engine for the database URL"""
+        url = make_url(url)
+        if url.get_backend_name() != 'sqlite':
+            return create_async_engine(
+                url, pool_size=int(getenv('HBNB_MYSQL_POOL_SIZE', '5')),
+                max_overflow=int(getenv('HBNB_MYSQL_MAX_OVERFLOW', '10')),
+                pool_recycle=int(getenv('HBNB_MYSQL_POOL_RECYCLE', '3600')),
+                pool_timeout=float(getenv('HBNB_MYSQL_POOL_TIMEOUT', '30')),
+                pool_pre_ping=getenv('HBNB_MYSQL_PRE_PING', '1') != '0')
+        if url.database in (None, '', ':memory:'):
+            engine = create_async_engine(url, poolclass=StaticPool)
+        else:
+            engine = create_async_engine(url)
+        event.listen(engine.sync_engine, 'connect', _sqlite_pragmas)
+        return engine
+
+    async def all(self, cls=None, load=None):
+        """
+        Returns a dictionary of the objects of cls (or of all classes),
+        keyed like DBStorage.all()
+        """
+        if cls is None:
+            result = {}
+            for cls in [State, City, User, Review, Amenity, Place]:
+                result.update(await self.all(cls))
+            return result
+        objs = await self.filter(cls, load=load)
+        return {f'{cls.__name__}.{obj.id}': obj for obj in objs}
+
+    async def get(self, cls, id, load=None):
+        """Returns the object of cls with this primary key, or None"""
+        async with self.__sessions() as session:
+            return await session.get(cls, id,
+                                     options=DBStorage.options(cls, load))
+
+    async def count(self, cls=None):
+        """Returns the number of rows of cls (or of all classes)"""
+        if cls is None:
+            total = 0
+            for cls in [State, City, User, Review, Amenity, Place]:
+                total += await self.count(cls)
+            return total
+        async with self.__sessions() as session:
+            return await session.scalar(
+                select(func.count()).select_from(cls))
+
+    async def filter(self, cls, order_by=None, limit=None, offset=0,
+                     load=None, **criteria):
+        """
+        Returns the list of objects of cls whose columns equal criteria,
+        sorted and paged in the database like DBStorage.filter()
+        """
+        query = select(cls).options(
+            *DBStorage.options(cls, load)).filter_by(**criteria)
+        if order_by:
+            column = getattr(cls, order_by.lstrip('-'))
+            query = query.order_by(
+                column.desc() if order_by.startswith('-') else column)
+        if offset:
+            query = query.offset(offset)
+        if limit is not None:
+            query = query.limit(limit)
+        async with self.__sessions() as session:
+            return list((await session.scalars(query)).all())
+
+    async def close(self):
+        """Closes the connections of the pool"""
+        await self.__engine.dispose()
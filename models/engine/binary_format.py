@@ -0,0 +1,214 @@
+#!/usr/bin/python3
+"""
+Module: binary_format.py
+Author: TheWatcher01
+Date: 2026-10-18
+Description: Compact binary snapshot format for FileStorage, selected with
+HBNB_FILE_FORMAT=binary. Records are grouped into one table per class and
+stored column by column with typed, struct-packed values; timestamps are
+stored as microseconds since the epoch instead of ISO strings, and come
+back as datetime objects that BaseModel takes as they are.
+
+Layout (little-endian):
+    b'HBNB' u8 version, u32 number of tables, then for each table:
+    str class name, u32 rows, rows x str key, u32 columns, and for each
+    column: str name followed by one tagged value per row.
+A str is a u32 byte length followed by UTF-8 bytes.
+
+Usage: python3 -m models.engine.binary_format to-binary file.json file.hbnb
+       python3 -m models.engine.binary_format to-json file.hbnb file.json
+"""
+
+from datetime import datetime, timedelta
+import struct
+import json
+import sys
+
+MAGIC = b'HBNB'
+VERSION = 1
+EPOCH = datetime(1970, 1, 1)
+# Columns whose ISO strings are stored as timestamps
+TIMESTAMPS = ('created_at', 'updated_at')
+
+MISSING, NONE, FALSE, TRUE, INT, FLOAT, STR, DATETIME, JSON = range(9)
+# Returned by _Buffer.value() for columns a record does not have
+_ABSENT = object()
+
+_u8 = struct.Struct('<B')
+_u32 = struct.Struct('<I')
+_i64 = struct.Struct('<q')
+_f64 = struct.Struct('<d')
+_tagged_i64 = struct.Struct('<Bq')
+_tagged_f64 = struct.Struct('<Bd')
+_tagged_u32 = struct.Struct('<BI')
+
+
+def _pack_str(out, text):
+    """Appends a length-prefixed UTF-8 string to out"""
+    data = text.encode('utf-8')
+    out.append(_u32.pack(len(data)))
+    out.append(data)
+
+
+def _pack_value(out, value, timestamp=False):
+    """Appends one tagged value to out"""
+    if value is None:
+        out.append(_u8.pack(NONE))
+    elif value is True or value is False:
+        out.append(_u8.pack(TRUE if value else FALSE))
+    elif isinstance(value, int) and -(1 << 63) <= value < (1 << 63):
+        out.append(_tagged_i64.pack(INT, value))
+    elif isinstance(value, float):
+        out.append(_tagged_f64.pack(FLOAT, value))
+    elif isinstance(value, str):
+        if timestamp:
+            try:
+                parsed = datetime.fromisoformat(value)
+            except ValueError:
+                parsed = None
+            # Only strings that isoformat() gives back are stored as dates
+            if (parsed is not None and parsed.tzinfo is None and
+                    parsed.isoformat() == value):
+                _pack_value(out, parsed)
+                return
+        data = value.encode('utf-8')
+        out.append(_tagged_u32.pack(STR, len(data)))
+        out.append(data)
+    elif isinstance(value, datetime) and value.tzinfo is None:
+        out.append(_tagged_i64.pack(
+            DATETIME, (value - EPOCH) // timedelta(microseconds=1)))
+    else:
+        # Lists (Place.amenity_ids), dicts and big integers
+        data = json.dumps(value).encode('utf-8')
+        out.append(_tagged_u32.pack(JSON, len(data)))
+        out.append(data)
+
+
+def dump(records, f):
+    """
+    Writes records, a mapping of storage keys to to_dict() style records
+    (each with a '__class__' entry), to the binary file f.
+    """
+    tables = {}
+    for key, record in records.items():
+        tables.setdefault(record['__class__'], []).append((key, record))
+    out = [MAGIC, _u8.pack(VERSION), _u32.pack(len(tables))]
+    for name, rows in tables.items():
+        _pack_str(out, name)
+        out.append(_u32.pack(len(rows)))
+        columns = {}
+        for key, record in rows:
+            _pack_str(out, key)
+            columns.update(dict.fromkeys(record))
+        del columns['__class__']
+        out.append(_u32.pack(len(columns)))
+        for column in columns:
+            _pack_str(out, column)
+            timestamp = column in TIMESTAMPS
+            for _, record in rows:
+                if column in record:
+                    _pack_value(out, record[column], timestamp)
+                else:
+                    out.append(_u8.pack(MISSING))
+        f.write(b''.join(out))
+        out = []
+    f.write(b''.join(out))
+
+
+class _Buffer:
+    """Cursor over the bytes of a binary snapshot"""
+
+    def __init__(self, data):
+        """Starts reading data from its first byte"""
+        self.data = data
+        self.pos = 0
+
+    def unpack(self, fmt):
+        """Reads one struct.Struct fmt and returns its first field"""
+        try:
+            value = fmt.unpack_from(self.data, self.pos)[0]
+        except struct.error:
+            raise ValueError("Truncated binary snapshot")
+        self.pos += fmt.size
+        return value
+
+    def raw(self, size):
+        """Reads size raw bytes"""
+        data = self.data[self.pos:self.pos + size]
+        if len(data) != size:
+            raise ValueError("Truncated binary snapshot")
+        self.pos += size
+        return data
+
+    def text(self):
+        """Reads a length-prefixed UTF-8 string"""
+        return str(self.raw(self.unpack(_u32)), 'utf-8')
+
+    def value(self):
+        """Reads one tagged value; returns _ABSENT for absent columns"""
+        tag = self.unpack(_u8)
+        if tag == STR:
+            return self.text()
+        if tag == DATETIME:
+            return EPOCH + timedelta(microseconds=self.unpack(_i64))
+        if tag == INT:
+            return self.unpack(_i64)
+        if tag == FLOAT:
+            return self.unpack(_f64)
+        if tag == JSON:
+            return json.loads(self.text())
+        if tag in (MISSING, NONE, FALSE, TRUE):
+            return (_ABSENT, None, False, True)[tag]
+        raise ValueError("Unknown value tag {}".format(tag))
+
+
+def load(f):
+    """
+    Yields (key, record) for each record of the binary file f, class table
+    by class table. Timestamp columns come back as datetime objects.
+    """
+    buf = _Buffer(f.read())
+    if buf.raw(len(MAGIC)) != MAGIC:
+        raise ValueError("Not a binary hbnb snapshot")
+    if buf.unpack(_u8) != VERSION:
+        raise ValueError("Unsupported binary snapshot version")
+    for _ in range(buf.unpack(_u32)):
+        name = buf.text()
+        keys = [buf.text() for _ in range(buf.unpack(_u32))]
+        rows = [{'__class__': name} for _ in keys]
+        for _ in range(buf.unpack(_u32)):
+            column = buf.text()
+            for row in rows:
+                value = buf.value()
+                if value is not _ABSENT:
+                    row[column] = value
+        yield from zip(keys, rows)
+
+
+def to_binary(json_path, binary_path):
+    """Converts a FileStorage JSON snapshot to the binary format"""
+    with open(json_path, 'r') as f:
+        records = json.load(f)
+    with open(binary_path, 'wb') as f:
+        dump(records, f)
+
+
+def to_json(binary_path, json_path):
+    """Converts a binary snapshot back to FileStorage JSON"""
+    with open(binary_path, 'rb') as f:
+        records = dict(load(f))
+    for record in records.values():
+        for column, value in record.items():
+            if isinstance(value, datetime):
+                record[column] = value.isoformat()
+    with open(json_path, 'w') as f:
+        json.dump(records, f)
+
+
+if __name__ == "__main__":
+    commands = {'to-binary': to_binary, 'to-json': to_json}
+    if len(sys.argv) != 4 or sys.argv[1] not in commands:
+        print("Usage: {} to-binary|to-json <source> <destination>"
+              .format(sys.argv[0]))
+        sys.exit(1)
+    commands[sys.argv[1]](sys.argv[2], sys.argv[3])
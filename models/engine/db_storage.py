@@ -6,11 +6,20 @@ Date: 2024-03-25
 Description: This module defines the DBStorage class for interactions with
 MySQL databases using SQLAlchemy ORM. It supports initialization, CRUD
 operations, and session management tailored to the hbnb project's requirements.
+HBNB_DB_URL points it at another database instead, such as a SQLite file
+(sqlite:////path/to/hbnb.db) or memory database (sqlite://), for tests and
+benchmarks that need the DB mode without a MySQL server.
 """
 
 from sqlalchemy.orm import sessionmaker, scoped_session
+from sqlalchemy.orm import defaultload, selectinload, lazyload
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, func, insert, select
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import QueuePool, StaticPool
+from contextlib import contextmanager
+from datetime import datetime
+from models.engine import schema
 from models.amenity import Amenity
 from models.base_model import Base
 from models.review import Review
@@ -19,6 +28,50 @@ from models.state import State
 from models.user import User
 from models.city import City
 from os import getenv
+import threading
+import time
+
+
+class _TimedQueuePool(QueuePool):
+    """
+    QueuePool that also measures how long checkouts wait for a connection,
+    for DBStorage.pool_stats().
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Starts with no checkout recorded"""
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.wait_time = 0.0
+        self.max_wait = 0.0
+        self.__stats_lock = threading.Lock()
+
+    def _do_get(self):
+        """Checks a connection out, recording the time spent waiting"""
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            waited = time.perf_counter() - start
+            with self.__stats_lock:
+                self.checkouts += 1
+                self.wait_time += waited
+                self.max_wait = max(self.max_wait, waited)
+
+
+def _sqlite_pragmas(dbapi_connection, connection_record):
+    """
+    Tunes each new SQLite connection: WAL journal (readers no longer block
+    the writer, memory databases keep their own journal), fsync only at
+    checkpoints, foreign keys enforced as InnoDB does, a 64 MiB page cache
+    and temporary tables in memory.
+    """
+    cursor = dbapi_connection.cursor()
+    for pragma in ('journal_mode=WAL', 'synchronous=NORMAL',
+                   'foreign_keys=ON', 'cache_size=-65536',
+                   'temp_store=MEMORY'):
+        cursor.execute('PRAGMA ' + pragma)
+    cursor.close()
 
 
 class DBStorage:
@@ -33,49 +86,319 @@ class DBStorage:
     def __init__(self):
         """
         Initializes the DBStorage instance by creating an engine linked to
-        MySQL database specified via environment variables. It conditionally
-        drops all tables if the environment is set to 'test'.
+        the database of url(). The schema is not touched here: reload()
+        only checks its version, and a test database is reset with
+        python3 -m models.engine.schema init-db --drop.
+
+        The connection pool is tuned with HBNB_MYSQL_POOL_SIZE (5),
+        HBNB_MYSQL_MAX_OVERFLOW (10), HBNB_MYSQL_POOL_RECYCLE (seconds
+        before a connection is replaced, 3600) and HBNB_MYSQL_POOL_TIMEOUT
+        (seconds to wait for a free connection, 30). HBNB_MYSQL_PRE_PING=0
+        skips the ping on checkout: a dropped connection then fails its
+        first statement and the pool is invalidated (optimistic handling).
+        """
+        self.__engine = self.create_engine(self.url())
+        # Per thread, as the sessions: transaction() nesting depth (depth)
+        # and the objects waiting for bulk_save(), by class (bulk)
+        self.__local = threading.local()
+        # Change counters per class name for generation()
+        self.__generations = {}
+        self.__generations_lock = threading.Lock()
+
+    @staticmethod
+    def url():
+        """
+        Returns the URL of the database: HBNB_DB_URL when it is set, else
+        the MySQL database of the HBNB_MYSQL_* variables.
         """
-        user = getenv('HBNB_MYSQL_USER')
-        pwd = getenv('HBNB_MYSQL_PWD')
-        host = getenv('HBNB_MYSQL_HOST')
-        db = getenv('HBNB_MYSQL_DB')
-        conn_str = f'mysql+mysqldb://{user}:{pwd}@{host}/{db}'
-        self.__engine = create_engine(conn_str, pool_pre_ping=True)
+        url = getenv('HBNB_DB_URL')
+        if url is None:
+            user = getenv('HBNB_MYSQL_USER')
+            pwd = getenv('HBNB_MYSQL_PWD')
+            host = getenv('HBNB_MYSQL_HOST')
+            db = getenv('HBNB_MYSQL_DB')
+            url = f'mysql+mysqldb://{user}:{pwd}@{host}/{db}'
+        return url
 
-        if getenv('HBNB_ENV') == 'test':
-            Base.metadata.drop_all(self.__engine)
+    @staticmethod
+    def create_engine(url):
+        """
+        Returns the engine for the database URL. SQLite connections get the
+        pragmas of _sqlite_pragmas(); a memory database lives in a single
+        connection shared by every thread (StaticPool), since each new
+        connection would open an empty database. Other databases use the
+        pool tuned by the HBNB_MYSQL_POOL_* variables.
+        """
+        url = make_url(url)
+        timeout = float(getenv('HBNB_MYSQL_POOL_TIMEOUT', '30'))
+        pool = {'poolclass': _TimedQueuePool,
+                'pool_size': int(getenv('HBNB_MYSQL_POOL_SIZE', '5')),
+                'max_overflow': int(getenv('HBNB_MYSQL_MAX_OVERFLOW', '10')),
+                'pool_timeout': timeout}
+        if url.get_backend_name() == 'sqlite':
+            connect_args = {'check_same_thread': False}
+            if (url.database in (None, '', ':memory:') or
+                    url.query.get('mode') == 'memory'):
+                engine = create_engine(url, poolclass=StaticPool,
+                                       connect_args=connect_args)
+            else:
+                # Seconds a writer waits for the database lock
+                connect_args['timeout'] = timeout
+                engine = create_engine(url, connect_args=connect_args,
+                                       **pool)
+            event.listen(engine, 'connect', _sqlite_pragmas)
+            return engine
+        return create_engine(
+            url, pool_recycle=int(getenv('HBNB_MYSQL_POOL_RECYCLE', '3600')),
+            pool_pre_ping=getenv('HBNB_MYSQL_PRE_PING', '1') != '0', **pool)
 
-    def all(self, cls=None):
+    def all(self, cls=None, load=None):
         """
         Queries and returns all objects of a given class from the database.
         If no class is specified, it returns all objects in the database.
+        load lists the relationships of cls to load eagerly (see options()).
         """
         if cls:
+            query = self.__session.query(cls).options(
+                *self.options(cls, load))
             return {f'{obj.__class__.__name__}.{obj.id}': obj
-                    for obj in self.__session.query(cls).all()}
+                    for obj in query.all()}
         else:
             result = {}
             for cls in [State, City, User, Review, Amenity, Place]:
                 result.update(self.all(cls))
             return result
 
+    def get(self, cls, id, load=None):
+        """
+        Returns the object of cls with this primary key, or None, without
+        loading any other row.
+        """
+        return self.__session.get(cls, id, options=self.options(cls, load))
+
+    @staticmethod
+    def record(obj):
+        """
+        Returns the to_dict() form of obj, built from its mapped columns
+        only: relationships loaded on obj are left out, and no other row
+        is loaded.
+        """
+        record = {'__class__': type(obj).__name__}
+        for column in obj.__table__.columns:
+            value = getattr(obj, column.key)
+            if isinstance(value, datetime):
+                value = value.isoformat()
+            record[column.key] = value
+        return record
+
+    def count(self, cls=None, exact=False):
+        """
+        Returns the number of rows of cls (or of all classes), counted by
+        the database with SELECT COUNT(*). exact is accepted for parity
+        with the file engines: a mapped class has no mapped subclasses.
+        """
+        if cls is None:
+            return sum(self.count(cls)
+                       for cls in [State, City, User, Review, Amenity, Place])
+        return self.__session.scalar(select(func.count()).select_from(cls))
+
+    def filter(self, cls, order_by=None, limit=None, offset=0, load=None,
+               **criteria):
+        """
+        Returns the list of objects of cls whose columns equal criteria,
+        sorted on order_by ('-name' for descending) and paged with limit and
+        offset. The WHERE, ORDER BY, LIMIT and OFFSET clauses all run in
+        the database.
+        """
+        query = self.__session.query(cls).options(
+            *self.options(cls, load)).filter_by(**criteria)
+        if order_by:
+            column = getattr(cls, order_by.lstrip('-'))
+            query = query.order_by(
+                column.desc() if order_by.startswith('-') else column)
+        if offset:
+            query = query.offset(offset)
+        if limit is not None:
+            query = query.limit(limit)
+        return query.all()
+
+    @staticmethod
+    def options(cls, load):
+        """
+        Returns the loader options for load, a list of relationship paths
+        of cls ('cities' or 'cities.places') loaded with one SELECT ... IN
+        per level, or of SQLAlchemy loader options such as joinedload().
+        With load None the relationships of cls follow their eager
+        defaults, but those of the objects they load are left lazy: the
+        defaults do not cascade (State.cities into City.places into
+        Place.amenities). Otherwise the relationships load does not name
+        are left lazy, so a page only prefetches what it renders.
+        """
+        if load is None:
+            return [defaultload(relationship).lazyload('*')
+                    for relationship in cls.__mapper__.relationships]
+        options = [lazyload('*')]
+        for path in load:
+            if not isinstance(path, str):
+                options.append(path)
+                continue
+            option, target = None, cls
+            for name in path.split('.'):
+                attr = getattr(target, name)
+                option = (selectinload(attr) if option is None
+                          else option.selectinload(attr))
+                target = attr.property.mapper.class_
+            options.append(option.lazyload('*'))
+        return options
+
     def new(self, obj):
         """
         Adds a new object to the current database session, ready for commit.
         """
         self.__session.add(obj)
+        self.__bump(type(obj))
+
+    def bulk_new(self, objs):
+        """
+        Queues every object of objs for bulk_save(), without adding them
+        to the session; returns how many were queued.
+        """
+        bulk = self.__queue()
+        count = 0
+        for obj in objs:
+            bulk.setdefault(type(obj), []).append(obj)
+            count += 1
+        self.__bump(*bulk)
+        return count
+
+    def bulk_save(self):
+        """
+        Inserts the objects queued by bulk_new() with one executemany
+        INSERT per table, parents before children, and commits through
+        save(). Only the column values are written: relationships of the
+        queued objects are not followed. The queue (the current thread's)
+        is emptied whether or not it succeeds; inside transaction() a
+        failure is raised so the block rolls back.
+        """
+        bulk = self.__queue()
+        self.__local.bulk = {}
+        tables = {cls.__table__: cls for cls in bulk}
+        self.__insert(
+            (table, [self.__row(table, obj) for obj in bulk[tables[table]]])
+            for table in Base.metadata.sorted_tables if table in tables)
+
+    def bulk_insert(self, table, rows):
+        """
+        Inserts rows, dicts of column values, into table (an association
+        table such as place_amenity) with one executemany INSERT, and
+        commits like bulk_save().
+        """
+        self.__insert([(table, rows)])
+        # Rows of an association table change the classes it links
+        self.__bump(*(mapper.class_ for mapper in Base.registry.mappers
+                      if table in mapper.tables or
+                      any(fk.column.table in mapper.tables
+                          for fk in table.foreign_keys)))
+
+    def __insert(self, inserts):
+        """Runs the (table, rows) executemany INSERTs, then save()"""
+        try:
+            self.__session.flush()
+            for table, rows in inserts:
+                if rows:
+                    self.__session.execute(insert(table), rows)
+        except SQLAlchemyError as e:
+            if self.__depth():
+                raise
+            self.__session.rollback()
+            print(f'SQLAlchemy Exception: {e}')
+            return
+        self.save()
+
+    @staticmethod
+    def __row(table, obj):
+        """Returns the column values of obj for an INSERT into table"""
+        row = {}
+        for column in table.columns:
+            value = getattr(obj, column.key, None)
+            if (value is None and column.default is not None and
+                    column.default.is_scalar):
+                value = column.default.arg
+            row[column.key] = value
+        return row
+
+    @contextmanager
+    def transaction(self):
+        """
+        Groups the writes of the block in one database transaction: save()
+        calls are deferred and a single commit is made when the block exits.
+        If it raises, the session is rolled back. Nested blocks join the
+        outermost one.
+        """
+        depth = self.__depth()
+        self.__local.depth = depth + 1
+        try:
+            yield self
+        except BaseException:
+            self.__local.depth = depth
+            if depth == 0:
+                self.__local.bulk = {}
+                self.__bump(*self.__pending())
+                self.__session.rollback()
+            raise
+        self.__local.depth = depth
+        if depth == 0:
+            self.save()
+
+    def __depth(self):
+        """Returns the transaction() nesting depth of the current thread"""
+        return getattr(self.__local, 'depth', 0)
+
+    def __queue(self):
+        """Returns the bulk_new() queue of the current thread"""
+        bulk = getattr(self.__local, 'bulk', None)
+        if bulk is None:
+            bulk = self.__local.bulk = {}
+        return bulk
 
     def save(self):
         """
         Commits all changes of the current database session to the database.
         Handles exceptions by rolling back the session to the previous state.
+        Inside transaction() the commit waits for the end of the block.
         """
+        if self.__depth():
+            return
+        changed = self.__pending()
         try:
             self.__session.commit()
         except SQLAlchemyError as e:
             self.__session.rollback()
             print(f'SQLAlchemy Exception: {e}')
+        self.__bump(*changed)
+
+    def generation(self, cls):
+        """
+        Returns a counter bumped whenever this process adds, updates or
+        deletes an object of cls (and again when it commits or rolls the
+        change back): what is derived from the objects of cls (a rendered
+        page) is still valid while it is unchanged. Writes made by other
+        processes are not seen.
+        """
+        return self.__generations.get(cls.__name__, 0)
+
+    def __pending(self):
+        """Returns the classes of the objects the session has to write"""
+        session = self.__session
+        return {type(obj) for objs in (session.new, session.dirty,
+                                       session.deleted) for obj in objs}
+
+    def __bump(self, *classes):
+        """Records a change of the objects of classes"""
+        with self.__generations_lock:
+            for cls in classes:
+                name = cls.__name__
+                self.__generations[name] = self.__generations.get(name, 0) + 1
 
     def delete(self, obj=None):
         """
@@ -83,15 +406,61 @@ class DBStorage:
         """
         if obj:
             self.__session.delete(obj)
+            self.__bump(type(obj))
 
     def reload(self):
         """
-        Recreates the database schema and initializes a new session.
+        Checks the schema version of the database with one SELECT (creating
+        the tables if it has none, see schema.check()) and initializes a
+        new session.
         """
-        Base.metadata.create_all(self.__engine)
+        try:
+            schema.check(self.__engine)
+        except ValueError as e:
+            print(e)
+        self.__session = self.__new_session()
+
+    def __new_session(self):
+        """Returns a registry of sessions, one per thread"""
         session_factory = sessionmaker(
             bind=self.__engine, expire_on_commit=False)
-        self.__session = scoped_session(session_factory)
+        return scoped_session(session_factory)
+
+    def after_fork(self):
+        """
+        Prepares the storage inherited by a forked process: the pool drops
+        the parent's connections without closing them (they are still the
+        parent's), and sessions and locks are created anew
+        """
+        self.__engine.dispose(close=False)
+        self.__local = threading.local()
+        self.__generations_lock = threading.Lock()
+        if self.__session is not None:
+            self.__session = self.__new_session()
+
+    def pool_stats(self):
+        """
+        Returns the state of the connection pool for monitoring: its size,
+        the connections checked out, idle and in overflow, and the number
+        of checkouts with their total and longest wait in seconds. A
+        SQLite memory database has a single connection, reported as a pool
+        of size 1.
+        """
+        pool = self.__engine.pool
+        if isinstance(pool, StaticPool):
+            return {'size': 1, 'checked_out': 0, 'checked_in': 1,
+                    'overflow': 0, 'checkouts': 0, 'wait_time': 0.0,
+                    'max_wait': 0.0}
+        stats = {
+            'size': pool.size(),
+            'checked_out': pool.checkedout(),
+            'checked_in': pool.checkedin(),
+            'overflow': max(pool.overflow(), 0),
+        }
+        stats['checkouts'] = getattr(pool, 'checkouts', 0)
+        stats['wait_time'] = getattr(pool, 'wait_time', 0.0)
+        stats['max_wait'] = getattr(pool, 'max_wait', 0.0)
+        return stats
 
     def close(self):
         """
@@ -0,0 +1,255 @@
+#!/usr/bin/python3
+"""
+Module: dump_loader.py
+Author: TheWatcher01
+Date: 2026-10-18
+Description: Loads the MySQL dumps shipped with the project (7-dump.sql,
+100-hbnb.sql) into the configured storage engine, without a MySQL client.
+The dump is never read whole: one pass finds the CREATE TABLE and INSERT
+statements, then the rows of each table are tokenized from fixed-size
+chunks and handed to storage.bulk_new()/bulk_save() in batches, tables
+being loaded parents first. Everything is loaded in one
+storage.transaction(): one commit in DB mode, one write of file.json in
+file mode.
+
+Usage: python3 -m models.engine.dump_loader <dump.sql> [<batch size>]
+"""
+
+from models.engine.file_storage import FileStorage
+from models.base_model import Base
+from models.place import place_amenity
+import codecs
+import re
+import sys
+import os
+
+# Size of the chunks the dump is read by
+CHUNK_SIZE = 1 << 16
+
+# Statements start a line; the file is scanned with a newline prepended
+_statement = re.compile(rb'\n(CREATE TABLE|INSERT INTO) `([^`]+)`')
+_column = re.compile(r'^\s+`([^`]+)`', re.MULTILINE)
+# Strings are matched with unrolled loops, which never backtrack
+_string = r"'[^'\\]*(?:(?:\\.|'')[^'\\]*)*'"
+_row = re.compile(r"""\s*,?\s*(?:
+    \(([^'()]*(?:%s[^'()]*)*)\)   # (values) of one row
+    |(;)                          # end of the statement
+)""" % _string, re.VERBOSE | re.DOTALL)
+_value = re.compile(r"""\s*(?:
+    (%s)                          # quoted string
+    |(NULL)
+    |([^,\s]+)                    # number
+)\s*(?:,|$)""" % _string, re.VERBOSE | re.DOTALL)
+_escape = re.compile(r"\\(.)|''", re.DOTALL)
+_escapes = {'0': '\0', 'n': '\n', 'r': '\r', 't': '\t', 'b': '\b',
+            'Z': '\x1a'}
+
+
+def _unescape(match):
+    """Returns the character a MySQL string escape stands for"""
+    if match.group(0) == "''":
+        return "'"
+    return _escapes.get(match.group(1), match.group(1))
+
+
+def _string_value(literal):
+    """Returns the text of a quoted SQL string literal"""
+    text = literal[1:-1]
+    if '\\' in text or "''" in text:
+        text = _escape.sub(_unescape, text)
+    return text
+
+
+def _is_float(number):
+    """Tells whether a SQL number literal is not an integer"""
+    return '.' in number or 'e' in number or 'E' in number
+
+
+class DumpReader:
+    """Streams the rows of the INSERT statements of a mysqldump file"""
+
+    def __init__(self, path, chunk_size=CHUNK_SIZE):
+        """Finds the column order and the INSERT offsets of each table"""
+        self.path = path
+        self.chunk_size = chunk_size
+        # table -> column names, and table -> offsets of its INSERTs
+        self.columns = {}
+        self.inserts = {}
+        with open(path, 'rb') as f:
+            self.__scan(f)
+
+    def rows(self, table):
+        """Yields each row of table as a tuple of Python values"""
+        with open(self.path, 'rb') as f:
+            for offset in self.inserts.get(table, ()):
+                f.seek(offset)
+                yield from self.__values(f)
+
+    def __scan(self, f):
+        """Records the offset of every CREATE TABLE and INSERT statement"""
+        creates = {}
+        data = b'\n'
+        base = -1
+        while True:
+            chunk = f.read(self.chunk_size)
+            data += chunk
+            # Matches starting in the last 256 bytes may be cut: they are
+            # looked for again with the next chunk
+            limit = len(data) - 256 if chunk else len(data)
+            for match in _statement.finditer(data):
+                if match.start() >= limit:
+                    break
+                table = match.group(2).decode('utf-8')
+                if match.group(1) == b'INSERT INTO':
+                    self.inserts.setdefault(table, []).append(
+                        base + match.end())
+                else:
+                    creates[table] = base + match.end()
+            if not chunk:
+                break
+            base += max(limit, 0)
+            data = data[max(limit, 0):]
+        for table, offset in creates.items():
+            self.columns[table] = self.__create_columns(f, offset)
+
+    def __create_columns(self, f, offset):
+        """Reads the column names of the CREATE TABLE at offset"""
+        f.seek(offset)
+        lines = []
+        for line in f:
+            line = line.decode('utf-8')
+            if line.startswith(')'):
+                break
+            lines.append(line)
+        return _column.findall(''.join(lines))
+
+    def __values(self, f):
+        """Yields the tuples of the INSERT statement f is positioned in"""
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        buf = ''
+        pos = -1
+        while pos < 0:
+            chunk = f.read(self.chunk_size)
+            if not chunk:
+                raise ValueError(
+                    "INSERT without VALUES in {}".format(self.path))
+            buf += decoder.decode(chunk)
+            pos = buf.find('VALUES')
+        pos += len('VALUES')
+        eof = False
+        while True:
+            match = _row.match(buf, pos)
+            # A row ending the buffer may continue in the next chunk
+            if (match is None or match.end() == len(buf)) and not eof:
+                chunk = f.read(self.chunk_size)
+                eof = not chunk
+                buf = buf[pos:] + decoder.decode(chunk, final=eof)
+                pos = 0
+                continue
+            if match is None:
+                raise ValueError("Unexpected SQL near: {!r}"
+                                 .format(buf[pos:pos + 40]))
+            if match.group(2):
+                return
+            pos = match.end()
+            yield self.__parse_row(match.group(1))
+
+    @staticmethod
+    def __parse_row(text):
+        """Returns the Python values of the comma-separated SQL values"""
+        return tuple(_string_value(string) if string
+                     else None if null
+                     else float(number) if _is_float(number)
+                     else int(number)
+                     for string, null, number in _value.findall(text))
+
+
+def load(path, storage, batch_size=10000):
+    """
+    Loads the rows of the dump at path into storage and returns the number
+    of rows loaded per table. place_amenity rows become rows of the
+    association table where storage can insert table rows (bulk_insert(),
+    DB mode) and Place.amenity_ids entries otherwise.
+    """
+    reader = DumpReader(path)
+    classes = {cls.__tablename__: cls
+               for cls in FileStorage.classes().values()
+               if hasattr(cls, '__tablename__')}
+    counts = {}
+    with storage.transaction():
+        for table in Base.metadata.sorted_tables:
+            if table.name not in reader.columns:
+                continue
+            columns = reader.columns[table.name]
+            rows = (dict(zip(columns, row))
+                    for row in reader.rows(table.name))
+            if table.name in classes:
+                counts[table.name] = _load_objects(
+                    storage, classes[table.name], rows, batch_size)
+            elif table is place_amenity and hasattr(storage, 'bulk_insert'):
+                counts[table.name] = _load_association_rows(
+                    storage, table, rows, batch_size)
+            elif table is place_amenity:
+                counts[table.name] = _load_amenity_ids(storage, rows)
+    return counts
+
+
+def _load_objects(storage, cls, rows, batch_size):
+    """Instantiates rows as cls objects and bulk saves them in batches"""
+    count = 0
+    batch = []
+    for row in rows:
+        batch.append(cls(**row))
+        if len(batch) >= batch_size:
+            count += storage.bulk_new(batch)
+            storage.bulk_save()
+            batch = []
+    count += storage.bulk_new(batch)
+    storage.bulk_save()
+    return count
+
+
+def _load_association_rows(storage, table, rows, batch_size):
+    """Inserts association table rows in batches"""
+    count = 0
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            storage.bulk_insert(table, batch)
+            count += len(batch)
+            batch = []
+    storage.bulk_insert(table, batch)
+    return count + len(batch)
+
+
+def _load_amenity_ids(storage, rows):
+    """Adds place_amenity rows to the amenity_ids of the loaded places"""
+    from models.place import Place
+    count = 0
+    for row in rows:
+        place = storage.get(Place, row['place_id'])
+        if place is None:
+            continue
+        if 'amenity_ids' not in place.__dict__:
+            # Place.amenity_ids is a class-level default list
+            place.amenity_ids = []
+        place.amenity_ids.append(row['amenity_id'])
+        storage.new(place)
+        count += 1
+    storage.save()
+    return count
+
+
+if __name__ == "__main__":
+    if len(sys.argv) not in (2, 3):
+        print("Usage: {} <dump.sql> [<batch size>]".format(sys.argv[0]))
+        sys.exit(1)
+    if os.getenv('HBNB_TYPE_STORAGE') == 'mmap':
+        # Filling a new store: no snapshot to build it from yet
+        from models.engine.mmap_storage import MMapStorage
+        MMapStorage.missing_ok = True
+    from models import storage
+    counts = load(sys.argv[1], storage, *map(int, sys.argv[2:]))
+    for table, count in counts.items():
+        print("{}: {}".format(table, count))
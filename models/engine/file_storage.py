@@ -6,50 +6,798 @@ Date: 2024-03-27
 Description: Defines the FileStorage class for serializing instances to a JSON
 file and deserializing JSON file to instances, managing a simple file-based
 storage system.
+
+When the 'HBNB_FILE_JOURNAL' environment variable is set to '1', save() no
+longer rewrites the whole JSON file: every new/update/delete is appended as
+one JSON line to a journal next to the snapshot ('file.json.log'). The
+journal is folded back into the snapshot every 'HBNB_JOURNAL_COMPACT'
+records (1000 by default) and replayed on top of the snapshot by reload().
+
+Only objects marked dirty since the last save() (through new() or delete(),
+which BaseModel.save() and BaseModel.delete() go through, or changed(),
+called by BaseModel on every attribute assignment) are serialized again;
+the last saved to_dict() of every clean object is kept in a cache and
+written back as is.
+
+Objects are also bucketed by class name so all(cls) only walks the buckets
+of cls and its subclasses instead of every stored object, and by the value
+of each of their foreign-key columns so related() hands the file-mode
+relationship properties (State.cities, City.places, ...) their children
+without scanning the child class.
+
+With HBNB_FILE_FORMAT=binary the snapshot is kept in 'file.hbnb' using the
+typed binary layout of models/engine/binary_format.py instead of JSON.
+
+The snapshot is never rewritten in place: it is written next to the old one
+and renamed over it. 'HBNB_FSYNC_WINDOW' (seconds, 0 by default) lets the
+saves made within that window share a single fsync().
+
+Several processes can share one store: save() holds an exclusive fcntl
+lock on 'file.json.lock', merges what other processes wrote since it last
+loaded, writes, and bumps a change sequence number kept in the lock file.
+reload() reads under a shared lock and, like close(), returns at once while
+that number (see changes()) and the file are unchanged.
 """
 
+from models.engine.atomic_file import GroupCommit, atomic_write
+from models.engine.json_stream import JSONObjectReader
+from contextlib import contextmanager
+from datetime import datetime
+from os import getenv
+import itertools
+import bisect
+import struct
+import threading
+import fcntl
 import json
+import io
+import os
+
+_sequence = struct.Struct('<Q')
+
+
+def sort_and_page(objects, order_by=None, limit=None, offset=0):
+    """
+    Returns objects as a list sorted on the attribute named order_by
+    ('-name' for descending, None values last), without the first offset
+    ones and with at most limit of them.
+    """
+    objects = list(objects)
+    if order_by:
+        attr = order_by.lstrip('-')
+
+        def sort_key(obj):
+            value = getattr(obj, attr, None)
+            return (value is None, value)
+        objects.sort(key=sort_key, reverse=order_by.startswith('-'))
+    end = None if limit is None else offset + limit
+    return objects[offset:end]
+
+
+class _SortedIndex:
+    """
+    Keys of one class kept sorted on one attribute (None values last), so
+    ordered queries walk a list instead of sorting on every call.
+    """
+
+    def __init__(self, attr):
+        """Starts with no key indexed"""
+        self.attr = attr
+        self.__entries = []
+        self.__sort_keys = {}
+
+    def add(self, key, obj):
+        """Files key at the place of its attribute value"""
+        self.discard(key)
+        value = getattr(obj, self.attr, None)
+        sort_key = (value is None, value)
+        bisect.insort(self.__entries, (sort_key, key))
+        self.__sort_keys[key] = sort_key
+
+    def discard(self, key):
+        """Removes key if it is indexed"""
+        sort_key = self.__sort_keys.pop(key, None)
+        if sort_key is not None:
+            i = bisect.bisect_left(self.__entries, (sort_key, key))
+            del self.__entries[i]
+
+    def keys(self, reverse=False, start=0, stop=None):
+        """
+        Returns the keys in attribute order, from the start-th to before
+        the stop-th: a page costs its own length, whatever its offset
+        """
+        entries = self.__entries
+        if reverse:
+            size = len(entries)
+            stop = size if stop is None else min(stop, size)
+            entries = entries[max(size - stop, 0):max(size - start, 0)][::-1]
+        else:
+            entries = entries[start:stop]
+        return [key for _, key in entries]
 
 
 class FileStorage:
     """This class manages storage of hbnb models in JSON format"""
-    __file_path = 'file.json'
+    __binary = getenv('HBNB_FILE_FORMAT') == 'binary'
+    __file_path = 'file.hbnb' if __binary else 'file.json'
     __objects = {}
+    # Keys changed since the last save(): key -> object, or None if deleted
+    __dirty = {}
+    # Last saved to_dict() of each clean object, keyed like __objects
+    __records = {}
+    # Per-class buckets: class name -> {key: obj}, and class name -> class
+    __by_class = {}
+    __class_of = {}
+    # Reverse foreign-key index: (class name, fk column, parent id) ->
+    # {key: obj}, the fk values each key is filed under, and the fk columns
+    # of each class name
+    __children = {}
+    __fk_values = {}
+    __fk_columns = {}
+    # Sorted indexes (class name -> {attribute: _SortedIndex}) built by the
+    # first ordered query and maintained from then on, a change counter per
+    # class name, and the ordered related() lists computed at a given count
+    __sorted = {}
+    __changes = {}
+    __related_order = {}
+    # File signature and change sequence number seen by the last reload()
+    # or save()
+    __loaded = None
+    __sequence = 0
+    __journaled = getenv('HBNB_FILE_JOURNAL') == '1'
+    __compact_every = int(getenv('HBNB_JOURNAL_COMPACT', '1000'))
+    __journal_records = 0
+    __commits = GroupCommit(float(getenv('HBNB_FSYNC_WINDOW', '0')))
+    # Per thread, as DBStorage's sessions: nesting depth of transaction()
+    # (depth), whether a save() was deferred (deferred), and the state of
+    # each key before its first change in the transaction (undo)
+    __local = threading.local()
+    # reload() reports progress every that many records
+    __progress_every = 1000
 
-    def all(self, cls=None):
-        """Returns a dictionary of models currently in storage"""
+    def all(self, cls=None, load=None):
+        """
+        Returns a dictionary of models currently in storage. load is
+        accepted for DBStorage compatibility: relationships are served
+        from the foreign-key index and never need eager loading here.
+        """
         if cls is None:
             return FileStorage.__objects
+        self.__sync_buckets()
+        result = {}
+        for name, bucket in FileStorage.__by_class.items():
+            # Subclass check per bucket keeps all(BaseModel) semantics
+            if issubclass(FileStorage.__class_of[name], cls):
+                result.update(bucket)
+        return result
+
+    def get(self, cls, id, load=None):
+        """Returns the object of cls with this id, or None"""
+        return FileStorage.__objects.get('{}.{}'.format(cls.__name__, id))
+
+    def record(self, obj):
+        """
+        Returns the to_dict() of obj. A clean object gets its record as
+        last saved or loaded, without building it again; that dictionary
+        is shared with storage and must not be modified.
+
+        Records loaded from a binary snapshot hold datetime timestamps
+        (which reload() compares as they are); they are returned as a copy
+        with ISO strings, as to_dict() gives them.
+        """
+        key = '{}.{}'.format(type(obj).__name__, obj.id)
+        record = FileStorage.__records.get(key)
+        if (record is None or key in FileStorage.__dirty or
+                FileStorage.__objects.get(key) is not obj):
+            return obj.to_dict()
+        if FileStorage.__binary:
+            return {column: value.isoformat()
+                    if isinstance(value, datetime) else value
+                    for column, value in record.items()}
+        return record
+
+    def count(self, cls=None, exact=False):
+        """
+        Returns the number of objects of cls and its subclasses (or of all
+        objects); with exact, of cls only
+        """
+        if cls is None:
+            return len(FileStorage.__objects)
+        self.__sync_buckets()
+        if exact:
+            return len(FileStorage.__by_class.get(cls.__name__, ()))
+        return sum(len(bucket)
+                   for name, bucket in FileStorage.__by_class.items()
+                   if issubclass(FileStorage.__class_of[name], cls))
+
+    def filter(self, cls, order_by=None, limit=None, offset=0, load=None,
+               **criteria):
+        """
+        Returns the list of objects of cls whose attributes equal criteria,
+        sorted on order_by ('-name' for descending) and paged with limit and
+        offset. An id or a foreign-key criterion narrows the candidates
+        through the indexes before the other criteria are checked. load is
+        ignored, as in all().
+        """
+        sort_attr = order_by.lstrip('-') if order_by else None
+        reverse = bool(order_by) and order_by.startswith('-')
+        ordered = sort_attr is None
+        if 'id' in criteria:
+            obj = self.get(cls, criteria.pop('id'))
+            candidates = [obj] if isinstance(obj, cls) else []
         else:
-            # Use isinstance() for checking the object's type
-            return {k: v for k, v in FileStorage.__objects.items()
-                    if isinstance(v, cls)}
+            self.__sync_buckets()
+            fks = FileStorage.__fk_columns.get(cls.__name__, ())
+            fk = next((fk for fk in fks if fk in criteria), None)
+            if self.__has_subclasses(cls):
+                candidates = self.all(cls).values()
+            elif fk is not None:
+                candidates = self.related(cls, fk, criteria.pop(fk),
+                                          sort_attr)
+                if reverse:
+                    candidates.reverse()
+                ordered = True
+            elif sort_attr is not None:
+                objects = FileStorage.__objects
+                index = self.__sorted_index(cls.__name__, sort_attr)
+                if not criteria:
+                    # Paged in the index, without walking the offset
+                    end = None if limit is None else offset + limit
+                    return [objects[key]
+                            for key in index.keys(reverse, offset, end)]
+                candidates = (objects[key] for key in index.keys(reverse))
+                ordered = True
+            else:
+                candidates = self.all(cls).values()
+        matches = (obj for obj in candidates
+                   if all(getattr(obj, attr, None) == value
+                          for attr, value in criteria.items()))
+        if not ordered:
+            return sort_and_page(matches, order_by, limit, offset)
+        end = None if limit is None else offset + limit
+        return list(itertools.islice(matches, offset, end))
+
+    def __has_subclasses(self, cls):
+        """Tells whether objects of strict subclasses of cls are stored"""
+        return any(issubclass(other, cls) and other is not cls
+                   for other in FileStorage.__class_of.values())
+
+    def related(self, cls, fk, value, order_by=None):
+        """
+        Returns the objects of cls whose foreign key fk equals value, sorted
+        on the attribute order_by if given. Sorted lists are kept until an
+        object of cls changes.
+        """
+        self.__sync_buckets()
+        name = cls.__name__
+        children = FileStorage.__children.get((name, fk, value), {})
+        if order_by is None:
+            return list(children.values())
+        changes = FileStorage.__changes.get(name, 0)
+        cached = FileStorage.__related_order.get((name, fk, value, order_by))
+        if cached is None or cached[0] != changes:
+            cached = (changes, sort_and_page(children.values(), order_by))
+            FileStorage.__related_order[(name, fk, value, order_by)] = cached
+        return list(cached[1])
 
     def delete(self, obj=None):
         """Deletes obj from __objects if it’s inside"""
         if obj is not None:
             obj_key = "{}.{}".format(type(obj).__name__, obj.id)
             if obj_key in FileStorage.__objects:
+                self.__remember_undo(obj_key)
                 del FileStorage.__objects[obj_key]
+                FileStorage.__dirty[obj_key] = None
+                self.__unindex(obj_key)
 
     def new(self, obj):
         """Adds new object to storage dictionary"""
-        obj_dict = obj.to_dict()
-        key = '{}.{}'.format(obj_dict['__class__'], obj.id)
-        self.all().update({key: obj})
+        key = '{}.{}'.format(type(obj).__name__, obj.id)
+        self.__remember_undo(key)
+        FileStorage.__objects[key] = obj
+        FileStorage.__dirty[key] = obj
+        self.__index(key, obj)
+
+    def changed(self, obj):
+        """
+        Marks obj as changed if it is the object stored under its key;
+        BaseModel calls it whenever one of its attributes is assigned
+        """
+        id = obj.__dict__.get('id')
+        if id is None:
+            return
+        key = '{}.{}'.format(type(obj).__name__, id)
+        if FileStorage.__objects.get(key) is obj:
+            self.new(obj)
+
+    def bulk_new(self, objs):
+        """Adds every object of objs to storage; returns how many"""
+        count = 0
+        for obj in objs:
+            self.new(obj)
+            count += 1
+        return count
+
+    def bulk_save(self):
+        """
+        Saves the objects added by bulk_new(): save() already serializes
+        only what changed, in one pass and one write of the file
+        """
+        self.save()
+
+    @contextmanager
+    def transaction(self):
+        """
+        Groups the writes of the block: save() calls are deferred until it
+        exits and then done once. If it raises, the objects it added,
+        updated or deleted through new() and delete() go back to their
+        state before the block, in memory, and nothing is written. Nested
+        blocks join the outermost one.
+
+        The block and its undo log belong to the calling thread: changes
+        other threads make meanwhile are neither deferred nor rolled back.
+        The objects themselves are shared, though, so a save() by another
+        thread writes the changes the block made so far.
+        """
+        local = FileStorage.__local
+        depth = getattr(local, 'depth', 0)
+        if depth == 0:
+            local.undo = {}
+            local.deferred = False
+        local.depth = depth + 1
+        try:
+            yield self
+        except BaseException:
+            local.depth = depth
+            if depth == 0:
+                self.__rollback()
+            raise
+        local.depth = depth
+        if depth == 0:
+            local.undo = None
+            if local.deferred:
+                self.save()
+
+    def __remember_undo(self, key):
+        """Records the state of key before its first change in a block"""
+        undo = getattr(FileStorage.__local, 'undo', None)
+        if undo is not None and key not in undo:
+            undo[key] = (FileStorage.__objects.get(key),
+                         key in FileStorage.__dirty,
+                         FileStorage.__dirty.get(key),
+                         FileStorage.__records.get(key))
+
+    def __rollback(self):
+        """Undoes the changes recorded since the transaction began"""
+        local = FileStorage.__local
+        undo, local.undo = local.undo, None
+        local.deferred = False
+        classes = self.classes()
+        for key, (obj, was_dirty, dirty_obj, record) in undo.items():
+            FileStorage.__objects.pop(key, None)
+            self.__unindex(key)
+            if not was_dirty and record is not None:
+                # The object may have been changed in place: rebuild it
+                # from its last saved record
+                obj = classes[record['__class__']](**record)
+            if obj is not None:
+                FileStorage.__objects[key] = obj
+                self.__index(key, obj)
+            if was_dirty:
+                FileStorage.__dirty[key] = dirty_obj
+            elif FileStorage.__records.get(key) is not record:
+                # Saved by another thread during the block: the next
+                # save() writes the state before the block back
+                FileStorage.__dirty[key] = obj
+            else:
+                FileStorage.__dirty.pop(key, None)
 
     def save(self):
-        """Saves storage dictionary to file"""
-        with open(FileStorage.__file_path, 'w') as f:
-            temp = {k: v.to_dict() for k, v in FileStorage.__objects.items()}
-            json.dump(temp, f)
+        """
+        Saves storage dictionary to file, or appends to the journal. Only
+        the objects marked dirty are serialized again: a change made
+        inside a mutable attribute (place.amenity_ids.append(...)), which
+        changed() does not see, must be followed by new(obj) or obj.save().
+        """
+        if getattr(FileStorage.__local, 'depth', 0):
+            # Inside transaction(): written once when the block exits
+            FileStorage.__local.deferred = True
+            return
+        self.__sync_buckets()
+        with self.__lock(fcntl.LOCK_EX) as lock:
+            if self.__changed_since_load(lock):
+                # Merge what other processes saved before writing over it
+                self.__load(lock)
+            if not FileStorage.__journaled:
+                self.__compact(sync=False)
+            else:
+                self.__append_journal()
+            self.__bump_sequence(lock)
+
+    def __append_journal(self):
+        """Appends the dirty objects to the journal"""
+        self.__trim_journal()
+        with FileStorage.__commits.append(self.__journal_path()) as f:
+            for key, obj in FileStorage.__dirty.items():
+                if obj is None:
+                    FileStorage.__records.pop(key, None)
+                    record = {'op': 'delete', 'key': key}
+                else:
+                    FileStorage.__records[key] = obj.to_dict()
+                    record = {'op': 'put', 'key': key,
+                              'obj': FileStorage.__records[key]}
+                f.write(json.dumps(record) + '\n')
+        FileStorage.__journal_records += len(FileStorage.__dirty)
+        FileStorage.__dirty.clear()
+        FileStorage.__loaded = self.__signature()
+        if FileStorage.__journal_records >= FileStorage.__compact_every:
+            self.__compact()
+
+    def __trim_journal(self):
+        """
+        Cuts a torn last record (an append interrupted before its newline)
+        off the journal, so that the next record starts on a line of its
+        own instead of being glued to the fragment. Called under the
+        exclusive lock.
+        """
+        try:
+            f = open(self.__journal_path(), 'rb+')
+        except FileNotFoundError:
+            return
+        with f:
+            end = f.seek(0, os.SEEK_END)
+            position = end
+            while position > 0:
+                start = max(position - 4096, 0)
+                f.seek(start)
+                chunk = f.read(position - start)
+                if position == end and chunk.endswith(b'\n'):
+                    return
+                newline = chunk.rfind(b'\n')
+                if newline != -1:
+                    f.truncate(start + newline + 1)
+                    return
+                position = start
+            f.truncate(0)
+
+    def compact(self):
+        """Writes a full snapshot of __objects and discards the journal"""
+        with self.__lock(fcntl.LOCK_EX) as lock:
+            if self.__changed_since_load(lock):
+                self.__load(lock)
+            self.__compact()
+            self.__bump_sequence(lock)
+
+    def __compact(self, sync=True):
+        """Writes a full snapshot of __objects and discards the journal
+
+        The snapshot atomically replaces the previous one. It reaches the
+        disk before the journal is removed; without sync and without a
+        journal, when it is flushed is left to the group commit.
+        """
+        path = FileStorage.__file_path
+        mode = 'wb' if FileStorage.__binary else 'w'
+        if sync or os.path.exists(self.__journal_path()):
+            writer = atomic_write(path, mode)
+        else:
+            writer = FileStorage.__commits.write(path, mode)
+        with writer as f:
+            if FileStorage.__binary:
+                from models.engine import binary_format
+                binary_format.dump(self.__serialize(), f)
+            else:
+                json.dump(self.__serialize(), f)
+        FileStorage.__dirty.clear()
+        FileStorage.__journal_records = 0
+        try:
+            os.remove(self.__journal_path())
+        except FileNotFoundError:
+            pass
+        FileStorage.__loaded = self.__signature()
+
+    def __serialize(self):
+        """Returns the records of __objects, serializing dirty ones only"""
+        objects = FileStorage.__objects
+        records = FileStorage.__records
+        for key, obj in FileStorage.__dirty.items():
+            if obj is None:
+                records.pop(key, None)
+        for key, obj in objects.items():
+            if key in FileStorage.__dirty or key not in records:
+                records[key] = obj.to_dict()
+        if len(records) != len(objects):
+            # Objects were removed from __objects behind our back
+            records = {key: records[key] for key in objects}
+            FileStorage.__records = records
+        return records
 
     def close(self):
-        """Calls reload() method for deserializing the JSON file to objects"""
+        """Calls reload(), which is a no-op while the file is unchanged"""
         self.reload()
 
-    def reload(self):
-        """Loads storage dictionary from file"""
+    def reload(self, progress=None):
+        """Loads storage dictionary from file, then replays the journal
+
+        Nothing is parsed when the snapshot and the journal still have the
+        inode, size and mtime seen by the last load or save. Otherwise only
+        the records that differ from the cached ones are instantiated again,
+        and clean objects that disappeared from the file are dropped.
+        Objects with unsaved changes are left as they are.
+
+        The snapshot is streamed record by record. If given, progress is
+        called as progress(counts, bytes_read) every 1000 records and once
+        at the end, counts mapping class names to the number of their
+        records read so far.
+        """
+        if (self.changes() == FileStorage.__sequence and
+                self.__signature() == FileStorage.__loaded and
+                self.__in_sync()):
+            return
+        with self.__lock(fcntl.LOCK_SH) as lock:
+            self.__load(lock, progress)
+
+    def changes(self):
+        """Returns the change sequence number bumped by every save()"""
+        try:
+            fd = os.open(self.__lock_path(), os.O_RDONLY)
+        except FileNotFoundError:
+            return 0
+        try:
+            return self.__read_sequence(fd)
+        finally:
+            os.close(fd)
+
+    def after_fork(self):
+        """
+        Prepares the storage inherited by a forked process: the objects
+        stay loaded, but fsync() grouping restarts without the parent's
+        timer thread
+        """
+        FileStorage.__commits.after_fork()
+
+    def generation(self, cls):
+        """
+        Returns a counter bumped whenever an object of cls is added,
+        updated or deleted, here or by a reload() merging what another
+        process saved: what is derived from the objects of cls (a rendered
+        page) is still valid while it is unchanged.
+        """
+        return FileStorage.__changes.get(cls.__name__, 0)
+
+    def __load(self, lock, progress=None):
+        """Merges the snapshot and the journal into __objects"""
+        sequence = self.__read_sequence(lock)
+        signature = self.__signature()
+        self.__sync_buckets()
+        classes = self.classes()
+        seen = set()
+        counts = {}
+        bytes_read = 0
+        try:
+            if FileStorage.__binary:
+                f = open(FileStorage.__file_path, 'rb')
+                from models.engine import binary_format
+                records = binary_format.load(f)
+            else:
+                # Decoded on top of the binary file, whose tell() is a
+                # byte offset (that of a text file is an opaque cookie)
+                f = open(FileStorage.__file_path, 'rb')
+                records = JSONObjectReader(
+                    io.TextIOWrapper(f, encoding='utf-8'))
+            with f:
+                for key, val in records:
+                    self.__merge_record(key, val, classes)
+                    seen.add(key)
+                    name = val.get('__class__')
+                    counts[name] = counts.get(name, 0) + 1
+                    if (progress is not None and
+                            len(seen) % FileStorage.__progress_every == 0):
+                        progress(counts, f.tell())
+                bytes_read = f.tell()
+        except FileNotFoundError:
+            pass
+        self.__replay_journal(classes, seen)
+        for key in list(FileStorage.__records):
+            if key not in seen and key not in FileStorage.__dirty:
+                self.__forget(key)
+        FileStorage.__loaded = signature
+        FileStorage.__sequence = sequence
+        if progress is not None:
+            progress(counts, bytes_read)
+
+    def __replay_journal(self, classes, seen):
+        """Applies the journal records written since the last snapshot"""
+        FileStorage.__journal_records = 0
+        try:
+            with open(self.__journal_path(), 'r') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        # Torn record from an interrupted append: the
+                        # records after it are still whole
+                        continue
+                    key = record['key']
+                    if record['op'] == 'put':
+                        self.__merge_record(key, record['obj'], classes)
+                        seen.add(key)
+                    else:
+                        if key not in FileStorage.__dirty:
+                            self.__forget(key)
+                        seen.discard(key)
+                    FileStorage.__journal_records += 1
+        except FileNotFoundError:
+            pass
+
+    def __merge_record(self, key, val, classes):
+        """Instantiates val under key unless it is already loaded as is"""
+        if key in FileStorage.__dirty:
+            return
+        if (key in FileStorage.__objects and
+                FileStorage.__records.get(key) == val):
+            return
+        val_class = val.get('__class__')
+        if val_class in classes:
+            # BaseModel.__init__ skips '__class__', so val is passed as is
+            # and doubles as the cached record of the now clean object
+            obj = classes[val_class](**val)
+            FileStorage.__objects[key] = obj
+            FileStorage.__records[key] = val
+            self.__index(key, obj)
+        else:
+            print(f"Warning: Class {val_class} not found.")
+
+    def __forget(self, key):
+        """Drops key from __objects, the record cache and the indexes"""
+        FileStorage.__objects.pop(key, None)
+        FileStorage.__records.pop(key, None)
+        self.__unindex(key)
+
+    def __signature(self):
+        """Returns (inode, size, mtime) of the snapshot and the journal"""
+        signature = []
+        for path in (FileStorage.__file_path, self.__journal_path()):
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                signature.append(None)
+            else:
+                signature.append((st.st_ino, st.st_size, st.st_mtime_ns))
+        return tuple(signature)
+
+    def __index(self, key, obj):
+        """Files obj under key in the bucket of its class"""
+        name = type(obj).__name__
+        if name not in FileStorage.__by_class:
+            FileStorage.__by_class[name] = {}
+            FileStorage.__class_of[name] = type(obj)
+        FileStorage.__by_class[name][key] = obj
+        FileStorage.__changes[name] = FileStorage.__changes.get(name, 0) + 1
+        for index in FileStorage.__sorted.get(name, {}).values():
+            index.add(key, obj)
+        if name not in FileStorage.__fk_columns:
+            table = getattr(type(obj), '__table__', None)
+            FileStorage.__fk_columns[name] = tuple(
+                column.name for column in getattr(table, 'columns', ())
+                if column.foreign_keys)
+        self.__unindex_children(key)
+        values = []
+        for fk in FileStorage.__fk_columns[name]:
+            value = getattr(obj, fk, None)
+            if value is not None:
+                FileStorage.__children.setdefault(
+                    (name, fk, value), {})[key] = obj
+                values.append((fk, value))
+        if values:
+            FileStorage.__fk_values[key] = values
+
+    def __unindex(self, key):
+        """Removes key from the bucket of its class"""
+        name = key.partition('.')[0]
+        bucket = FileStorage.__by_class.get(name)
+        if bucket is not None:
+            bucket.pop(key, None)
+        FileStorage.__changes[name] = FileStorage.__changes.get(name, 0) + 1
+        for index in FileStorage.__sorted.get(name, {}).values():
+            index.discard(key)
+        self.__unindex_children(key)
+
+    def __unindex_children(self, key):
+        """Removes key from the reverse foreign-key index"""
+        name = key.partition('.')[0]
+        for fk, value in FileStorage.__fk_values.pop(key, ()):
+            children = FileStorage.__children.get((name, fk, value))
+            if children is not None:
+                children.pop(key, None)
+                if not children:
+                    del FileStorage.__children[(name, fk, value)]
+
+    def __sorted_index(self, name, attr):
+        """Returns the sorted index of class name on attr, building it"""
+        indexes = FileStorage.__sorted.setdefault(name, {})
+        if attr not in indexes:
+            index = _SortedIndex(attr)
+            for key, obj in FileStorage.__by_class.get(name, {}).items():
+                index.add(key, obj)
+            indexes[attr] = index
+        return indexes[attr]
+
+    def __in_sync(self):
+        """Tells whether the buckets still cover exactly __objects"""
+        indexed = sum(len(b) for b in FileStorage.__by_class.values())
+        return indexed == len(FileStorage.__objects)
+
+    def __sync_buckets(self):
+        """Rebuilds the buckets if __objects was changed behind our back"""
+        if not self.__in_sync():
+            FileStorage.__by_class.clear()
+            FileStorage.__children.clear()
+            FileStorage.__fk_values.clear()
+            FileStorage.__sorted.clear()
+            FileStorage.__related_order.clear()
+            for key, obj in FileStorage.__objects.items():
+                self.__index(key, obj)
+
+    @contextmanager
+    def __lock(self, operation):
+        """Holds an fcntl lock on the lock file, yielding its descriptor
+
+        A shared lock only needs to read: an existing lock file is opened
+        read only (flock() works on any descriptor), and where it can be
+        neither opened nor created (a directory the process cannot write
+        to) the store is read without a lock and the descriptor is None.
+        """
+        path = self.__lock_path()
+        fd = None
+        if operation == fcntl.LOCK_SH:
+            try:
+                fd = os.open(path, os.O_RDONLY)
+            except OSError:
+                pass
+        if fd is None:
+            try:
+                fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+            except OSError:
+                if operation != fcntl.LOCK_SH:
+                    raise
+                yield None
+                return
+        try:
+            fcntl.flock(fd, operation)
+            yield fd
+        finally:
+            os.close(fd)
+
+    def __changed_since_load(self, lock):
+        """Tells whether another process saved since our last load"""
+        return (self.__read_sequence(lock) != FileStorage.__sequence or
+                self.__signature() != FileStorage.__loaded)
+
+    @staticmethod
+    def __read_sequence(fd):
+        """Reads the change sequence number from the lock file, if any"""
+        if fd is None:
+            return 0
+        data = os.pread(fd, _sequence.size, 0)
+        return _sequence.unpack(data)[0] if len(data) == _sequence.size else 0
+
+    def __bump_sequence(self, lock):
+        """Records one more change in the lock file"""
+        FileStorage.__sequence = self.__read_sequence(lock) + 1
+        os.pwrite(lock, _sequence.pack(FileStorage.__sequence), 0)
+        FileStorage.__loaded = self.__signature()
+
+    def __lock_path(self):
+        """Returns the path of the lock file kept next to the snapshot"""
+        return FileStorage.__file_path + '.lock'
+
+    def __journal_path(self):
+        """Returns the path of the journal kept next to the snapshot"""
+        return FileStorage.__file_path + '.log'
+
+    @staticmethod
+    def classes():
+        """Returns the mapping of class names to model classes"""
         from models.base_model import BaseModel
         from models.user import User
         from models.place import Place
@@ -58,22 +806,8 @@ class FileStorage:
         from models.amenity import Amenity
         from models.review import Review
 
-        classes = {
+        return {
             'BaseModel': BaseModel, 'User': User, 'Place': Place,
             'State': State, 'City': City, 'Amenity': Amenity,
             'Review': Review
         }
-        try:
-            with open(FileStorage.__file_path, 'r') as f:
-                temp = json.load(f)
-                for key, val in temp.items():
-                    if val['__class__'] in classes:
-                        # Create a copy of val to manipulate
-                        val_copy = val.copy()
-                        val_class = val_copy.pop('__class__', None)
-                        if val_class:
-                            self.all()[key] = classes[val_class](**val_copy)
-                    else:
-                        print(f"Warning: Class {val['__class__']} not found.")
-        except FileNotFoundError:
-            pass
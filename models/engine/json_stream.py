@@ -0,0 +1,95 @@
+#!/usr/bin/python3
+"""
+Module: json_stream.py
+Author: TheWatcher01
+Date: 2026-10-18
+Description: Incremental reader for the top-level JSON object written by
+FileStorage. It decodes one (key, value) member at a time from a bounded
+buffer, so loading a store never holds the whole file, nor the whole parsed
+dictionary, in memory.
+"""
+
+from json import JSONDecodeError, JSONDecoder
+
+WHITESPACE = ' \t\n\r'
+
+
+class JSONObjectReader:
+    """
+    Iterates over the (key, value) members of the JSON object stored in a
+    text file, in file order. Raises ValueError (JSONDecodeError) on
+    malformed or empty input, like json.load(). chars_read tells how far
+    into the file the reader is.
+    """
+
+    def __init__(self, f, chunk_size=1 << 16):
+        """Wraps the file object f, read chunk_size characters at a time"""
+        self.f = f
+        self.chunk_size = chunk_size
+        self.chars_read = 0
+        self.__buf = ''
+        self.__pos = 0
+        self.__eof = False
+        self.__decoder = JSONDecoder()
+
+    def __iter__(self):
+        """Yields (key, value) for each member of the object"""
+        self.__expect('{')
+        if self.__peek() == '}':
+            return
+        while True:
+            if self.__peek() != '"':
+                raise JSONDecodeError("Expecting property name enclosed in "
+                                      "double quotes", self.__buf, self.__pos)
+            key = self.__decode()
+            self.__expect(':')
+            value = self.__decode()
+            yield key, value
+            if self.__expect(',}') == '}':
+                return
+
+    def __fill(self, size=None):
+        """Drops consumed input and appends the next chunk of the file"""
+        chunk = self.f.read(size or self.chunk_size)
+        if not chunk:
+            self.__eof = True
+        self.chars_read += len(chunk)
+        self.__buf = self.__buf[self.__pos:] + chunk
+        self.__pos = 0
+
+    def __peek(self):
+        """Returns the next non-whitespace character, or '' at the end"""
+        while True:
+            buf = self.__buf
+            while self.__pos < len(buf) and buf[self.__pos] in WHITESPACE:
+                self.__pos += 1
+            if self.__pos < len(buf) or self.__eof:
+                return buf[self.__pos:self.__pos + 1]
+            self.__fill()
+
+    def __expect(self, chars):
+        """Consumes the next character, which must be one of chars"""
+        char = self.__peek()
+        if not char or char not in chars:
+            raise JSONDecodeError("Expecting one of {!r}".format(chars),
+                                  self.__buf, self.__pos)
+        self.__pos += 1
+        return char
+
+    def __decode(self):
+        """Decodes the next JSON value, reading more input until it fits"""
+        self.__peek()
+        size = self.chunk_size
+        while True:
+            try:
+                value, end = self.__decoder.raw_decode(self.__buf, self.__pos)
+            except JSONDecodeError:
+                if self.__eof:
+                    raise
+            else:
+                # A value ending with the buffer may be a truncated number
+                if end < len(self.__buf) or self.__eof:
+                    self.__pos = end
+                    return value
+            self.__fill(size)
+            size *= 2
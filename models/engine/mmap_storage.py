@@ -0,0 +1,563 @@
+#!/usr/bin/python3
+"""
+Module: mmap_storage.py
+Author: TheWatcher01
+Date: 2026-10-18
+Description: Defines the MMapStorage class, a read-mostly storage engine
+selected with HBNB_TYPE_STORAGE=mmap. It memory-maps an indexed snapshot
+('file.idx', built from file.json) and only instantiates the objects that
+all(), get() or a relationship property actually reach. Materialized
+objects are kept in an LRU cache of HBNB_MMAP_CACHE_SIZE entries (10000 by
+default), so startup time and memory follow the working set rather than
+the size of the dataset.
+
+The snapshot is not built on demand: with HBNB_TYPE_STORAGE=mmap, build
+it from file.json first (at HBNB_MMAP_PATH, 'file.idx' by default) with
+the command below. reload() warns when it does not exist and starts from
+an empty store, which the first save() writes to that path; tools that
+fill a new store (models.engine.dump_loader) set MMapStorage.missing_ok
+to start from it silently.
+
+Snapshot layout (little-endian):
+    b'HBNBIDX1', u32 number of classes, then for each class: str name,
+    u64 offset and u32 count of its entries, u32 number of foreign keys
+    and for each of them: str column, u64 offset and u32 count of its
+    entries. A str is a u16 byte length followed by UTF-8 bytes.
+    Entries are (60s id, u64 offset, u32 length) sorted by id, offsets
+    pointing into the JSON records stored after the index. Foreign-key
+    entries are (60s value, u32 entry number) sorted by value.
+
+Usage: python3 -m models.engine.mmap_storage build file.json file.idx
+"""
+
+from models.engine.file_storage import FileStorage, sort_and_page
+from models.engine.atomic_file import atomic_write
+from collections import OrderedDict
+from contextlib import contextmanager
+from os import getenv
+import threading
+import warnings
+import struct
+import mmap
+import json
+import sys
+import os
+
+MAGIC = b'HBNBIDX1'
+ID_WIDTH = 60
+_u16 = struct.Struct('<H')
+_u32 = struct.Struct('<I')
+_location = struct.Struct('<QI')
+_entry = struct.Struct('<{}sQI'.format(ID_WIDTH))
+_fk_entry = struct.Struct('<{}sI'.format(ID_WIDTH))
+
+
+def _pad(value):
+    """Returns value as the fixed-width bytes stored in the index"""
+    data = value.encode('utf-8')
+    if len(data) > ID_WIDTH:
+        raise ValueError("{!r} is longer than {} bytes"
+                         .format(value, ID_WIDTH))
+    return data.ljust(ID_WIDTH, b'\0')
+
+
+def _fk_columns(name, classes):
+    """Returns the foreign-key columns of the model class called name"""
+    table = getattr(classes.get(name), '__table__', None)
+    return [column.name for column in getattr(table, 'columns', ())
+            if column.foreign_keys]
+
+
+def write_snapshot(path, items):
+    """
+    Writes the indexed snapshot of items, an iterable of (key, raw, record)
+    where raw is the JSON encoding of record, to path. The file is written
+    next to path and renamed over it, so readers never see it half done.
+    """
+    classes = FileStorage.classes()
+    tables = {}
+    for key, raw, record in items:
+        name, _, obj_id = key.partition('.')
+        tables.setdefault(name, []).append((_pad(obj_id), raw, record))
+    header_size = len(MAGIC) + _u32.size
+    layout = []
+    for name, rows in tables.items():
+        rows.sort(key=lambda row: row[0])
+        fks = _fk_columns(name, classes)
+        layout.append((name, rows, fks))
+        header_size += (_u16.size + len(name.encode('utf-8')) +
+                        _location.size + _u32.size)
+        for fk in fks:
+            header_size += (_u16.size + len(fk.encode('utf-8')) +
+                            _location.size)
+    header = [MAGIC, _u32.pack(len(layout))]
+    index = []
+    data = []
+    offset = header_size
+    data_size = 0
+    for name, rows, fks in layout:
+        name_bytes = name.encode('utf-8')
+        header += [_u16.pack(len(name_bytes)), name_bytes,
+                   _location.pack(offset, len(rows)), _u32.pack(len(fks))]
+        offset += _entry.size * len(rows)
+        for padded, raw, record in rows:
+            index.append((padded, data_size, len(raw)))
+            data.append(raw)
+            data_size += len(raw)
+        for fk in fks:
+            entries = sorted((_pad(record[fk]), number)
+                             for number, (_, _, record) in enumerate(rows)
+                             if record.get(fk) is not None)
+            fk_bytes = fk.encode('utf-8')
+            header += [_u16.pack(len(fk_bytes)), fk_bytes,
+                       _location.pack(offset, len(entries))]
+            offset += _fk_entry.size * len(entries)
+            index.append(entries)
+    with atomic_write(path, 'wb') as f:
+        f.write(b''.join(header))
+        for item in index:
+            if isinstance(item, list):
+                f.write(b''.join(_fk_entry.pack(*entry) for entry in item))
+            else:
+                # Record offsets are made absolute once the index is known
+                f.write(_entry.pack(item[0], offset + item[1], item[2]))
+        for raw in data:
+            f.write(raw)
+
+
+def build(json_path, path):
+    """Builds the indexed snapshot at path from a FileStorage JSON file"""
+    with open(json_path, 'r') as f:
+        records = json.load(f)
+    write_snapshot(path, ((key, json.dumps(record).encode('utf-8'), record)
+                          for key, record in records.items()))
+
+
+class MMapStorage:
+    """This class serves hbnb models lazily from a memory-mapped snapshot"""
+    __file_path = getenv('HBNB_MMAP_PATH', 'file.idx')
+    __cache_size = int(getenv('HBNB_MMAP_CACHE_SIZE', '10000'))
+    # True when a missing snapshot is expected: no warning from reload()
+    missing_ok = False
+
+    def __init__(self):
+        """Starts with no snapshot mapped and empty caches"""
+        self.__map = None
+        self.__tables = {}
+        self.__signature = None
+        # Materialized objects, least recently used first
+        self.__cache = OrderedDict()
+        # Unsaved changes: new or updated objects, and deleted keys
+        self.__changed = {}
+        self.__deleted = set()
+        # Per thread, as FileStorage's: transaction() nesting depth
+        # (depth), whether a save() was deferred (deferred), the state of
+        # each key before its first change in the transaction (undo) and
+        # the number of save() calls when it began (saves)
+        self.__local = threading.local()
+        self.__saves = 0
+        # Change counters per class name for generation(), and one for
+        # every class, bumped when another writer replaces the snapshot
+        self.__generations = {}
+        self.__epoch = 0
+
+    def all(self, cls=None, load=None):
+        """
+        Returns a dictionary of the models of cls (or all models); load is
+        ignored, relationships being served from the foreign-key index
+        """
+        classes = FileStorage.classes()
+        result = {}
+        for name, table in self.__tables.items():
+            if cls is not None and not issubclass(classes[name], cls):
+                continue
+            first, count = table['entries']
+            for number in range(count):
+                key = self.__key(name, first, number)
+                if key not in self.__deleted:
+                    result[key] = self.__materialize(name, first, number, key)
+        for key, obj in self.__changed.items():
+            if cls is None or isinstance(obj, cls):
+                result[key] = obj
+        return result
+
+    def get(self, cls, id, load=None):
+        """Returns the object of cls with this id, or None"""
+        key = '{}.{}'.format(cls.__name__, id)
+        if key in self.__changed:
+            return self.__changed[key]
+        if key in self.__deleted or key in self.__cache:
+            return self.__cached(key)
+        location = self.__locate(cls.__name__, id)
+        if location is None:
+            return None
+        return self.__materialize(cls.__name__, *location, key)
+
+    def record(self, obj):
+        """Returns the to_dict() of obj"""
+        return obj.to_dict()
+
+    def count(self, cls=None, exact=False):
+        """
+        Returns the number of models of cls and its subclasses (or of all
+        models); with exact, of cls only
+        """
+        classes = FileStorage.classes()
+        number = 0
+        for name, table in self.__tables.items():
+            if cls is not None and not (
+                    classes[name] is cls if exact
+                    else issubclass(classes[name], cls)):
+                continue
+            first, count = table['entries']
+            for entry in range(count):
+                key = self.__key(name, first, entry)
+                if key not in self.__deleted and key not in self.__changed:
+                    number += 1
+        return number + sum(1 for obj in self.__changed.values()
+                            if cls is None or (type(obj) is cls if exact
+                                               else isinstance(obj, cls)))
+
+    def filter(self, cls, order_by=None, limit=None, offset=0, load=None,
+               **criteria):
+        """
+        Returns the list of models of cls whose attributes equal criteria,
+        sorted on order_by ('-name' for descending) and paged with limit and
+        offset. Only the candidates of an id or foreign-key criterion are
+        materialized when the snapshot indexes it.
+        """
+        table = self.__tables.get(cls.__name__, {'fks': {}})
+        fk = next((fk for fk in table['fks'] if fk in criteria), None)
+        if 'id' in criteria:
+            obj = self.get(cls, criteria.pop('id'))
+            candidates = [obj] if isinstance(obj, cls) else []
+        elif fk is not None and not any(
+                issubclass(other, cls) and other is not cls
+                for other in FileStorage.classes().values()):
+            candidates = self.related(cls, fk, criteria.pop(fk))
+        else:
+            candidates = self.all(cls).values()
+        matches = (obj for obj in candidates
+                   if all(getattr(obj, attr, None) == value
+                          for attr, value in criteria.items()))
+        return sort_and_page(matches, order_by, limit, offset)
+
+    def related(self, cls, fk, value, order_by=None):
+        """
+        Returns the objects of cls whose foreign key fk equals value, sorted
+        on the attribute order_by if given
+        """
+        name = cls.__name__
+        result = []
+        table = self.__tables.get(name)
+        if table is not None and fk in table['fks'] and value is not None:
+            first, _ = table['entries']
+            start, count = table['fks'][fk]
+            target = _pad(value)
+            low = self.__bisect(start, count, _fk_entry.size, target)
+            high = self.__bisect(start, count, _fk_entry.size, target, True)
+            for i in range(low, high):
+                number = _fk_entry.unpack_from(
+                    self.__map, start + i * _fk_entry.size)[1]
+                key = self.__key(name, first, number)
+                if key not in self.__deleted and key not in self.__changed:
+                    result.append(
+                        self.__materialize(name, first, number, key))
+        for obj in self.__changed.values():
+            if type(obj) is cls and getattr(obj, fk, None) == value:
+                result.append(obj)
+        return sort_and_page(result, order_by)
+
+    def new(self, obj):
+        """Adds obj to the unsaved changes"""
+        key = '{}.{}'.format(type(obj).__name__, obj.id)
+        self.__remember_undo(key)
+        self.__changed[key] = obj
+        self.__deleted.discard(key)
+        self.__bump(type(obj).__name__)
+
+    def changed(self, obj):
+        """
+        Adds obj to the unsaved changes if it is the object held under its
+        key; BaseModel calls it whenever one of its attributes is assigned
+        """
+        id = obj.__dict__.get('id')
+        if id is None:
+            return
+        key = '{}.{}'.format(type(obj).__name__, id)
+        if (self.__changed.get(key) is obj or
+                self.__cache.get(key) is obj):
+            self.new(obj)
+
+    def delete(self, obj=None):
+        """Marks obj as deleted until the next save()"""
+        if obj is not None:
+            key = '{}.{}'.format(type(obj).__name__, obj.id)
+            self.__remember_undo(key)
+            self.__changed.pop(key, None)
+            self.__cache.pop(key, None)
+            self.__deleted.add(key)
+            self.__bump(type(obj).__name__)
+
+    def after_fork(self):
+        """
+        Nothing to reset in a forked process: the snapshot is mapped read
+        only and the unsaved changes are private to the process
+        """
+
+    def generation(self, cls):
+        """
+        Returns a counter bumped whenever an object of cls is added,
+        updated or deleted, or the snapshot is replaced by another writer
+        """
+        return self.__epoch + self.__generations.get(cls.__name__, 0)
+
+    def __bump(self, name):
+        """Records a change of the objects of the class name"""
+        self.__generations[name] = self.__generations.get(name, 0) + 1
+
+    @contextmanager
+    def transaction(self):
+        """
+        Defers save() until the block exits, then writes one snapshot. If
+        the block raises, the changes it made through new() and delete()
+        are dropped. Nested blocks join the outermost one. The state is
+        kept per thread: other threads' changes are neither deferred nor
+        dropped by the block.
+        """
+        local = self.__local
+        depth = getattr(local, 'depth', 0)
+        local.depth = depth + 1
+        if depth == 0:
+            local.undo = {}
+            local.deferred = False
+            local.saves = self.__saves
+        try:
+            yield self
+        except BaseException:
+            local.depth = depth
+            if depth == 0:
+                self.__rollback()
+            raise
+        local.depth = depth
+        if depth == 0:
+            local.undo = None
+            if local.deferred:
+                local.deferred = False
+                self.save()
+
+    def __remember_undo(self, key):
+        """
+        Records the state of key before its first change in a block: its
+        unsaved object or deletion, else its record in the snapshot
+        """
+        undo = getattr(self.__local, 'undo', None)
+        if undo is None or key in undo:
+            return
+        raw = None
+        if key not in self.__changed and key not in self.__deleted:
+            name, _, id = key.partition('.')
+            location = self.__locate(name, id)
+            if location is not None:
+                raw = self.__raw(*location)
+        undo[key] = (key in self.__changed, self.__changed.get(key),
+                     key in self.__deleted, raw)
+
+    def __rollback(self):
+        """Puts back the state of the keys the block changed"""
+        local = self.__local
+        undo, local.undo = local.undo, None
+        local.deferred = False
+        # Another thread's save() wrote the block's changes: the next
+        # save() must write the state before the block back
+        saved = self.__saves != local.saves
+        for key, (was_changed, obj, was_deleted, raw) in undo.items():
+            name = key.partition('.')[0]
+            # The cached object may have been changed in place
+            self.__cache.pop(key, None)
+            self.__changed.pop(key, None)
+            self.__deleted.discard(key)
+            if was_changed:
+                self.__changed[key] = obj
+            elif was_deleted or (saved and raw is None):
+                self.__deleted.add(key)
+            elif saved:
+                self.__changed[key] = FileStorage.classes()[name](
+                    **json.loads(raw))
+            self.__bump(name)
+
+    def bulk_new(self, objs):
+        """Adds every object of objs to the unsaved changes"""
+        count = 0
+        for obj in objs:
+            self.new(obj)
+            count += 1
+        return count
+
+    def bulk_save(self):
+        """Writes one new snapshot for all the objects of bulk_new()"""
+        self.save()
+
+    def save(self):
+        """Writes a new snapshot with the unsaved changes and maps it"""
+        if getattr(self.__local, 'depth', 0):
+            self.__local.deferred = True
+            return
+
+        def items():
+            for name, table in self.__tables.items():
+                first, count = table['entries']
+                for number in range(count):
+                    key = self.__key(name, first, number)
+                    if key in self.__deleted or key in self.__changed:
+                        continue
+                    raw = self.__raw(first, number)
+                    yield key, raw, json.loads(raw)
+            for key, obj in self.__changed.items():
+                record = obj.to_dict()
+                yield key, json.dumps(record).encode('utf-8'), record
+
+        write_snapshot(MMapStorage.__file_path, items())
+        self.__saves += 1
+        saved = self.__changed
+        self.__changed = {}
+        self.__deleted = set()
+        self.reload()
+        for key, obj in saved.items():
+            self.__remember(key, obj)
+
+    def reload(self):
+        """Maps the snapshot file again; materialized objects are dropped"""
+        if self.__map is not None:
+            self.__map.close()
+        self.__map = None
+        self.__tables = {}
+        self.__cache.clear()
+        self.__signature = self.__stat()
+        try:
+            with open(MMapStorage.__file_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size:
+                    self.__map = mmap.mmap(f.fileno(), 0,
+                                           access=mmap.ACCESS_READ)
+        except FileNotFoundError:
+            if MMapStorage.missing_ok:
+                return
+            warnings.warn("{0} does not exist, the store is empty: build it "
+                          "with python3 -m models.engine.mmap_storage build "
+                          "file.json {0}".format(MMapStorage.__file_path),
+                          stacklevel=2)
+            return
+        if self.__map is None or self.__map[:len(MAGIC)] != MAGIC:
+            raise ValueError("{} is not an indexed hbnb snapshot"
+                             .format(MMapStorage.__file_path))
+        pos = len(MAGIC)
+        (count,) = _u32.unpack_from(self.__map, pos)
+        pos += _u32.size
+        for _ in range(count):
+            name, pos = self.__str(pos)
+            entries = _location.unpack_from(self.__map, pos)
+            pos += _location.size
+            (fk_count,) = _u32.unpack_from(self.__map, pos)
+            pos += _u32.size
+            fks = {}
+            for _ in range(fk_count):
+                fk, pos = self.__str(pos)
+                fks[fk] = _location.unpack_from(self.__map, pos)
+                pos += _location.size
+            self.__tables[name] = {'entries': entries, 'fks': fks}
+
+    def close(self):
+        """Maps the snapshot again only if another writer replaced it"""
+        if self.__stat() != self.__signature:
+            self.reload()
+            self.__epoch += 1
+
+    def __stat(self):
+        """Returns (inode, size, mtime) of the snapshot file, or None"""
+        try:
+            st = os.stat(MMapStorage.__file_path)
+        except FileNotFoundError:
+            return None
+        return st.st_ino, st.st_size, st.st_mtime_ns
+
+    def __str(self, pos):
+        """Reads a length-prefixed string of the header at pos"""
+        (size,) = _u16.unpack_from(self.__map, pos)
+        pos += _u16.size
+        return str(self.__map[pos:pos + size], 'utf-8'), pos + size
+
+    def __entry(self, first, number):
+        """Returns (padded id, offset, length) of an entry"""
+        return _entry.unpack_from(self.__map, first + number * _entry.size)
+
+    def __key(self, name, first, number):
+        """Returns the storage key of an entry"""
+        padded = self.__map[first + number * _entry.size:
+                            first + number * _entry.size + ID_WIDTH]
+        return name + '.' + str(padded.rstrip(b'\0'), 'utf-8')
+
+    def __raw(self, first, number):
+        """Returns the JSON bytes of the record of an entry"""
+        _, offset, length = self.__entry(first, number)
+        return self.__map[offset:offset + length]
+
+    def __bisect(self, start, count, width, target, upper=False):
+        """
+        Returns the first entry number whose fixed-width key is >= target
+        (or > target if upper) among count entries starting at start.
+        """
+        low, high = 0, count
+        while low < high:
+            middle = (low + high) // 2
+            pos = start + middle * width
+            value = self.__map[pos:pos + ID_WIDTH]
+            if value < target or (upper and value == target):
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def __locate(self, name, id):
+        """Returns (first, number) of the snapshot entry of id, or None"""
+        table = self.__tables.get(name)
+        if table is None:
+            return None
+        try:
+            padded = _pad(id)
+        except ValueError:
+            return None
+        first, count = table['entries']
+        number = self.__bisect(first, count, _entry.size, padded)
+        if number < count and self.__entry(first, number)[0] == padded:
+            return first, number
+        return None
+
+    def __materialize(self, name, first, number, key):
+        """Returns the object of an entry, instantiating it on a miss"""
+        obj = self.__cached(key)
+        if obj is None:
+            record = json.loads(self.__raw(first, number))
+            obj = FileStorage.classes()[name](**record)
+            self.__remember(key, obj)
+        return obj
+
+    def __cached(self, key):
+        """Returns the cached object of key, or None"""
+        obj = self.__cache.get(key)
+        if obj is not None:
+            self.__cache.move_to_end(key)
+        return obj
+
+    def __remember(self, key, obj):
+        """Caches obj, evicting the least recently used objects"""
+        self.__cache[key] = obj
+        self.__cache.move_to_end(key)
+        while len(self.__cache) > MMapStorage.__cache_size:
+            self.__cache.popitem(last=False)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 4 or sys.argv[1] != 'build':
+        print("Usage: {} build <file.json> <file.idx>".format(sys.argv[0]))
+        sys.exit(1)
+    build(sys.argv[2], sys.argv[3])
@@ -0,0 +1,77 @@
+#!/usr/bin/python3
+"""
+Module: schema.py
+Author: TheWatcher01
+Date: 2026-10-18
+Description: Versioned schema management for DBStorage. The version of the
+tables the database holds is recorded in the hbnb_schema table by
+init_db(), so starting a process only costs one SELECT (check()) instead
+of the reflection and DDL round trips of Base.metadata.create_all().
+Bump SCHEMA_VERSION whenever the mapped tables change.
+
+Usage: python3 -m models.engine.schema init-db [--drop]
+"""
+
+from sqlalchemy import Column, Integer, MetaData, Table, select
+from sqlalchemy.exc import SQLAlchemyError
+from models.base_model import Base
+import sys
+
+# Version of the tables mapped by the models
+SCHEMA_VERSION = 1
+
+# Kept out of Base.metadata: the version outlives Base.metadata.drop_all()
+_metadata = MetaData()
+schema_table = Table('hbnb_schema', _metadata,
+                     Column('version', Integer, nullable=False))
+
+
+def version(engine):
+    """Returns the schema version of the database, or None if it has none"""
+    try:
+        with engine.connect() as connection:
+            return connection.scalar(select(schema_table.c.version))
+    except SQLAlchemyError:
+        # No hbnb_schema table: the database predates versioning or is empty
+        return None
+
+
+def init_db(engine, drop=False):
+    """
+    Creates the missing tables and records SCHEMA_VERSION. With drop, all
+    the tables are dropped first, data included.
+    """
+    if drop:
+        Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    _metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(schema_table.delete())
+        connection.execute(schema_table.insert(), {'version': SCHEMA_VERSION})
+
+
+def check(engine):
+    """
+    Makes sure the database holds the tables of SCHEMA_VERSION with one
+    SELECT. A database without a version (empty, or created before
+    versioning) is initialized once; any other version raises ValueError,
+    as its tables must be migrated with init-db first.
+    """
+    found = version(engine)
+    if found == SCHEMA_VERSION:
+        return
+    if found is not None:
+        raise ValueError("Database schema version {} found, {} expected: run "
+                         "python3 -m models.engine.schema init-db"
+                         .format(found, SCHEMA_VERSION))
+    init_db(engine)
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] != ['init-db'] or sys.argv[2:] not in ([], ['--drop']):
+        print("Usage: {} init-db [--drop]".format(sys.argv[0]))
+        sys.exit(1)
+    from models.engine.db_storage import DBStorage
+    engine = DBStorage.create_engine(DBStorage.url())
+    init_db(engine, drop='--drop' in sys.argv)
+    print("Schema version {}".format(SCHEMA_VERSION))
@@ -8,9 +8,10 @@ mapping it to a database table with attributes for location, accommodation
 details, and associated amenities in the HBNB project.
 """
 
-from sqlalchemy import Column, String, Integer, Float, ForeignKey, Table
-from models.base_model import Base, BaseModel
-from sqlalchemy.orm import relationship
+from models.base_model import Base, BaseModel, relationship
+from models.base_model import Column, String, Integer, Float, ForeignKey
+from models.base_model import Table
+from os import getenv
 
 # Table d'association pour la relation many-to-many entre Place et Amenity
 place_amenity = Table(
@@ -38,6 +39,38 @@ class Place(BaseModel, Base):
     longitude = Column(Float, nullable=True)
     amenity_ids = []  # Pour compatibilité avec FileStorage
 
-    # Relation SQLAlchemy many-to-many avec Amenity
-    amenities = relationship(
-        "Amenity", secondary=place_amenity, back_populates="place_amenities")
+    if getenv('HBNB_TYPE_STORAGE') == 'db':
+        # Relation SQLAlchemy many-to-many avec Amenity, chargée en une seule
+        # requête SELECT ... IN pour tous les lieux d'une page
+        amenities = relationship(
+            "Amenity", secondary=place_amenity,
+            back_populates="place_amenities", lazy="selectin")
+        reviews = relationship("Review", backref="place",
+                               cascade="all, delete")
+    else:
+        @property
+        def reviews(self):
+            """Retourne les objets Review liés à ce Place"""
+            from models import storage
+            from models.review import Review
+            return storage.related(Review, 'place_id', self.id)
+
+        @property
+        def amenities(self):
+            """Retourne les objets Amenity dont l'id est dans amenity_ids"""
+            from models import storage
+            from models.amenity import Amenity
+            amenities = (storage.get(Amenity, amenity_id)
+                         for amenity_id in self.amenity_ids)
+            return [amenity for amenity in amenities if amenity is not None]
+
+        @amenities.setter
+        def amenities(self, obj):
+            """Ajoute l'id d'un objet Amenity à amenity_ids"""
+            from models import storage
+            from models.amenity import Amenity
+            if isinstance(obj, Amenity) and obj.id not in self.amenity_ids:
+                # Nouvelle liste : amenity_ids est partagée par la classe
+                self.amenity_ids = self.amenity_ids + [obj.id]
+                # Marque le lieu comme modifié pour le prochain save()
+                storage.new(self)
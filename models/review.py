@@ -8,9 +8,8 @@ BaseModel and Base. Represents a review with attributes including place_id,
 user_id, and text, mapped to a database table.
 """
 
-from sqlalchemy import Column, String, ForeignKey
+from models.base_model import Column, String, ForeignKey
 from models.base_model import Base, BaseModel
-from sqlalchemy.orm import relationship
 
 
 class Review(BaseModel, Base):
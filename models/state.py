@@ -7,9 +7,8 @@ Description: This module defines the State class for the HBNB project. The
 State class represents states with a 'name' attribute and manages cities
 through a relationship or property.
 """
-from models.base_model import BaseModel, Base
-from sqlalchemy.orm import relationship
-from sqlalchemy import Column, String
+from models.base_model import BaseModel, Base, relationship
+from models.base_model import Column, String
 from models.city import City
 from os import getenv
 
@@ -22,14 +21,15 @@ class State(BaseModel, Base):
     __tablename__ = 'states'
 
     id = Column(String(60), primary_key=True, nullable=False)
-    name = Column(String(128), nullable=False)
+    name = Column(String(128), nullable=False, index=True)
 
     if getenv('HBNB_TYPE_STORAGE') == 'db':
         cities = relationship('City', backref='state',
-                              cascade='all, delete')
+                              cascade='all, delete', lazy='selectin',
+                              order_by='City.name')
     else:
         @property
         def cities(self):
+            """Returns the City objects linked to this State, by name"""
             from models import storage
-            return [city for city in storage.all(City)
-                    .values() if city.state_id == self.id]
+            return storage.related(City, 'state_id', self.id, 'name')
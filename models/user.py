@@ -7,9 +7,9 @@ Description: Defines the User class in the HBNB project, inheriting from
 BaseModel and Base. It represents a user with attributes like email,
 password, first_name, and last_name, mapped to a database table.
 """
-from models.base_model import Base, BaseModel
-from sqlalchemy.orm import relationship
-from sqlalchemy import Column, String
+from models.base_model import Base, BaseModel, relationship
+from models.base_model import Column, String
+from os import getenv
 
 
 class User(BaseModel, Base):
@@ -23,5 +23,23 @@ class User(BaseModel, Base):
     password = Column(String(128), nullable=False)
     first_name = Column(String(128), nullable=True)
     last_name = Column(String(128), nullable=True)
-    reviews = relationship("Review", backref="user", cascade="all, delete")
-    places = relationship("Place", backref="user", cascade="all, delete")
+
+    if getenv('HBNB_TYPE_STORAGE') == 'db':
+        reviews = relationship("Review", backref="user",
+                               cascade="all, delete", lazy="selectin")
+        places = relationship("Place", backref="user",
+                              cascade="all, delete", lazy="selectin")
+    else:
+        @property
+        def reviews(self):
+            """Returns the Review objects written by this User"""
+            from models import storage
+            from models.review import Review
+            return storage.related(Review, 'user_id', self.id)
+
+        @property
+        def places(self):
+            """Returns the Place objects owned by this User"""
+            from models import storage
+            from models.place import Place
+            return storage.related(Place, 'user_id', self.id)
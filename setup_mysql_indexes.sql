@@ -0,0 +1,35 @@
+-- Add the indexes on the 'name' columns that the views order by to an
+-- existing hbnb database (tables created by DBStorage before they existed).
+-- Run it against the database to upgrade, e.g.:
+--   cat setup_mysql_indexes.sql | mysql -uroot -p hbnb_dev_db
+-- Indexes that already exist are left as they are, so it can be run again.
+
+-- Create index 'ix_states_name' on 'states.name' if it is missing
+SET @stmt = IF((SELECT COUNT(*) FROM information_schema.statistics
+                WHERE table_schema = DATABASE() AND table_name = 'states'
+                AND index_name = 'ix_states_name') = 0,
+               'CREATE INDEX ix_states_name ON states (name)',
+               'DO 0');
+PREPARE stmt FROM @stmt;
+EXECUTE stmt;
+DEALLOCATE PREPARE stmt;
+
+-- Create index 'ix_cities_name' on 'cities.name' if it is missing
+SET @stmt = IF((SELECT COUNT(*) FROM information_schema.statistics
+                WHERE table_schema = DATABASE() AND table_name = 'cities'
+                AND index_name = 'ix_cities_name') = 0,
+               'CREATE INDEX ix_cities_name ON cities (name)',
+               'DO 0');
+PREPARE stmt FROM @stmt;
+EXECUTE stmt;
+DEALLOCATE PREPARE stmt;
+
+-- Create index 'ix_amenities_name' on 'amenities.name' if it is missing
+SET @stmt = IF((SELECT COUNT(*) FROM information_schema.statistics
+                WHERE table_schema = DATABASE() AND table_name = 'amenities'
+                AND index_name = 'ix_amenities_name') = 0,
+               'CREATE INDEX ix_amenities_name ON amenities (name)',
+               'DO 0');
+PREPARE stmt FROM @stmt;
+EXECUTE stmt;
+DEALLOCATE PREPARE stmt;
@@ -9,9 +9,18 @@ coverage and practices.
 from unittest.mock import patch, MagicMock
 from console import HBNBCommand
 from io import StringIO
+import subprocess
 import unittest
+import sys
+import os
+import tempfile
 import re
 
+try:
+    import sqlalchemy
+except ImportError:
+    sqlalchemy = None
+
 
 class TestDoCreate(unittest.TestCase):
     """Test suite for the 'create' command in the HBNB console."""
@@ -82,5 +91,139 @@ class TestDoCreate(unittest.TestCase):
                       self.mock_stdout.getvalue())
 
 
+class TestDoBulkCreate(unittest.TestCase):
+    """Test suite for the 'bulk_create' command in the HBNB console."""
+
+    def setUp(self):
+        """Set up common test resources and mock objects."""
+        self.mock_stdout = patch('sys.stdout',
+                                 new_callable=StringIO).start()
+        self.mock_bulk_new = patch(
+            'console.storage.bulk_new',
+            MagicMock(side_effect=lambda objs: len(objs))).start()
+        self.mock_bulk_save = patch(
+            'console.storage.bulk_save', MagicMock()).start()
+
+    def tearDown(self):
+        """Clean up resources and stop all patches."""
+        patch.stopall()
+
+    def bulk_create(self, args, lines):
+        """Runs bulk_create with lines as its standard input."""
+        HBNBCommand(stdin=StringIO(lines)).do_bulk_create(args)
+
+    def test_bulk_create_class_does_not_exist(self):
+        """Ensure error message for non-existent class."""
+        self.bulk_create('NonExistentClass', 'name="a"\n')
+        self.assertEqual("** class doesn't exist **\n",
+                         self.mock_stdout.getvalue())
+
+    def test_bulk_create_until_blank_line(self):
+        """One object per line, typed like create, up to a blank line."""
+        self.bulk_create('Place', 'name="Loft" number_rooms=2\n'
+                         'name="Studio" latitude=1.5\n\nname="Skipped"\n')
+        self.assertEqual(self.mock_stdout.getvalue(), "2\n")
+        places = self.mock_bulk_new.call_args[0][0]
+        self.assertEqual([p.name for p in places], ["Loft", "Studio"])
+        self.assertEqual(places[0].number_rooms, 2)
+        self.assertEqual(places[1].latitude, 1.5)
+        self.mock_bulk_save.assert_called_once_with()
+
+    def test_bulk_create_in_batches(self):
+        """Objects reach storage in batches of bulk_batch."""
+        with patch.object(HBNBCommand, 'bulk_batch', 2):
+            self.bulk_create('State', 'name="A"\nname="B"\nname="C"')
+        self.assertEqual(self.mock_stdout.getvalue(), "3\n")
+        self.assertEqual(self.mock_bulk_save.call_count, 2)
+
+
+class TestDoCount(unittest.TestCase):
+    """Test suite for the 'count' command in the HBNB console."""
+
+    def setUp(self):
+        """Stores one BaseModel, two States and one City."""
+        from models.base_model import BaseModel
+        from models.state import State
+        from models.city import City
+        from models import storage
+        self.storage = storage
+        self.objs = [BaseModel(), State(name="A"), State(name="B"),
+                     City(name="C")]
+        for obj in self.objs:
+            storage.new(obj)
+
+    def tearDown(self):
+        """Deletes the objects."""
+        for obj in self.objs:
+            self.storage.delete(obj)
+
+    def count(self, line):
+        """Returns what the console prints for line."""
+        console = HBNBCommand()
+        with patch('sys.stdout', new_callable=StringIO) as stdout:
+            console.onecmd(console.precmd(line))
+        return stdout.getvalue()
+
+    def test_count_exact_class(self):
+        """Subclasses are not counted with their base class."""
+        from models.base_model import BaseModel
+        states = sum(1 for key in self.storage.all() if
+                     key.startswith('State.'))
+        bases = sum(1 for key in self.storage.all() if
+                    key.startswith('BaseModel.'))
+        self.assertEqual(self.count('count State'), '{}\n'.format(states))
+        self.assertEqual(self.count('count BaseModel'),
+                         '{}\n'.format(bases))
+        self.assertEqual(self.count('BaseModel.count()'),
+                         '{}\n'.format(bases))
+        self.assertLess(bases, self.storage.count(BaseModel))
+        self.assertEqual(self.count('count Planet'), '0\n')
+
+
+class TestStartup(unittest.TestCase):
+    """Guards the import time of the console in file mode."""
+
+    def import_times(self, code):
+        """
+        Returns {module: cumulative seconds} imported by running code in
+        an empty directory, so no file.json is loaded
+        """
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        env = dict(os.environ, PYTHONPATH=root)
+        env.pop('HBNB_TYPE_STORAGE', None)
+        with tempfile.TemporaryDirectory() as directory:
+            stderr = subprocess.run([sys.executable, '-X', 'importtime',
+                                     '-c', code], env=env, cwd=directory,
+                                    capture_output=True, text=True,
+                                    check=True).stderr
+        times = {}
+        for line in stderr.splitlines():
+            match = re.match(r'import time:\s+\d+ \|\s+(\d+) \| (\s*)(\S+)',
+                             line)
+            if match:
+                times[match.group(3)] = int(match.group(1)) / 1e6
+        return times
+
+    def test_console_imports_no_sqlalchemy(self):
+        """The console imports no SQLAlchemy in file mode."""
+        times = self.import_times('import console')
+        self.assertFalse([name for name in times
+                          if name.startswith('sqlalchemy')])
+
+    @unittest.skipIf(sqlalchemy is None, "SQLAlchemy is not installed")
+    def test_console_import_budget(self):
+        """Importing the console costs less than half of SQLAlchemy's."""
+        console = self.import_times('import console')['console']
+        orm = self.import_times('import sqlalchemy.orm')['sqlalchemy.orm']
+        self.assertLess(console, orm / 2)
+
+    def test_models_import_is_lazy(self):
+        """Importing the models does not create the storage engine."""
+        times = self.import_times('import models.state, models.place')
+        self.assertNotIn('models.engine.file_storage', times)
+        times = self.import_times('from models import storage')
+        self.assertIn('models.engine.file_storage', times)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,112 @@
+#!/usr/bin/python3
+"""
+File: test_async_db_storage.py
+Author: TheWatcher01
+Date: 2026-10-18
+Description: Unit tests for AsyncDBStorage and the ASGI application of
+web_flask, on a SQLite file through aiosqlite. The models are only mapped
+in DB mode, so the scenario runs in a fresh interpreter.
+"""
+
+import subprocess
+import tempfile
+import unittest
+import json
+import sys
+import os
+
+try:
+    import aiosqlite
+    import greenlet
+    import sqlalchemy
+except ImportError:
+    aiosqlite = None
+
+# Writes a State with two cities through DBStorage, then reads them back
+# with AsyncDBStorage and through the ASGI application
+SCENARIO = '''
+import asyncio, json
+from models import storage
+from models.state import State
+from models.city import City
+from models.engine.async_db_storage import AsyncDBStorage
+from web_flask.asgi import ReadApp
+state = State(name="Oregon")
+storage.new(state)
+for name in ("Salem", "Bend"):
+    storage.new(City(name=name, state_id=state.id))
+storage.save()
+
+
+async def main():
+    db = AsyncDBStorage()
+    app = ReadApp(db)
+    pages = {}
+    for path in ("/states_list", "/states/" + state.id, "/hbnb_filters",
+                 "/nowhere"):
+        messages = []
+
+        async def receive():
+            return {"type": "http.request", "body": b""}
+
+        async def send(message):
+            messages.append(message)
+
+        await app({"type": "http", "method": "GET", "path": path,
+                   "query_string": b"", "headers": []}, receive, send)
+        pages[path] = [messages[0]["status"],
+                       messages[1]["body"].decode()]
+    found = await db.get(State, state.id, load=("cities",))
+    result = {
+        "count": await db.count(),
+        "states": len(await db.all(State)),
+        "cities": [c.name for c in await db.filter(
+            City, order_by="name", state_id=state.id)],
+        "loaded": sorted(c.name for c in found.cities),
+        "pages": pages,
+    }
+    await db.close()
+    return result
+
+print(json.dumps(asyncio.run(main())))
+'''
+
+
+@unittest.skipIf(aiosqlite is None, "aiosqlite or greenlet is not installed")
+class TestAsyncDBStorage(unittest.TestCase):
+    """Tests the async read path on a SQLite file database"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Runs SCENARIO once in DB mode on a new database"""
+        with tempfile.TemporaryDirectory() as directory:
+            url = 'sqlite:///' + os.path.join(directory, 'hbnb.db')
+            env = dict(os.environ, HBNB_TYPE_STORAGE='db', HBNB_DB_URL=url)
+            output = subprocess.run([sys.executable, '-c', SCENARIO],
+                                    env=env, capture_output=True, text=True,
+                                    check=True).stdout
+        cls.result = json.loads(output.splitlines()[-1])
+
+    def test_reads(self):
+        """all, get, count and filter read what DBStorage wrote"""
+        self.assertEqual(self.result['count'], 3)
+        self.assertEqual(self.result['states'], 1)
+        self.assertEqual(self.result['cities'], ['Bend', 'Salem'])
+        self.assertEqual(self.result['loaded'], ['Bend', 'Salem'])
+
+    def test_pages(self):
+        """The ASGI application renders the pages, 404 for other paths"""
+        pages = self.result['pages']
+        for path, (status, body) in pages.items():
+            if path == '/nowhere':
+                self.assertEqual(status, 404)
+                continue
+            self.assertEqual(status, 200, path)
+            self.assertIn('Oregon', body, path)
+        state_page = [body for path, (_, body) in pages.items()
+                      if path.startswith('/states/')][0]
+        self.assertIn('Salem', state_page)
+
+
+if __name__ == "__main__":
+    unittest.main()
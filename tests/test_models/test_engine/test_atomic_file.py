@@ -0,0 +1,92 @@
+#!/usr/bin/python3
+"""
+File: test_atomic_file.py
+Author: TheWatcher01
+Date: 2026-10-18
+Description: Unit tests for atomic file replacement and grouped fsync().
+"""
+
+from models.engine.atomic_file import GroupCommit, atomic_write
+from unittest.mock import patch
+import unittest
+import os
+
+
+class TestAtomicWrite(unittest.TestCase):
+    """Tests for atomic_write()"""
+
+    path = 'test_atomic.json'
+
+    def tearDown(self):
+        """Removes the target file"""
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def leftovers(self):
+        """Returns the temporary files left next to the target"""
+        return [name for name in os.listdir('.')
+                if name.startswith('.' + self.path)]
+
+    def test_replaces_file(self):
+        """The new content replaces the old one"""
+        with open(self.path, 'w') as f:
+            f.write('old')
+        with atomic_write(self.path) as f:
+            f.write('new')
+        with open(self.path) as f:
+            self.assertEqual(f.read(), 'new')
+        self.assertEqual(self.leftovers(), [])
+
+    def test_failure_keeps_old_file(self):
+        """An error while writing leaves the old file untouched"""
+        with open(self.path, 'w') as f:
+            f.write('old')
+        with self.assertRaises(RuntimeError):
+            with atomic_write(self.path) as f:
+                f.write('half')
+                raise RuntimeError
+        with open(self.path) as f:
+            self.assertEqual(f.read(), 'old')
+        self.assertEqual(self.leftovers(), [])
+
+
+class TestGroupCommit(unittest.TestCase):
+    """Tests for GroupCommit"""
+
+    path = 'test_group.json'
+
+    def tearDown(self):
+        """Removes the target file"""
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def save(self, commits, text):
+        """Replaces the target through commits"""
+        with commits.write(self.path) as f:
+            f.write(text)
+
+    def test_window_batches_fsync(self):
+        """Saves within a window share one deferred fsync"""
+        commits = GroupCommit(3600)
+        with patch('models.engine.atomic_file.os.fsync') as fsync:
+            self.save(commits, 'first')
+            first = fsync.call_count
+            for i in range(5):
+                self.save(commits, str(i))
+            self.assertEqual(fsync.call_count, first)
+            commits.flush()
+            self.assertEqual(fsync.call_count, first + 2)
+        with open(self.path) as f:
+            self.assertEqual(f.read(), '4')
+
+    def test_no_window_syncs_every_save(self):
+        """Without a window every save is synced at once"""
+        commits = GroupCommit(0)
+        with patch('models.engine.atomic_file.os.fsync') as fsync:
+            self.save(commits, 'first')
+            self.save(commits, 'second')
+        self.assertEqual(fsync.call_count, 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
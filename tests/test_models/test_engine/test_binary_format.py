@@ -0,0 +1,93 @@
+#!/usr/bin/python3
+"""
+File: test_binary_format.py
+Author: TheWatcher01
+Date: 2026-10-18
+Description: Unit tests for the binary FileStorage snapshot format.
+"""
+
+from models.engine import binary_format
+from datetime import datetime
+from io import BytesIO
+import unittest
+import json
+import os
+
+
+class TestBinaryFormat(unittest.TestCase):
+    """Tests for binary_format dump(), load() and the converters"""
+
+    records = {
+        "Place.1": {"__class__": "Place", "id": "1",
+                    "created_at": "2017-03-25T02:17:06",
+                    "updated_at": "2024-04-09T13:01:46.359274",
+                    "name": "Loft été", "number_rooms": 0,
+                    "latitude": -122.431297, "description": None,
+                    "amenity_ids": ["a", "b"], "big": 1 << 70},
+        "Place.2": {"__class__": "Place", "id": "2",
+                    "created_at": "2017-03-25 02:17:06",
+                    "updated_at": "2017-03-25T02:17:06+00:00"},
+        "State.3": {"__class__": "State", "id": "3", "name": "Texas",
+                    "created_at": "2024-04-09T13:01:46.359184",
+                    "updated_at": "2024-04-09T13:01:46.359274"},
+    }
+
+    def round_trip(self, records):
+        """Returns the records read back from their binary dump"""
+        f = BytesIO()
+        binary_format.dump(records, f)
+        f.seek(0)
+        return dict(binary_format.load(f))
+
+    def test_round_trip(self):
+        """Every value and missing column comes back unchanged"""
+        loaded = self.round_trip(self.records)
+        self.assertEqual(loaded["Place.1"]["created_at"],
+                         datetime(2017, 3, 25, 2, 17, 6))
+        for key, record in self.records.items():
+            for column, value in loaded[key].items():
+                if isinstance(value, datetime):
+                    loaded[key][column] = value.isoformat()
+            self.assertEqual(loaded[key], record)
+
+    def test_non_iso_timestamps_stay_strings(self):
+        """Timestamps isoformat() would not give back are kept as text"""
+        loaded = self.round_trip(self.records)
+        self.assertEqual(loaded["Place.2"]["created_at"],
+                         "2017-03-25 02:17:06")
+        self.assertEqual(loaded["Place.2"]["updated_at"],
+                         "2017-03-25T02:17:06+00:00")
+
+    def test_empty(self):
+        """An empty store round-trips"""
+        self.assertEqual(self.round_trip({}), {})
+
+    def test_not_a_snapshot(self):
+        """Garbage and truncated input raise ValueError"""
+        with self.assertRaises(ValueError):
+            list(binary_format.load(BytesIO(b'{"a": 1}')))
+        f = BytesIO()
+        binary_format.dump(self.records, f)
+        with self.assertRaises(ValueError):
+            list(binary_format.load(BytesIO(f.getvalue()[:-3])))
+
+    def test_converters(self):
+        """JSON -> binary -> JSON gives the original snapshot back"""
+        paths = ('test_src.json', 'test.hbnb', 'test_dst.json')
+        try:
+            with open(paths[0], 'w') as f:
+                json.dump(self.records, f)
+            binary_format.to_binary(paths[0], paths[1])
+            binary_format.to_json(paths[1], paths[2])
+            with open(paths[2]) as f:
+                self.assertEqual(json.load(f), self.records)
+            self.assertLess(os.path.getsize(paths[1]),
+                            os.path.getsize(paths[0]))
+        finally:
+            for path in paths:
+                if os.path.exists(path):
+                    os.remove(path)
+
+
+if __name__ == "__main__":
+    unittest.main()
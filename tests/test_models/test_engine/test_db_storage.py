@@ -9,6 +9,7 @@ Description: Unit tests for db_storage.py with a real database connection.
 from models.state import State
 from models.city import City
 from models import storage
+from sqlalchemy import event
 from uuid import uuid4
 import unittest
 import MySQLdb
@@ -104,6 +105,40 @@ class TestDBStorageMySQLDirect(unittest.TestCase):
         self.assertIsNotNone(reloaded_state)
         self.assertEqual(reloaded_state.name, new_state.name)
 
+    def test_eager_loading_query_count(self):
+        """Rendering states with their cities costs two queries."""
+        for _ in range(3):
+            state = State(name=f"TestState_{uuid4()}")
+            storage.new(state)
+            storage.new(City(name=f"TestCity_{uuid4()}", state_id=state.id))
+        storage.save()
+        storage.close()
+        queries = []
+        engine = storage._DBStorage__engine
+
+        def listener(conn, cursor, statement, *args):
+            queries.append(statement)
+        event.listen(engine, "before_cursor_execute", listener)
+        try:
+            for state in storage.all(State, load=('cities',)).values():
+                [city.name for city in state.cities]
+        finally:
+            event.remove(engine, "before_cursor_execute", listener)
+        self.assertEqual(len(queries), 2)
+
+    def test_pool_stats(self):
+        """pool_stats() counts checkouts and connections in use."""
+        before = storage.pool_stats()
+        connection = storage._DBStorage__engine.connect()
+        try:
+            stats = storage.pool_stats()
+            self.assertEqual(stats['checked_out'],
+                             before['checked_out'] + 1)
+            self.assertEqual(stats['checkouts'], before['checkouts'] + 1)
+            self.assertGreaterEqual(stats['wait_time'], before['wait_time'])
+        finally:
+            connection.close()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,187 @@
+#!/usr/bin/python3
+"""
+File: test_db_storage_sqlite.py
+Author: TheWatcher01
+Date: 2026-10-18
+Description: Unit tests for DBStorage on SQLite (HBNB_DB_URL). The models
+are only mapped to tables when HBNB_TYPE_STORAGE is 'db' at import time,
+so each test runs its scenario in a fresh interpreter.
+"""
+
+import subprocess
+import tempfile
+import unittest
+import sqlite3
+import json
+import sys
+import os
+
+try:
+    import sqlalchemy
+except ImportError:
+    sqlalchemy = None
+
+# Creates a small graph of objects, then prints what is read back from a
+# new session, in another thread: through a second storage instance on the
+# same URL for a file database, through the same one for a memory database
+SCENARIO = '''
+import json, os, threading
+from sqlalchemy import event
+from models import storage
+from models.engine.db_storage import DBStorage
+from models.amenity import Amenity
+from models.place import Place
+from models.state import State
+from models.city import City
+from models.user import User
+state = State(name="California")
+city = City(name="San Francisco", state_id=state.id)
+user = User(email="a@b.c", password="pwd")
+place = Place(name="Loft", city_id=city.id, user_id=user.id)
+wifi = Amenity(name="Wifi")
+place.amenities.append(wifi)
+generation = storage.generation(State)
+for obj in (state, city, user, place, wifi):
+    storage.new(obj)
+storage.save()
+generation = storage.generation(State) - generation
+storage.close()
+other = storage
+if os.environ["HBNB_DB_URL"] != "sqlite://":
+    other = DBStorage()
+    other.reload()
+found = []
+thread = threading.Thread(
+    target=lambda: found.append(other.get(Place, place.id)))
+thread.start()
+thread.join()
+engine = other._DBStorage__engine
+with engine.connect() as connection:
+    pragmas = {name: connection.exec_driver_sql(
+        "PRAGMA " + name).scalar() for name in
+        ("journal_mode", "synchronous", "foreign_keys")}
+other.close()
+queries = []
+
+
+def listener(*args):
+    queries.append(args[2])
+
+
+event.listen(engine, "before_cursor_execute", listener)
+other.all(State)
+event.remove(engine, "before_cursor_execute", listener)
+print(json.dumps({
+    "count": other.count(),
+    "cities": [c.name for c in other.get(State, state.id).cities],
+    "amenities": [a.name for a in found[0].amenities],
+    "pragmas": pragmas,
+    "pool": other.pool_stats()["size"],
+    "generation": generation,
+    "record": other.record(found[0]),
+    "queries": len(queries),
+}))
+'''
+
+# Queues a State for bulk_save() in a transaction that fails, while another
+# thread bulk saves its own State, then prints the names of the States
+BULK = '''
+import json, threading
+from models import storage
+from models.state import State
+
+
+def save_kept():
+    storage.bulk_new([State(name="Kept")])
+    storage.bulk_save()
+
+
+try:
+    with storage.transaction():
+        storage.bulk_new([State(name="Undone")])
+        thread = threading.Thread(target=save_kept)
+        thread.start()
+        thread.join()
+        raise ValueError
+except ValueError:
+    pass
+print(json.dumps(sorted(s.name for s in storage.all(State).values())))
+'''
+
+
+@unittest.skipIf(sqlalchemy is None, "SQLAlchemy is not installed")
+class TestDBStorageSQLite(unittest.TestCase):
+    """Tests DBStorage on SQLite file and memory databases"""
+
+    def run_db_mode(self, url, *args):
+        """Runs python3 with args in DB mode on url and returns its stdout"""
+        env = dict(os.environ, HBNB_TYPE_STORAGE='db', HBNB_DB_URL=url)
+        return subprocess.run([sys.executable] + list(args), env=env,
+                              capture_output=True, text=True,
+                              check=True).stdout
+
+    def run_scenario(self, url):
+        """Runs SCENARIO in DB mode on url and returns its output"""
+        output = self.run_db_mode(url, '-c', SCENARIO)
+        return json.loads(output.splitlines()[-1])
+
+    def test_file_database(self):
+        """A file database is shared by instances and runs in WAL mode"""
+        with tempfile.TemporaryDirectory() as directory:
+            url = 'sqlite:///' + os.path.join(directory, 'hbnb.db')
+            result = self.run_scenario(url)
+        self.assertEqual(result['count'], 5)
+        self.assertEqual(result['cities'], ['San Francisco'])
+        self.assertEqual(result['amenities'], ['Wifi'])
+        self.assertEqual(result['pragmas'], {'journal_mode': 'wal',
+                                             'synchronous': 1,
+                                             'foreign_keys': 1})
+        self.assertEqual(result['pool'], 5)
+        self.assertGreater(result['generation'], 0)
+        self.assertEqual(result['record']['__class__'], 'Place')
+        self.assertEqual(result['record']['name'], 'Loft')
+        self.assertNotIn('amenities', result['record'])
+        # States and their cities: the defaults do not reach the places
+        self.assertEqual(result['queries'], 2)
+
+    def test_memory_database(self):
+        """A memory database is one connection shared by every thread"""
+        result = self.run_scenario('sqlite://')
+        self.assertEqual(result['count'], 5)
+        self.assertEqual(result['amenities'], ['Wifi'])
+        self.assertEqual(result['pragmas']['journal_mode'], 'memory')
+        self.assertEqual(result['pool'], 1)
+
+    def test_bulk_queue_is_per_thread(self):
+        """bulk_save() and a rollback only touch their thread's queue"""
+        with tempfile.TemporaryDirectory() as directory:
+            url = 'sqlite:///' + os.path.join(directory, 'hbnb.db')
+            output = self.run_db_mode(url, '-c', BULK)
+        self.assertEqual(json.loads(output.splitlines()[-1]), ['Kept'])
+
+    def test_schema_version(self):
+        """Startup checks the schema version, init-db resets the tables"""
+        from models.engine.schema import SCHEMA_VERSION
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'hbnb.db')
+            self.run_scenario('sqlite:///' + path)
+            with sqlite3.connect(path) as connection:
+                self.assertEqual(connection.execute(
+                    'SELECT version FROM hbnb_schema').fetchall(),
+                    [(SCHEMA_VERSION,)])
+                connection.execute('UPDATE hbnb_schema SET version = 0')
+            output = self.run_db_mode('sqlite:///' + path, '-c',
+                                      'from models import storage')
+            self.assertIn('version 0 found', output)
+            self.run_db_mode('sqlite:///' + path, '-m',
+                             'models.engine.schema', 'init-db', '--drop')
+            with sqlite3.connect(path) as connection:
+                self.assertEqual(connection.execute(
+                    'SELECT version FROM hbnb_schema').fetchall(),
+                    [(SCHEMA_VERSION,)])
+                self.assertEqual(connection.execute(
+                    'SELECT COUNT(*) FROM states').fetchone(), (0,))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,158 @@
+#!/usr/bin/python3
+"""
+File: test_dump_loader.py
+Author: TheWatcher01
+Date: 2026-10-18
+Description: Unit tests for the streaming SQL dump loader.
+"""
+
+from models.engine.dump_loader import DumpReader, load
+from models.engine.file_storage import FileStorage
+from models.amenity import Amenity
+from models.state import State
+from models.place import Place
+from models.city import City
+from models import storage
+import subprocess
+import tempfile
+import unittest
+import sys
+import os
+
+DUMP = """-- MySQL dump
+CREATE TABLE `states` (
+  `id` varchar(60) NOT NULL,
+  `created_at` datetime NOT NULL DEFAULT CURRENT_TIMESTAMP,
+  `updated_at` datetime NOT NULL DEFAULT CURRENT_TIMESTAMP,
+  `name` varchar(128) NOT NULL,
+  PRIMARY KEY (`id`)
+) ENGINE=InnoDB DEFAULT CHARSET=latin1;
+INSERT INTO `states` VALUES ('s1','2017-03-25 02:17:06',\
+'2017-03-25 02:17:06','Hawai\\'i'),('s2','2017-03-25 02:17:06',\
+'2017-03-25 02:17:06','New ''York''');
+CREATE TABLE `cities` (
+  `id` varchar(60) NOT NULL,
+  `created_at` datetime NOT NULL DEFAULT CURRENT_TIMESTAMP,
+  `updated_at` datetime NOT NULL DEFAULT CURRENT_TIMESTAMP,
+  `name` varchar(128) NOT NULL,
+  `state_id` varchar(60) NOT NULL
+) ENGINE=InnoDB DEFAULT CHARSET=latin1;
+INSERT INTO `cities` VALUES ('c1','2017-03-25 02:17:06',\
+'2017-03-25 02:17:06','Hilo (Big Island)','s1');
+CREATE TABLE `place_amenity` (
+  `place_id` varchar(60) NOT NULL,
+  `amenity_id` varchar(60) NOT NULL
+) ENGINE=InnoDB DEFAULT CHARSET=latin1;
+INSERT INTO `place_amenity` VALUES ('p1','a1'),('p1','a2');
+CREATE TABLE `places` (
+  `id` varchar(60) NOT NULL,
+  `created_at` datetime NOT NULL DEFAULT CURRENT_TIMESTAMP,
+  `updated_at` datetime NOT NULL DEFAULT CURRENT_TIMESTAMP,
+  `city_id` varchar(60) NOT NULL,
+  `user_id` varchar(60) NOT NULL,
+  `name` varchar(128) NOT NULL,
+  `description` varchar(1024) DEFAULT NULL,
+  `number_rooms` int(11) NOT NULL DEFAULT '0',
+  `latitude` float DEFAULT NULL
+) ENGINE=InnoDB DEFAULT CHARSET=latin1;
+INSERT INTO `places` VALUES ('p1','2017-03-25 02:17:06',\
+'2017-03-25 02:17:06','c1','u1','Loft','Two\\nlines, \\"quoted\\"',3,-1.5e-2);
+INSERT INTO `places` VALUES ('p2','2017-03-25 02:17:06',\
+'2017-03-25 02:17:06','c1','u1','Hut',NULL,0,NULL);
+CREATE TABLE `amenities` (
+  `id` varchar(60) NOT NULL,
+  `created_at` datetime NOT NULL DEFAULT CURRENT_TIMESTAMP,
+  `updated_at` datetime NOT NULL DEFAULT CURRENT_TIMESTAMP,
+  `name` varchar(128) NOT NULL
+) ENGINE=InnoDB DEFAULT CHARSET=latin1;
+INSERT INTO `amenities` VALUES ('a1','2017-03-25 02:17:06',\
+'2017-03-25 02:17:06','Wifi'),('a2','2017-03-25 02:17:06',\
+'2017-03-25 02:17:06','Café');
+"""
+
+
+class TestDumpLoader(unittest.TestCase):
+    """Tests for DumpReader and load()"""
+
+    path = 'test_dump.sql'
+
+    def setUp(self):
+        """Writes the dump and empties storage"""
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write(DUMP)
+        FileStorage._FileStorage__objects.clear()
+        FileStorage._FileStorage__dirty.clear()
+        FileStorage._FileStorage__records.clear()
+
+    def tearDown(self):
+        """Removes the dump and the storage files"""
+        for path in (self.path, 'file.json', 'file.json.lock'):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def test_rows(self):
+        """Values are unescaped and typed, whatever the chunk size"""
+        for chunk_size in (3, 1 << 16):
+            reader = DumpReader(self.path, chunk_size)
+            self.assertEqual(reader.columns['places'][-3:],
+                             ['description', 'number_rooms', 'latitude'])
+            states = list(reader.rows('states'))
+            self.assertEqual([row[3] for row in states],
+                             ["Hawai'i", "New 'York'"])
+            places = list(reader.rows('places'))
+            self.assertEqual(places[0][6:], ('Two\nlines, "quoted"', 3,
+                                             -0.015))
+            self.assertEqual(places[1][6:], (None, 0, None))
+            self.assertEqual(list(reader.rows('cities'))[0][3],
+                             "Hilo (Big Island)")
+            self.assertEqual(list(reader.rows('amenities'))[1][3], "Café")
+
+    def test_load_into_file_storage(self):
+        """Every row becomes an object, place_amenity an amenity_ids entry"""
+        counts = load(self.path, storage, batch_size=1)
+        self.assertEqual(counts, {'states': 2, 'cities': 1,
+                                  'places': 2, 'amenities': 2,
+                                  'place_amenity': 2})
+        self.assertEqual(storage.get(City, 'c1').state_id, 's1')
+        self.assertEqual(storage.get(State, 's2').name, "New 'York'")
+        self.assertEqual(storage.get(Place, 'p1').amenity_ids, ['a1', 'a2'])
+        self.assertEqual(storage.get(Place, 'p2').amenity_ids, [])
+        self.assertEqual(storage.get(Amenity, 'a2').name, "Café")
+        self.assertEqual(storage._FileStorage__dirty, {})
+        self.assertTrue(os.path.exists('file.json'))
+
+    def test_file_mode_imports_no_sqlalchemy(self):
+        """Loading into FileStorage never imports SQLAlchemy"""
+        root = os.path.dirname(os.path.dirname(os.path.dirname(
+            os.path.dirname(os.path.abspath(__file__)))))
+        env = dict(os.environ, PYTHONPATH=root)
+        env.pop('HBNB_TYPE_STORAGE', None)
+        code = ("import sys; from models import storage; "
+                "from models.engine.dump_loader import load; "
+                "load({!r}, storage); "
+                "print([m for m in sys.modules if m.startswith('sqlalchemy')])"
+                .format(os.path.abspath(self.path)))
+        with tempfile.TemporaryDirectory() as directory:
+            output = subprocess.run([sys.executable, '-c', code], env=env,
+                                    cwd=directory, capture_output=True,
+                                    text=True, check=True).stdout
+        self.assertEqual(output.strip(), '[]')
+
+    def test_fill_new_mmap_store(self):
+        """The loader fills a new mmap store without a missing file warning"""
+        root = os.path.dirname(os.path.dirname(os.path.dirname(
+            os.path.dirname(os.path.abspath(__file__)))))
+        with tempfile.TemporaryDirectory() as directory:
+            env = dict(os.environ, PYTHONPATH=root, HBNB_TYPE_STORAGE='mmap',
+                       HBNB_MMAP_PATH=os.path.join(directory, 'file.idx'))
+            result = subprocess.run(
+                [sys.executable, '-W', 'error', '-m',
+                 'models.engine.dump_loader', os.path.abspath(self.path)],
+                env=env, cwd=directory, capture_output=True, text=True)
+            self.assertEqual(result.returncode, 0, result.stderr)
+            self.assertIn('states: 2', result.stdout)
+            self.assertTrue(os.path.exists(env['HBNB_MMAP_PATH']))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,13 @@
 #!/usr/bin/python3
 """ Module for testing file storage 100%"""
 import unittest
+from models.engine.file_storage import FileStorage
 from models.base_model import BaseModel
+from unittest.mock import Mock, patch
 from models import storage
+import subprocess
+import json
+import sys
 import os
 
 
@@ -16,13 +21,18 @@ class test_fileStorage(unittest.TestCase):
             del_list.append(key)
         for key in del_list:
             del storage._FileStorage__objects[key]
+        storage._FileStorage__dirty.clear()
+        storage._FileStorage__records.clear()
+        FileStorage._FileStorage__journal_records = 0
 
     def tearDown(self):
         """ Remove storage file at end of tests """
-        try:
-            os.remove('file.json')
-        except FileNotFoundError:
-            pass
+        FileStorage._FileStorage__journaled = False
+        for path in ('file.json', 'file.json.log', 'file.json.lock'):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
 
     def test_obj_list_empty(self):
         """ __objects is initially empty """
@@ -105,6 +115,565 @@ class test_fileStorage(unittest.TestCase):
             temp = keys[0]
             self.assertEqual(temp, 'BaseModel' + '.' + _id)
 
+    def test_journal_appends_records(self):
+        """ Journaled save appends one record instead of a snapshot """
+        FileStorage._FileStorage__journaled = True
+        new = BaseModel()
+        new.save()
+        self.assertFalse(os.path.exists('file.json'))
+        with open('file.json.log') as f:
+            records = [json.loads(line) for line in f]
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0]['op'], 'put')
+        self.assertEqual(records[0]['key'], 'BaseModel.' + new.id)
+
+    def test_journal_replay(self):
+        """ reload() replays puts and deletes on top of the snapshot """
+        kept = BaseModel()
+        gone = BaseModel()
+        kept.save()
+        gone.save()
+        FileStorage._FileStorage__journaled = True
+        kept.name = "journaled"
+        kept.save()
+        storage.delete(gone)
+        storage.save()
+        storage._FileStorage__objects.clear()
+        storage.reload()
+        self.assertEqual(storage.all()['BaseModel.' + kept.id].name,
+                         "journaled")
+        self.assertNotIn('BaseModel.' + gone.id, storage.all())
+
+    def test_journal_compaction(self):
+        """ The journal is folded into the snapshot once it is long enough """
+        FileStorage._FileStorage__journaled = True
+        compact_every = FileStorage._FileStorage__compact_every
+        FileStorage._FileStorage__compact_every = 2
+        try:
+            first = BaseModel()
+            first.save()
+            second = BaseModel()
+            second.save()
+        finally:
+            FileStorage._FileStorage__compact_every = compact_every
+        self.assertFalse(os.path.exists('file.json.log'))
+        with open('file.json') as f:
+            snapshot = json.load(f)
+        self.assertIn('BaseModel.' + first.id, snapshot)
+        self.assertIn('BaseModel.' + second.id, snapshot)
+
+    def test_journal_ignores_torn_record(self):
+        """ A partially written last record is skipped on replay """
+        new = BaseModel()
+        new.save()
+        with open('file.json.log', 'w') as f:
+            f.write('{"op": "delete", "key": "BaseModel.')
+        storage._FileStorage__objects.clear()
+        storage.reload()
+        self.assertIn('BaseModel.' + new.id, storage.all())
+
+    def test_journal_append_after_torn_record(self):
+        """ A record appended after a torn one is replayed """
+        from models.state import State
+        FileStorage._FileStorage__journaled = True
+        first = State(name="A")
+        first.save()
+        with open('file.json.log', 'a') as f:
+            f.write('{"op": "put", "key": "State.')
+        second = State(name="B")
+        second.save()
+        with open('file.json.log') as f:
+            self.assertEqual(len(f.readlines()), 2)
+        storage._FileStorage__objects.clear()
+        storage._FileStorage__records.clear()
+        storage.reload()
+        self.assertEqual(sorted(s.name for s in storage.all(State).values()),
+                         ["A", "B"])
+
+    def test_journal_skips_bad_line(self):
+        """ Replay skips a bad line and applies the records after it """
+        from models.state import State
+        FileStorage._FileStorage__journaled = True
+        first = State(name="A")
+        first.save()
+        second = State(name="B")
+        second.save()
+        with open('file.json.log') as f:
+            lines = f.readlines()
+        with open('file.json.log', 'w') as f:
+            f.writelines([lines[0], '{"op": "pu\n', lines[1]])
+        storage._FileStorage__objects.clear()
+        storage._FileStorage__records.clear()
+        storage.reload()
+        self.assertEqual(sorted(s.name for s in storage.all(State).values()),
+                         ["A", "B"])
+
+    def test_save_serializes_dirty_objects_only(self):
+        """ Clean objects are written from cache, not through to_dict() """
+        clean = BaseModel()
+        clean.save()
+        to_dict = Mock()
+        # Set in __dict__, as an assignment would mark clean as changed
+        with patch.dict(clean.__dict__, to_dict=to_dict):
+            dirty = BaseModel()
+            dirty.save()
+        to_dict.assert_not_called()
+        with open('file.json') as f:
+            snapshot = json.load(f)
+        self.assertEqual(snapshot['BaseModel.' + clean.id], clean.to_dict())
+        self.assertIn('BaseModel.' + dirty.id, snapshot)
+
+    def test_update_marks_object_dirty(self):
+        """ Saving a changed object writes its new state """
+        new = BaseModel()
+        new.save()
+        new.name = "updated"
+        new.save()
+        with open('file.json') as f:
+            snapshot = json.load(f)
+        self.assertEqual(snapshot['BaseModel.' + new.id]['name'], "updated")
+
+    def test_assignment_marks_object_dirty(self):
+        """ An attribute assigned in place is written by storage.save() """
+        from models.state import State
+        new = State(name="old")
+        new.save()
+        new.name = "new"
+        storage.save()
+        with open('file.json') as f:
+            snapshot = json.load(f)
+        self.assertEqual(snapshot['State.' + new.id]['name'], "new")
+        self.assertEqual(storage.filter(State, order_by='name'), [new])
+        copy = State(**new.to_dict())
+        copy.name = "copy"
+        self.assertNotIn('State.' + new.id, storage._FileStorage__dirty)
+
+    def test_delete_drops_cached_record(self):
+        """ Deleted objects are not written back from the cache """
+        new = BaseModel()
+        new.save()
+        storage.delete(new)
+        storage.save()
+        with open('file.json') as f:
+            self.assertNotIn('BaseModel.' + new.id, json.load(f))
+
+    def test_all_by_class(self):
+        """ all(cls) only returns instances of cls """
+        from models.state import State
+        from models.city import City
+        state = State(name="California")
+        city = City(name="San Francisco", state_id=state.id)
+        storage.new(state)
+        storage.new(city)
+        self.assertEqual(storage.all(State), {'State.' + state.id: state})
+        self.assertEqual(storage.all(City), {'City.' + city.id: city})
+
+    def test_all_by_base_class(self):
+        """ all(BaseModel) also returns instances of subclasses """
+        from models.state import State
+        base = BaseModel()
+        state = State(name="Nevada")
+        storage.new(base)
+        storage.new(state)
+        self.assertEqual(set(storage.all(BaseModel)),
+                         {'BaseModel.' + base.id, 'State.' + state.id})
+
+    def test_all_by_class_after_delete(self):
+        """ Deleted objects leave their class bucket """
+        from models.state import State
+        state = State(name="Oregon")
+        storage.new(state)
+        storage.delete(state)
+        self.assertEqual(storage.all(State), {})
+
+    def test_all_by_class_returns_copy(self):
+        """ Mutating the result of all(cls) does not touch storage """
+        from models.state import State
+        state = State(name="Utah")
+        storage.new(state)
+        storage.all(State).clear()
+        self.assertIn('State.' + state.id, storage.all(State))
+
+    def test_related_follows_foreign_key(self):
+        """ related() returns the children filed under a parent id """
+        from models.state import State
+        from models.city import City
+        state = State(name="California")
+        other = State(name="Arizona")
+        city = City(name="Fresno", state_id=state.id)
+        for obj in (state, other, city):
+            storage.new(obj)
+        self.assertEqual(storage.related(City, 'state_id', state.id), [city])
+        self.assertEqual(storage.related(City, 'state_id', other.id), [])
+
+    def test_related_after_update(self):
+        """ Saving a changed foreign key moves the child to its new parent """
+        from models.city import City
+        city = City(name="Reno", state_id="old")
+        city.save()
+        city.state_id = "new"
+        city.save()
+        self.assertEqual(storage.related(City, 'state_id', "old"), [])
+        self.assertEqual(storage.related(City, 'state_id', "new"), [city])
+
+    def test_related_after_delete(self):
+        """ Deleted children leave the reverse index """
+        from models.review import Review
+        review = Review(text="Nice", place_id="p", user_id="u")
+        storage.new(review)
+        storage.delete(review)
+        self.assertEqual(storage.related(Review, 'place_id', "p"), [])
+        self.assertEqual(storage.related(Review, 'user_id', "u"), [])
+
+    def test_related_after_reload(self):
+        """ reload() files loaded objects under their foreign keys """
+        from models.city import City
+        city = City(name="Tucson", state_id="az")
+        city.save()
+        storage._FileStorage__objects.clear()
+        storage.reload()
+        cities = storage.related(City, 'state_id', "az")
+        self.assertEqual([c.id for c in cities], [city.id])
+
+    def test_get(self):
+        """ get() looks an object up by class and id """
+        from models.state import State
+        state = State(name="Ohio")
+        storage.new(state)
+        self.assertIs(storage.get(State, state.id), state)
+        self.assertIsNone(storage.get(State, "missing"))
+        self.assertIsNone(storage.get(BaseModel, state.id))
+
+    def test_record(self):
+        """ record() reuses the saved record of a clean object only """
+        from models.state import State
+        state = State(name="Ohio")
+        storage.new(state)
+        self.assertEqual(storage.record(state), state.to_dict())
+        storage.save()
+        record = storage.record(state)
+        self.assertIs(storage.record(state), record)
+        self.assertEqual(record, state.to_dict())
+        state.name = "Iowa"
+        storage.new(state)
+        self.assertEqual(storage.record(state)['name'], "Iowa")
+
+    def test_count(self):
+        """ count() counts objects of a class and its subclasses """
+        from models.state import State
+        for name in ("Ohio", "Iowa"):
+            storage.new(State(name=name))
+        storage.new(BaseModel())
+        self.assertEqual(storage.count(State), 2)
+        self.assertEqual(storage.count(BaseModel), 3)
+        self.assertEqual(storage.count(), 3)
+
+    def test_filter(self):
+        """ filter() matches criteria, sorts on order_by and pages """
+        from models.state import State
+        from models.city import City
+        state = State(name="Ohio")
+        cities = [City(name=name, state_id=state.id)
+                  for name in ("Toledo", "Akron", "Dayton")]
+        storage.new(City(name="Ames", state_id="other"))
+        for city in cities:
+            storage.new(city)
+        found = storage.filter(City, state_id=state.id, order_by='name')
+        self.assertEqual([c.name for c in found],
+                         ["Akron", "Dayton", "Toledo"])
+        found = storage.filter(City, order_by='-name', limit=2, offset=1)
+        self.assertEqual([c.name for c in found], ["Dayton", "Ames"])
+        self.assertEqual(storage.filter(City, id=cities[0].id,
+                                        name="Toledo"), [cities[0]])
+        self.assertEqual(storage.filter(City, id=cities[0].id,
+                                        name="Akron"), [])
+        self.assertEqual(storage.filter(State, name="Ohio"), [])
+
+    def test_filter_order_follows_updates(self):
+        """ The sorted index follows new, updated and deleted objects """
+        from models.state import State
+        states = {name: State(name=name) for name in ("Ohio", "Iowa")}
+        for state in states.values():
+            storage.new(state)
+        self.assertEqual([s.name for s in storage.filter(
+            State, order_by='name')], ["Iowa", "Ohio"])
+        states["Ohio"].name = "Alaska"
+        storage.new(states["Ohio"])
+        storage.new(State(name="Utah"))
+        storage.delete(states["Iowa"])
+        self.assertEqual([s.name for s in storage.filter(
+            State, order_by='name')], ["Alaska", "Utah"])
+        self.assertEqual([s.name for s in storage.filter(
+            State, order_by='-name', limit=1)], ["Utah"])
+        self.assertEqual([s.name for s in storage.filter(
+            State, order_by='-name', limit=1, offset=1)], ["Alaska"])
+        self.assertEqual([s.name for s in storage.filter(
+            State, order_by='name', offset=1)], ["Utah"])
+
+    def test_related_order_by(self):
+        """ related() sorts children and drops stale orders on changes """
+        from models.state import State
+        from models.city import City
+        state = State(name="Ohio")
+        for name in ("Toledo", "Akron"):
+            storage.new(City(name=name, state_id=state.id))
+        self.assertEqual([c.name for c in state.cities], ["Akron", "Toledo"])
+        storage.new(City(name="Dayton", state_id=state.id))
+        self.assertEqual([c.name for c in state.cities],
+                         ["Akron", "Dayton", "Toledo"])
+
+    def test_generation(self):
+        """ generation() changes with the objects of its class only """
+        from models.state import State
+        from models.city import City
+        state = State(name="Ohio")
+        before = (storage.generation(State), storage.generation(City))
+        storage.new(state)
+        self.assertNotEqual(storage.generation(State), before[0])
+        self.assertEqual(storage.generation(City), before[1])
+        after_new = storage.generation(State)
+        storage.delete(state)
+        self.assertNotEqual(storage.generation(State), after_new)
+
+    def test_bulk_save(self):
+        """ bulk_new() objects are written by a single bulk_save() """
+        from models.place import Place
+        places = [Place(name=str(i)) for i in range(50)]
+        self.assertEqual(storage.bulk_new(places), 50)
+        storage.bulk_save()
+        with open('file.json') as f:
+            self.assertEqual(len(json.load(f)), 50)
+
+    def test_transaction_saves_once(self):
+        """ Saves inside transaction() are written once, at the end """
+        from models.state import State
+        with patch.object(FileStorage, '_FileStorage__compact') as compact:
+            with storage.transaction():
+                for name in ("Ohio", "Iowa"):
+                    State(name=name).save()
+                with storage.transaction():
+                    State(name="Utah").save()
+                compact.assert_not_called()
+        compact.assert_called_once_with(sync=False)
+        self.assertEqual(storage.count(State), 3)
+
+    def test_transaction_rollback(self):
+        """ An exception undoes the block's changes and writes nothing """
+        from models.state import State
+        kept = State(name="Ohio")
+        gone = State(name="Iowa")
+        kept.save()
+        gone.save()
+        mtime = os.stat('file.json').st_mtime_ns
+        with self.assertRaises(ValueError):
+            with storage.transaction():
+                kept.name = "Alaska"
+                kept.save()
+                gone.delete()
+                State(name="Utah").save()
+                raise ValueError
+        self.assertEqual(os.stat('file.json').st_mtime_ns, mtime)
+        self.assertEqual(sorted(s.name for s in storage.all(State).values()),
+                         ["Iowa", "Ohio"])
+        self.assertEqual(storage.get(State, kept.id).name, "Ohio")
+        self.assertEqual(storage._FileStorage__dirty, {})
+        self.assertEqual([s.name for s in storage.filter(
+            State, order_by='name')], ["Iowa", "Ohio"])
+
+    def test_transaction_is_per_thread(self):
+        """ A rollback keeps what other threads wrote during the block """
+        import threading
+        from models.state import State
+        other = State(name="Other")
+        with self.assertRaises(ValueError):
+            with storage.transaction():
+                State(name="Undone").save()
+                thread = threading.Thread(target=other.save)
+                thread.start()
+                thread.join()
+                raise ValueError
+        self.assertEqual([s.name for s in storage.all(State).values()],
+                         ["Other"])
+        storage.save()
+        with open('file.json') as f:
+            self.assertEqual([s['name'] for s in json.load(f).values()],
+                             ["Other"])
+
+    def test_load_option_is_accepted(self):
+        """ load= is accepted for DBStorage compatibility and ignored """
+        from models.state import State
+        state = State(name="Ohio")
+        storage.new(state)
+        self.assertEqual(storage.all(State, load=('cities',)),
+                         storage.all(State))
+        self.assertIs(storage.get(State, state.id, load=()), state)
+        self.assertEqual(storage.filter(State, load=('cities',)), [state])
+
+    def test_close_skips_unchanged_file(self):
+        """ close() does not parse the file again if nothing changed """
+        new = BaseModel()
+        new.save()
+        with patch('models.engine.file_storage.JSONObjectReader') as load:
+            storage.close()
+            storage.reload()
+        load.assert_not_called()
+
+    def test_reload_is_incremental(self):
+        """ Only records changed on disk are instantiated again """
+        kept = BaseModel()
+        changed = BaseModel()
+        removed = BaseModel()
+        for obj in (kept, changed, removed):
+            storage.new(obj)
+        storage.save()
+        with open('file.json') as f:
+            snapshot = json.load(f)
+        snapshot['BaseModel.' + changed.id]['name'] = "from another process"
+        del snapshot['BaseModel.' + removed.id]
+        with open('file.json', 'w') as f:
+            json.dump(snapshot, f)
+        storage.close()
+        objects = storage.all()
+        self.assertIs(objects['BaseModel.' + kept.id], kept)
+        self.assertEqual(objects['BaseModel.' + changed.id].name,
+                         "from another process")
+        self.assertNotIn('BaseModel.' + removed.id, objects)
+
+    def test_reload_keeps_unsaved_objects(self):
+        """ Objects with unsaved changes survive a reload """
+        saved = BaseModel()
+        saved.save()
+        unsaved = BaseModel()
+        storage.new(unsaved)
+        with open('file.json', 'w') as f:
+            json.dump({}, f)
+        storage.reload()
+        self.assertNotIn('BaseModel.' + saved.id, storage.all())
+        self.assertIn('BaseModel.' + unsaved.id, storage.all())
+
+    def test_reload_reports_progress(self):
+        """ reload() reports per-class counts and how much was read """
+        from models.state import State
+        state = State(name="Texas")
+        for obj in (BaseModel(), BaseModel(), state):
+            storage.new(obj)
+        storage.save()
+        storage._FileStorage__objects.clear()
+        reports = []
+        storage.reload(progress=lambda counts, bytes_read:
+                       reports.append((dict(counts), bytes_read)))
+        counts, bytes_read = reports[-1]
+        self.assertEqual(counts, {'BaseModel': 2, 'State': 1})
+        self.assertEqual(bytes_read, os.path.getsize('file.json'))
+
+    def test_progress_counts_bytes(self):
+        """ The progress of reload() is a byte offset, non-ASCII included """
+        with open('file.json', 'w', encoding='utf-8') as f:
+            json.dump({'State.{}'.format(i): {
+                '__class__': 'State', 'id': str(i), 'name': 'Zürich ' * 50,
+                'created_at': '2024-01-01T00:00:00',
+                'updated_at': '2024-01-01T00:00:00'} for i in range(300)},
+                f, ensure_ascii=False)
+        size = os.path.getsize('file.json')
+        reports = []
+        with patch.object(FileStorage, '_FileStorage__progress_every', 10):
+            storage.reload(progress=lambda counts, bytes_read:
+                           reports.append(bytes_read))
+        self.assertEqual(reports[-1], size)
+        self.assertEqual(reports, sorted(reports))
+        self.assertLessEqual(max(reports), size)
+
+    def test_binary_snapshot(self):
+        """ Objects round-trip through the binary snapshot format """
+        from models.place import Place
+        place = Place(name="Loft", number_rooms=0, latitude=1.5,
+                      description=None, amenity_ids=["a", "b"])
+        storage.new(place)
+        FileStorage._FileStorage__binary = True
+        FileStorage._FileStorage__file_path = 'file.hbnb'
+        try:
+            storage.save()
+            storage._FileStorage__objects.clear()
+            storage._FileStorage__records.clear()
+            storage.reload()
+            loaded = storage.all()['Place.' + place.id]
+            self.assertIsNot(loaded, place)
+            self.assertEqual(loaded.to_dict(), place.to_dict())
+        finally:
+            FileStorage._FileStorage__binary = False
+            FileStorage._FileStorage__file_path = 'file.json'
+            os.remove('file.hbnb')
+            os.remove('file.hbnb.lock')
+
+    def test_failed_save_keeps_snapshot(self):
+        """ A save that fails midway leaves the previous file intact """
+        new = BaseModel()
+        new.save()
+        with open('file.json') as f:
+            before = f.read()
+        storage.new(BaseModel())
+        with patch('models.engine.file_storage.json.dump',
+                   side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                storage.save()
+        with open('file.json') as f:
+            self.assertEqual(f.read(), before)
+
+    def test_changes_bumped_by_save(self):
+        """ Every save() bumps the change sequence number """
+        before = storage.changes()
+        BaseModel().save()
+        BaseModel().save()
+        self.assertEqual(storage.changes(), before + 2)
+
+    def test_reload_without_write_access(self):
+        """ reload() reads the store where the lock file cannot be written """
+        new = BaseModel()
+        new.save()
+        opened = []
+        open_file = os.open
+
+        def read_only(path, flags, *args):
+            """ Fails like a directory the process cannot write to """
+            opened.append(flags)
+            if flags & (os.O_WRONLY | os.O_RDWR | os.O_CREAT):
+                raise PermissionError(path)
+            return open_file(path, flags, *args)
+
+        storage._FileStorage__objects.clear()
+        FileStorage._FileStorage__loaded = None
+        with patch('models.engine.file_storage.os.open', read_only):
+            storage.reload()
+            self.assertEqual(opened, [os.O_RDONLY, os.O_RDONLY])
+            self.assertIn('BaseModel.' + new.id, storage.all())
+            os.remove('file.json.lock')
+            storage._FileStorage__objects.clear()
+            FileStorage._FileStorage__loaded = None
+            storage.reload()
+        self.assertIn('BaseModel.' + new.id, storage.all())
+
+    def test_save_merges_other_processes(self):
+        """ Objects saved by another process survive our next save """
+        mine = BaseModel()
+        mine.save()
+        theirs = subprocess.run(
+            [sys.executable, '-c',
+             'from models.state import State\n'
+             'state = State(name="Other")\n'
+             'state.save()\n'
+             'print(state.id)'],
+            capture_output=True, text=True, check=True).stdout.strip()
+        self.assertNotEqual(storage.changes(),
+                            storage._FileStorage__sequence)
+        other = BaseModel()
+        other.save()
+        with open('file.json') as f:
+            snapshot = json.load(f)
+        for key in ('BaseModel.' + mine.id, 'BaseModel.' + other.id,
+                    'State.' + theirs):
+            self.assertIn(key, snapshot)
+        self.assertEqual(storage.all()['State.' + theirs].name, "Other")
+
     def test_storage_var_created(self):
         """ FileStorage object storage created """
         from models.engine.file_storage import FileStorage
@@ -0,0 +1,56 @@
+#!/usr/bin/python3
+"""
+File: test_json_stream.py
+Author: TheWatcher01
+Date: 2026-10-18
+Description: Unit tests for the incremental JSON object reader.
+"""
+
+from models.engine.json_stream import JSONObjectReader
+from io import StringIO
+import unittest
+import json
+
+
+class TestJSONObjectReader(unittest.TestCase):
+    """Tests for JSONObjectReader"""
+
+    def read(self, text, chunk_size=4):
+        """Returns the members read from text with tiny chunks"""
+        return list(JSONObjectReader(StringIO(text), chunk_size))
+
+    def test_matches_json_load(self):
+        """Members come out in file order, as json.load() parses them"""
+        data = {
+            "State.1": {"name": "New York", "id": "1", "tags": [1, 2.5]},
+            "City.2": {"name": "a \"quoted\" {brace}", "n": 12345678},
+            "Place.3": {"latitude": -1e-05, "description": None},
+        }
+        text = json.dumps(data, indent=2)
+        self.assertEqual(self.read(text), list(data.items()))
+
+    def test_empty_object(self):
+        """An empty object yields nothing"""
+        self.assertEqual(self.read(' { } '), [])
+
+    def test_empty_file(self):
+        """An empty file raises ValueError like json.load()"""
+        with self.assertRaises(ValueError):
+            self.read('')
+
+    def test_truncated_file(self):
+        """A truncated file raises ValueError"""
+        text = json.dumps({"a": {"id": "1"}, "b": {"id": "2"}})
+        with self.assertRaises(ValueError):
+            self.read(text[:-5])
+
+    def test_chars_read(self):
+        """chars_read reaches the file length once everything is read"""
+        text = json.dumps({"a": 1, "b": 2})
+        reader = JSONObjectReader(StringIO(text), 3)
+        list(reader)
+        self.assertEqual(reader.chars_read, len(text))
+
+
+if __name__ == "__main__":
+    unittest.main()
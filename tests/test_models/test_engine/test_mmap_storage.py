@@ -0,0 +1,205 @@
+#!/usr/bin/python3
+"""
+File: test_mmap_storage.py
+Author: TheWatcher01
+Date: 2026-10-18
+Description: Unit tests for the memory-mapped, lazily loaded MMapStorage.
+"""
+
+from models.engine.mmap_storage import MMapStorage, build
+from models.base_model import BaseModel
+from models.state import State
+from models.city import City
+import unittest
+import json
+import os
+
+
+class TestMMapStorage(unittest.TestCase):
+    """Tests for MMapStorage"""
+
+    path = 'test_file.idx'
+
+    def setUp(self):
+        """Builds a snapshot of two states and three cities"""
+        self.states = [State(name="California"), State(name="Arizona")]
+        self.cities = [City(name="Napa", state_id=self.states[0].id),
+                       City(name="Sonoma", state_id=self.states[0].id),
+                       City(name="Page", state_id=self.states[1].id)]
+        records = {'{}.{}'.format(type(obj).__name__, obj.id): obj.to_dict()
+                   for obj in self.states + self.cities}
+        with open('test_file.json', 'w') as f:
+            json.dump(records, f)
+        build('test_file.json', self.path)
+        MMapStorage._MMapStorage__file_path = self.path
+        self.storage = MMapStorage()
+        self.storage.reload()
+
+    def tearDown(self):
+        """Removes the snapshot files"""
+        MMapStorage._MMapStorage__file_path = 'file.idx'
+        for path in ('test_file.json', self.path):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def cached(self):
+        """Returns the number of materialized objects"""
+        return len(self.storage._MMapStorage__cache)
+
+    def test_nothing_materialized_on_reload(self):
+        """reload() only maps the file"""
+        self.assertEqual(self.cached(), 0)
+
+    def test_get(self):
+        """get() materializes the requested object only"""
+        state = self.storage.get(State, self.states[1].id)
+        self.assertEqual(state.to_dict(), self.states[1].to_dict())
+        self.assertIs(self.storage.get(State, self.states[1].id), state)
+        self.assertIsNone(self.storage.get(State, "missing"))
+        self.assertIsNone(self.storage.get(City, self.states[1].id))
+        self.assertEqual(self.cached(), 1)
+
+    def test_all(self):
+        """all(cls) returns every object of cls"""
+        states = self.storage.all(State)
+        self.assertEqual(set(states), {'State.' + s.id for s in self.states})
+        self.assertEqual(len(self.storage.all()), 5)
+
+    def test_related(self):
+        """related() follows the stored foreign-key index"""
+        cities = self.storage.related(City, 'state_id', self.states[0].id)
+        self.assertEqual(sorted(city.name for city in cities),
+                         ["Napa", "Sonoma"])
+        self.assertEqual(self.storage.related(City, 'state_id', "none"), [])
+        self.assertEqual(self.cached(), 2)
+
+    def test_count(self):
+        """count() materializes nothing"""
+        self.assertEqual(self.storage.count(City), 3)
+        self.assertEqual(self.storage.count(), 5)
+        self.storage.delete(self.storage.get(City, self.cities[2].id))
+        self.assertEqual(self.storage.count(City), 2)
+        self.assertEqual(self.storage.count(BaseModel), 4)
+        self.assertEqual(self.storage.count(BaseModel, exact=True), 0)
+        self.assertEqual(self.storage.count(State, exact=True), 2)
+        self.assertEqual(self.cached(), 0)
+
+    def test_filter(self):
+        """filter() narrows on the foreign-key index, sorts and pages"""
+        state_id = self.states[0].id
+        cities = self.storage.filter(City, state_id=state_id,
+                                     order_by='-name')
+        self.assertEqual([city.name for city in cities], ["Sonoma", "Napa"])
+        self.assertEqual(self.cached(), 2)
+        cities = self.storage.filter(City, order_by='name', limit=1,
+                                     offset=1)
+        self.assertEqual([city.name for city in cities], ["Page"])
+        self.assertEqual(self.storage.filter(City, name="Napa",
+                                             state_id=state_id),
+                         [self.storage.get(City, self.cities[0].id)])
+
+    def test_transaction(self):
+        """A failed block drops its changes; a good one saves once"""
+        with self.assertRaises(ValueError):
+            with self.storage.transaction():
+                self.storage.new(State(name="Nevada"))
+                self.storage.delete(self.storage.get(City, self.cities[0].id))
+                self.storage.save()
+                raise ValueError
+        self.assertEqual(self.storage.count(), 5)
+        self.assertIsNotNone(self.storage.get(City, self.cities[0].id))
+        with self.storage.transaction():
+            self.storage.new(State(name="Nevada"))
+            self.storage.save()
+            unsaved = MMapStorage()
+            unsaved.reload()
+            self.assertEqual(unsaved.count(), 5)
+        reopened = MMapStorage()
+        reopened.reload()
+        self.assertEqual(reopened.count(State), 3)
+
+    def test_transaction_is_per_thread(self):
+        """A rollback keeps what other threads wrote during the block"""
+        import threading
+        other = State(name="Other")
+        undone = State(name="Undone")
+        renamed = self.storage.get(State, self.states[0].id)
+
+        def save_other():
+            self.storage.new(other)
+            self.storage.save()
+
+        with self.assertRaises(ValueError):
+            with self.storage.transaction():
+                self.storage.new(undone)
+                renamed.name = "Renamed"
+                self.storage.new(renamed)
+                thread = threading.Thread(target=save_other)
+                thread.start()
+                thread.join()
+                raise ValueError
+        self.assertIsNone(self.storage.get(State, undone.id))
+        self.assertEqual(self.storage.get(State, renamed.id).name,
+                         "California")
+        self.storage.save()
+        reopened = MMapStorage()
+        reopened.reload()
+        self.assertEqual(sorted(s.name for s in reopened.all(State).values()),
+                         ["Arizona", "California", "Other"])
+
+    def test_cache_is_bounded(self):
+        """Least recently used objects are evicted"""
+        cache_size = MMapStorage._MMapStorage__cache_size
+        MMapStorage._MMapStorage__cache_size = 2
+        try:
+            self.storage.all()
+        finally:
+            MMapStorage._MMapStorage__cache_size = cache_size
+        self.assertEqual(self.cached(), 2)
+
+    def test_save(self):
+        """New, updated and deleted objects reach the new snapshot"""
+        state = State(name="Nevada")
+        self.storage.new(state)
+        self.storage.delete(self.storage.get(City, self.cities[2].id))
+        city = self.storage.get(City, self.cities[0].id)
+        city.name = "Napa Valley"
+        self.storage.new(city)
+        self.storage.save()
+        reopened = MMapStorage()
+        reopened.reload()
+        self.assertEqual(reopened.get(State, state.id).name, "Nevada")
+        self.assertIsNone(reopened.get(City, self.cities[2].id))
+        self.assertEqual(reopened.get(City, city.id).name, "Napa Valley")
+        self.assertEqual(len(reopened.all()), 5)
+
+    def test_assignment_is_saved(self):
+        """An attribute assigned in place reaches the next snapshot"""
+        from models import base_model
+        on_change = base_model.on_change
+        base_model.on_change = self.storage.changed
+        try:
+            self.storage.get(State, self.states[0].id).name = "Golden"
+        finally:
+            base_model.on_change = on_change
+        self.storage.save()
+        reopened = MMapStorage()
+        reopened.reload()
+        self.assertEqual(reopened.get(State, self.states[0].id).name,
+                         "Golden")
+
+    def test_missing_snapshot(self):
+        """A missing snapshot warns how to build it and reads as empty"""
+        os.remove(self.path)
+        with self.assertWarnsRegex(UserWarning, 'mmap_storage build'):
+            self.storage.reload()
+        self.assertEqual(self.storage.count(), 0)
+        self.storage.new(State(name="Nevada"))
+        self.storage.save()
+        reopened = MMapStorage()
+        reopened.reload()
+        self.assertEqual(reopened.count(State), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
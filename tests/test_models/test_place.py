@@ -2,6 +2,9 @@
 """ """
 from tests.test_models.test_base_model import test_basemodel
 from models.place import Place
+import unittest
+import json
+import os
 
 
 class test_Place(test_basemodel):
@@ -72,3 +75,20 @@ class test_Place(test_basemodel):
         """ """
         new = self.value()
         self.assertEqual(type(new.amenity_ids), list)
+
+    @unittest.skipIf(os.getenv('HBNB_TYPE_STORAGE') == 'db',
+                     "amenity_ids is only stored in file mode")
+    def test_amenities_setter_is_saved(self):
+        """ """
+        from models.amenity import Amenity
+        from models import storage
+        new = self.value()
+        new.save()
+        amenity = Amenity(name="Wifi")
+        new.amenities = amenity
+        storage.save()
+        with open('file.json') as f:
+            record = json.load(f)['Place.' + new.id]
+        self.assertEqual(record['amenity_ids'], [amenity.id])
+        storage.delete(new)
+        storage.save()
@@ -2,6 +2,10 @@
 """ """
 from tests.test_models.test_base_model import test_basemodel
 from models.state import State
+from models.city import City
+from models import storage
+import os
+import unittest
 
 
 class test_state(test_basemodel):
@@ -18,3 +22,18 @@ class test_state(test_basemodel):
         new = self.value(name="Test State")
         self.assertIsInstance(new.name, str)
         self.assertIsNotNone(new.name)
+
+    @unittest.skipIf(os.getenv('HBNB_TYPE_STORAGE') == 'db',
+                     "cities is a relationship in db mode")
+    def test_cities(self):
+        """ cities returns the City objects of this State only """
+        state = self.value(name="California")
+        city = City(name="San Jose", state_id=state.id)
+        other = City(name="Boise", state_id="another state")
+        for obj in (state, city, other):
+            storage.new(obj)
+        try:
+            self.assertEqual(state.cities, [city])
+        finally:
+            for obj in (state, city, other):
+                storage.delete(obj)
@@ -0,0 +1,174 @@
+#!/usr/bin/python3
+"""
+File: test_api.py
+Author: TheWatcher01
+Date: 2026-10-18
+Description: Unit tests for the JSON API of web_flask.
+"""
+
+from web_flask import create_app
+from models.state import State
+from models.place import Place
+from models.city import City
+from models.user import User
+from models.engine.file_storage import FileStorage
+from models import storage
+from datetime import datetime
+import unittest
+import os
+
+
+class TestAPI(unittest.TestCase):
+    """Tests for the /api/v1 blueprint"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Creates one application for all the tests"""
+        cls.client = create_app().test_client()
+
+    def setUp(self):
+        """Creates a State with three cities and a User"""
+        self.state = State(name="Ohio")
+        self.cities = [City(name=name, state_id=self.state.id)
+                       for name in ("Toledo", "Akron", "Dayton")]
+        self.user = User(email="a@b.c", password="secret")
+        self.objs = [self.state, self.user] + self.cities
+        for obj in self.objs:
+            storage.new(obj)
+        storage.save()
+
+    def tearDown(self):
+        """Deletes the objects and removes the storage files"""
+        for obj in self.objs:
+            storage.delete(obj)
+        for path in ('file.json', 'file.json.lock'):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def get(self, path, status=200, **kwargs):
+        """Returns the response to path, checking its status"""
+        response = self.client.get('/api/v1' + path, **kwargs)
+        self.assertEqual(response.status_code, status, path)
+        return response
+
+    def test_get_object(self):
+        """An object is sent in the to_dict() format"""
+        response = self.get('/states/' + self.state.id)
+        self.assertEqual(response.mimetype, 'application/json')
+        self.assertEqual(response.get_json(), self.state.to_dict())
+        self.assertEqual(self.get('/states/missing', 404).get_json(),
+                         {'error': 'Not found'})
+        self.get('/planets/' + self.state.id, 404)
+
+    def test_list_filtered_and_sorted(self):
+        """Lists are filtered on columns and sorted on order_by"""
+        response = self.get('/cities?state_id={}&order_by=-name'.format(
+            self.state.id))
+        self.assertEqual([city['name'] for city in response.get_json()],
+                         ["Toledo", "Dayton", "Akron"])
+        self.get('/cities?planet=Mars', 400)
+        self.get('/places?number_rooms=many', 400)
+        self.get('/cities?order_by=size', 400)
+
+    def test_typed_filter(self):
+        """Filter values are converted to the type of their column"""
+        place = Place(name="Loft", city_id=self.cities[0].id,
+                      user_id=self.user.id, number_rooms=3)
+        self.objs.append(place)
+        storage.new(place)
+        response = self.get('/places?number_rooms=3&fields=name')
+        self.assertEqual(response.get_json(), [{'name': 'Loft'}])
+
+    def test_pages(self):
+        """?page and ?limit page the list and link the next page"""
+        path = '/cities?state_id={}&order_by=name&limit=2'.format(
+            self.state.id)
+        response = self.get(path)
+        self.assertEqual([city['name'] for city in response.get_json()],
+                         ["Akron", "Dayton"])
+        self.assertIn('rel="next"', response.headers['Link'])
+        response = self.get(path + '&page=2')
+        self.assertEqual([city['name'] for city in response.get_json()],
+                         ["Toledo"])
+        self.assertNotIn('rel="next"', response.headers['Link'])
+        self.get('/cities?page=0', 400)
+
+    def test_fields(self):
+        """?fields keeps only the keys asked for"""
+        response = self.get('/states/{}?fields=id,name'.format(
+            self.state.id))
+        self.assertEqual(response.get_json(),
+                         {'id': self.state.id, 'name': 'Ohio'})
+
+    def test_password_hidden(self):
+        """The password of a User is never sent nor filtered on"""
+        record = self.get('/users/' + self.user.id).get_json()
+        self.assertEqual(record['email'], 'a@b.c')
+        self.assertNotIn('password', record)
+        record = self.get('/users/{}?fields=password,email'.format(
+            self.user.id)).get_json()
+        self.assertEqual(record, {'email': 'a@b.c'})
+        self.get('/users?password=secret', 400)
+
+    def test_conditional_get(self):
+        """A matching ETag or Last-Modified gets an empty 304"""
+        path = '/states/' + self.state.id
+        response = self.get(path)
+        etag = response.headers['ETag']
+        self.assertEqual(response.last_modified.replace(tzinfo=None),
+                         self.state.updated_at.replace(microsecond=0))
+        self.assertEqual(self.get(path, 304, headers={
+            'If-None-Match': etag}).data, b'')
+        self.get(path, 304, headers={
+            'If-Modified-Since': response.headers['Last-Modified']})
+        self.state.save()
+        self.get(path, 200, headers={'If-None-Match': etag})
+        path = '/cities?state_id=' + self.state.id
+        etag = self.get(path).headers['ETag']
+        self.get(path, 304, headers={'If-None-Match': etag})
+        storage.delete(self.cities[0])
+        self.get(path, 200, headers={'If-None-Match': etag})
+
+
+class TestBinaryAPI(TestAPI):
+    """Runs the TestAPI tests on objects loaded from a binary snapshot"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Switches FileStorage to HBNB_FILE_FORMAT=binary"""
+        super().setUpClass()
+        FileStorage._FileStorage__binary = True
+        FileStorage._FileStorage__file_path = 'file.hbnb'
+
+    @classmethod
+    def tearDownClass(cls):
+        """Switches FileStorage back to JSON"""
+        FileStorage._FileStorage__binary = False
+        FileStorage._FileStorage__file_path = 'file.json'
+
+    def setUp(self):
+        """Saves the objects, then loads them back from the snapshot"""
+        super().setUp()
+        FileStorage._FileStorage__loaded = None
+        storage.reload()
+        self.state = storage.get(State, self.state.id)
+        self.cities = [storage.get(City, city.id) for city in self.cities]
+        self.user = storage.get(User, self.user.id)
+        self.objs = [self.state, self.user] + self.cities
+
+    def tearDown(self):
+        """Also removes the binary snapshot"""
+        super().tearDown()
+        for path in ('file.hbnb', 'file.hbnb.lock'):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def test_loaded_records(self):
+        """The objects come from the snapshot, with datetime records"""
+        record = storage._FileStorage__records['State.' + self.state.id]
+        self.assertIsInstance(record['updated_at'], datetime)
+        self.assertEqual(storage.record(self.state), self.state.to_dict())
+
+
+if __name__ == "__main__":
+    unittest.main()
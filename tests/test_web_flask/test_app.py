@@ -0,0 +1,124 @@
+#!/usr/bin/python3
+"""
+File: test_app.py
+Author: TheWatcher01
+Date: 2026-10-18
+Description: Unit tests for the web_flask application factory.
+"""
+
+from web_flask import create_app
+from unittest.mock import patch
+from models.state import State
+from models.city import City
+from models import storage
+import unittest
+import os
+
+
+class TestCreateApp(unittest.TestCase):
+    """Tests for create_app()"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Creates one application for all the tests"""
+        cls.client = create_app().test_client()
+
+    def tearDown(self):
+        """Removes the storage files"""
+        for path in ('file.json', 'file.json.lock'):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def get(self, path):
+        """Returns the text of the 200 response to path"""
+        response = self.client.get(path)
+        self.assertEqual(response.status_code, 200, path)
+        return response.get_data(as_text=True)
+
+    def test_basic_routes(self):
+        """The routes of the scripts 0 to 6 are all served"""
+        self.assertEqual(self.get('/'), "Hello HBNB!")
+        self.assertEqual(self.get('/hbnb'), "HBNB")
+        self.assertEqual(self.get('/c/is_fun'), "C is fun")
+        self.assertEqual(self.get('/python'), "Python is cool")
+        self.assertEqual(self.get('/python/rocks'), "Python rocks")
+        self.assertEqual(self.get('/number/89'), "89 is a number")
+        self.assertIn("Number: 89", self.get('/number_template/89'))
+        self.assertIn("Number: 89 is odd", self.get('/number_odd_or_even/89'))
+        self.assertEqual(self.client.get('/number/abc').status_code, 404)
+
+    def test_storage_routes(self):
+        """The State, City and filter pages render from storage"""
+        state = State(name="Zanzibar")
+        storage.new(state)
+        storage.new(City(name="Stone Town", state_id=state.id))
+        for path in ('/states_list', '/cities_by_states', '/states',
+                     '/states/' + state.id, '/hbnb_filters'):
+            self.assertIn("Zanzibar", self.get(path))
+        self.assertIn("Stone Town", self.get('/states/' + state.id))
+        storage.delete(state)
+
+    def test_paged_routes(self):
+        """?page and ?limit page the listings and link their neighbours"""
+        states = [State(name="Page {}".format(i)) for i in range(3)]
+        for state in states:
+            storage.new(state)
+        first = storage.filter(State, order_by='name', limit=2)
+        response = self.client.get('/states_list?limit=2')
+        body = response.get_data(as_text=True)
+        self.assertEqual(body.count('<LI>'), 2)
+        self.assertIn(first[1].name, body)
+        self.assertEqual(response.headers['Link'],
+                         '</states_list?limit=2&page=2>; rel="next"')
+        last = (storage.count(State) + 1) // 2
+        response = self.client.get('/hbnb_filters?page={}&limit=2'.format(
+            last))
+        self.assertNotIn('rel="next"', response.headers['Link'])
+        for query in ('page=0', 'limit=x', 'limit=100000'):
+            self.assertEqual(
+                self.client.get('/states?' + query).status_code, 400)
+        for state in states:
+            storage.delete(state)
+
+    def test_streamed_routes(self):
+        """?stream=1 streams the same page, in chunks"""
+        states = [State(name="Stream {}".format(i)) for i in range(5)]
+        for state in states:
+            storage.new(state)
+        for path in ('/states_list', '/cities_by_states', '/states',
+                     '/hbnb_filters'):
+            response = self.client.get(path + '?stream=1')
+            self.assertTrue(response.is_streamed, path)
+            self.assertEqual(response.get_data(as_text=True),
+                             self.get(path), path)
+        with patch.dict(os.environ, HBNB_STREAM_BATCH='2'):
+            response = self.client.get('/states_list?stream=1')
+            self.assertEqual(response.get_data(as_text=True),
+                             self.get('/states_list'))
+            response = self.client.get(
+                '/states_list?stream=1&limit=3&page=2')
+            self.assertEqual(
+                response.get_data(as_text=True).count('<LI>'),
+                len(storage.filter(State, limit=3, offset=3)))
+        for state in states:
+            storage.delete(state)
+
+    def test_forked_worker(self):
+        """A forked worker uses the storage created by its parent"""
+        state = State(name="Forked")
+        storage.new(state)
+        pid = os.fork()
+        if pid == 0:
+            ok = False
+            try:
+                City(name="Child", state_id=state.id).save()
+                ok = [c.name for c in state.cities] == ["Child"]
+            finally:
+                os._exit(0 if ok else 1)
+        _, status = os.waitpid(pid, 0)
+        self.assertEqual(os.waitstatus_to_exitcode(status), 0)
+        storage.delete(state)
+
+
+if __name__ == "__main__":
+    unittest.main()
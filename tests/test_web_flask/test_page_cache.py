@@ -0,0 +1,112 @@
+#!/usr/bin/python3
+"""
+File: test_page_cache.py
+Author: TheWatcher01
+Date: 2026-10-18
+Description: Unit tests for the web_flask response cache.
+"""
+
+from web_flask.page_cache import PageCache
+from unittest.mock import patch
+from models.state import State
+from models.city import City
+from models import storage
+from flask import Flask, Response
+import unittest
+
+
+class TestPageCache(unittest.TestCase):
+    """Tests for PageCache"""
+
+    def setUp(self):
+        """Creates an app with a cached view counting its renders"""
+        self.renders = []
+        self.cache = PageCache(maxsize=2, ttl=60)
+        app = Flask(__name__)
+
+        @app.route('/states/<id>')
+        @self.cache.cached(State)
+        def states(id):
+            """Renders a page depending on State"""
+            self.renders.append(id)
+            return 'page {} {}'.format(id, len(self.renders))
+
+        self.client = app.test_client()
+
+    def test_hit(self):
+        """A page is rendered once per route and query string"""
+        first = self.client.get('/states/1?page=2')
+        second = self.client.get('/states/1?page=2')
+        self.assertEqual(first.data, second.data)
+        self.client.get('/states/1?page=3')
+        self.assertEqual(self.renders, ['1', '1'])
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 2))
+
+    def test_invalidated_by_its_classes(self):
+        """Changes of State invalidate the page, changes of City do not"""
+        self.client.get('/states/1')
+        storage.new(City(name="Akron"))
+        self.client.get('/states/1')
+        self.assertEqual(len(self.renders), 1)
+        state = State(name="Ohio")
+        storage.new(state)
+        self.client.get('/states/1')
+        self.assertEqual(len(self.renders), 2)
+        storage.delete(state)
+
+    def test_lru_eviction(self):
+        """The least recently used page is evicted beyond maxsize"""
+        for id in ('1', '2', '1', '3', '1', '2'):
+            self.client.get('/states/' + id)
+        self.assertEqual(self.renders, ['1', '2', '3', '2'])
+        self.assertEqual(len(self.cache), 2)
+
+    def test_ttl(self):
+        """An expired page is rendered again"""
+        with patch('web_flask.page_cache.time.monotonic', return_value=0):
+            self.client.get('/states/1')
+        with patch('web_flask.page_cache.time.monotonic', return_value=61):
+            self.client.get('/states/1')
+        self.assertEqual(len(self.renders), 2)
+
+    def test_etag(self):
+        """If-None-Match with the ETag of the page gets an empty 304"""
+        response = self.client.get('/states/1')
+        etag = response.headers['ETag']
+        response = self.client.get('/states/1',
+                                   headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.data, b'')
+        response = self.client.get('/states/1',
+                                   headers={'If-None-Match': '"other"'})
+        self.assertEqual(response.status_code, 200)
+
+    def test_headers_and_streams(self):
+        """Headers returned with a page are cached, Responses are not"""
+        app = Flask(__name__)
+
+        @app.route('/paged')
+        @self.cache.cached(State)
+        def paged():
+            """Renders a page with a Link header"""
+            self.renders.append('paged')
+            return 'paged', {'Link': '</paged?page=2>; rel="next"'}
+
+        @app.route('/streamed')
+        @self.cache.cached(State)
+        def streamed():
+            """Streams a page"""
+            self.renders.append('streamed')
+            return Response(iter(['a', 'b']), mimetype='text/html')
+
+        client = app.test_client()
+        for _ in range(2):
+            response = client.get('/paged')
+            self.assertEqual(response.headers['Link'],
+                             '</paged?page=2>; rel="next"')
+            self.assertEqual(client.get('/streamed').data, b'ab')
+        self.assertEqual(self.renders, ['paged', 'streamed', 'streamed'])
+
+
+if __name__ == "__main__":
+    unittest.main()
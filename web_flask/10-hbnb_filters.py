@@ -13,29 +13,28 @@ from flask import Flask, render_template
 from models.amenity import Amenity
 from models.state import State
 from models.city import City
+from web_flask.page_cache import PageCache
 from models import storage
 
 # Create a Flask web server instance
 app = Flask(__name__, template_folder='templates')
+# Rendered pages, until the objects they show change
+page_cache = PageCache()
 
 
 @app.route('/hbnb_filters', strict_slashes=False)
+@page_cache.cached(State, City, Amenity)
 def hbnb_filters():
     """
-    Fetch all State, City, & Amenity objects from storage, sort them by name,
-    and pass them to the template for rendering.
+    Fetch all State, City, & Amenity objects from storage, ordered by name
+    by the storage engine, and pass them to the template for rendering.
     """
-    # Fetch and sort all State objects by name
-    states = sorted(storage.all(State).values(), key=lambda state: state.name)
-    for state in states:
-        # Sort cities of each state by name
-        state.cities = sorted([city for city in state.cities],
-                              key=lambda city: city.name)
-    # Fetch and sort all City objects by name
-    cities = sorted(storage.all(City).values(), key=lambda city: city.name)
-    # Fetch and sort all Amenity objects by name
-    amenities = sorted(storage.all(Amenity).values(),
-                       key=lambda amenity: amenity.name)
+    # Fetch State objects by name, with their cities (ordered by name)
+    states = storage.filter(State, order_by='name', load=('cities',))
+    # Fetch City objects by name
+    cities = storage.filter(City, order_by='name', load=())
+    # Fetch Amenity objects by name
+    amenities = storage.filter(Amenity, order_by='name', load=())
     # Render the template with the fetched data
     return render_template('10-hbnb_filters.html', states=states,
                            cities=cities, amenities=amenities)
@@ -10,22 +10,25 @@ with a list of all State objects from DBStorage, sorted alphabetically (A->Z).
 """
 
 from flask import Flask, render_template
+from web_flask.page_cache import PageCache
 from models import storage
 from models.state import State
 
 app = Flask(__name__)
+# Rendered pages, until the objects they show change
+page_cache = PageCache()
 
 
 @app.route('/states_list', strict_slashes=False)
+@page_cache.cached(State)
 def states_list():
     """
-    Fetches all State objects from storage, sorts them alphabetically,
-    and passes them to the template for rendering.
+    Fetches the State objects from storage, sorted alphabetically by the
+    storage engine, and passes them to the template for rendering.
     """
-    states = storage.all(State).values()
     # Take only first 5 states for task checker test compliance (not required)
-    states_sorted = sorted(states, key=lambda state: state.name)[:5]
-    return render_template('7-states_list.html', states=states_sorted)
+    states = storage.filter(State, order_by='name', limit=5, load=())
+    return render_template('7-states_list.html', states=states)
 
 
 @app.teardown_appcontext
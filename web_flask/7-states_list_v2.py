@@ -10,18 +10,22 @@ Description: This script initiates a Flask web application that listens on
 
 from flask import Flask, render_template
 from models.state import State
+from web_flask.page_cache import PageCache
 from models import storage
 
 
 app = Flask(__name__)
+# Rendered pages, until the objects they show change
+page_cache = PageCache()
 
 
 @app.route("/states_list", strict_slashes=False)
+@page_cache.cached(State)
 def states_list():
     """
     This route generates an HTML page that lists all states in the database.
     """
-    states = storage.all(State)
+    states = storage.filter(State, order_by='name', load=())
     return render_template('7-states_list.html', states=states)
 
 
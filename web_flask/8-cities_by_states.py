@@ -11,24 +11,26 @@ also sorted alphabetically (A->Z). Route for this page is /cities_by_states.
 """
 
 from flask import Flask, render_template
+from web_flask.page_cache import PageCache
 from models import storage
 from models.state import State
+from models.city import City
 
 app = Flask(__name__)
+# Rendered pages, until the objects they show change
+page_cache = PageCache()
 
 
 @app.route('/cities_by_states', strict_slashes=False)
+@page_cache.cached(State, City)
 def cities_by_states():
     """
-    Function fetches all State objects from storage, sorts them alphabetically,
-    and also sorts each state's cities alphabetically before passing them
-    to the template for rendering.
+    Function fetches all State objects from storage, ordered alphabetically
+    by the storage engine along with their cities (State.cities is ordered
+    by name), and passes them to the template for rendering.
     """
-    states = storage.all(State).values()
-    states_sorted = sorted(states, key=lambda state: state.name)
-    for state in states_sorted:
-        state.cities = sorted(state.cities, key=lambda city: city.name)
-    return render_template('8-cities_by_states.html', states=states_sorted)
+    states = storage.filter(State, order_by='name', load=('cities',))
+    return render_template('8-cities_by_states.html', states=states)
 
 
 @app.teardown_appcontext
@@ -12,37 +12,36 @@ name (A->Z), under the route /states.
 
 from flask import Flask, render_template
 from models.state import State
+from models.city import City
+from web_flask.page_cache import PageCache
 from models import storage
 
 
 app = Flask(__name__, template_folder='templates')
+# Rendered pages, until the objects they show change
+page_cache = PageCache()
 
 
 @app.route('/states', strict_slashes=False)
+@page_cache.cached(State)
 def states():
     """
-    Fetches all State objects from storage, sorts them by name,
-    and also sorts each state's cities by name before passing them
-    to the template for rendering.
+    Fetches all State objects from storage, sorted by name by the storage
+    engine, and passes them to the template for rendering.
     """
-    states = storage.all(State).values()
-    states = sorted(states, key=lambda state: state.name)
-    for state in states:
-        state.cities = sorted(state.cities, key=lambda city: city.name)
+    states = storage.filter(State, order_by='name', load=())
     return render_template('9-states.html', states=states)
 
 
 @app.route('/states/<id>', strict_slashes=False)
+@page_cache.cached(State, City)
 def state(id):
     """
-    Fetches a State object with the given id from storage, sorts its cities
+    Fetches the State object with the given id, whose cities come ordered
     by name, and passes it to the template for rendering.
     """
-    for state in storage.all(State).values():
-        if state.id == id:
-            state.cities = sorted(state.cities, key=lambda city: city.name)
-            return render_template('9-states.html', state=state)
-    return render_template('9-states.html')
+    state = storage.get(State, id, load=('cities',))
+    return render_template('9-states.html', state=state)
 
 
 @app.teardown_appcontext
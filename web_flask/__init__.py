@@ -4,5 +4,36 @@
 File: __init__.py
 Author: TheWatcher01
 Date: 2024-04-08
-Description: Description
+Description: Flask application factory. create_app() registers the routes
+of all the web_flask scripts, as blueprints, in a single WSGI application
+served by wsgi.py at the root of the repository, with the JSON API under
+/api/v1. Storage is created by each worker on its first request (see
+models/__init__.py), so workers forked by a multi-process server never
+share connections.
 """
+
+
+def close_storage(exception=None):
+    """
+    Closes the storage session after each request, if storage was created:
+    routes that do not use storage do not create it.
+    """
+    import models
+    storage = vars(models).get('storage')
+    if storage is not None:
+        storage.close()
+
+
+def create_app():
+    """Returns a Flask application serving all the web_flask routes"""
+    from flask import Flask
+    from web_flask.views.basic import basic
+    from web_flask.views.states import states
+    from web_flask.views.hbnb_filters import hbnb_filters
+    from web_flask.views.api import api
+
+    app = Flask(__name__, template_folder='templates')
+    for blueprint in (basic, states, hbnb_filters, api):
+        app.register_blueprint(blueprint)
+    app.teardown_appcontext(close_storage)
+    return app
@@ -0,0 +1,142 @@
+#!/usr/bin/python3
+
+"""
+File: asgi.py
+Author: TheWatcher01
+Date: 2026-10-18
+Description: ASGI application serving the State, City and Amenity pages of
+web_flask (/states_list, /cities_by_states, /states, /states/<id> and
+/hbnb_filters) from one event loop: queries go through AsyncDBStorage and
+templates are rendered with Jinja's render_async(), so a worker keeps
+serving other requests while one waits on the database or a slow client.
+DB mode only (HBNB_TYPE_STORAGE=db); the other routes and the static files
+stay with the WSGI application (wsgi.py).
+
+Usage: uvicorn web_flask.asgi:app --host 0.0.0.0 --port 5001
+"""
+
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+import asyncio
+import re
+import os
+
+TEMPLATES = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                         'templates')
+
+
+class ReadApp:
+    """ASGI application of the read-only storage pages"""
+
+    def __init__(self, storage=None):
+        """
+        Uses storage, an AsyncDBStorage, or creates one on the first
+        request (in the worker process, not in a preforking parent)
+        """
+        self.storage = storage
+        self.env = Environment(loader=FileSystemLoader(TEMPLATES),
+                               autoescape=select_autoescape(['html']),
+                               enable_async=True)
+        self.routes = [
+            (re.compile(r'/states_list/?$'), self.states_list),
+            (re.compile(r'/cities_by_states/?$'), self.cities_by_states),
+            (re.compile(r'/states/?$'), self.states),
+            (re.compile(r'/states/(?P<id>[^/]+)/?$'), self.state),
+            (re.compile(r'/hbnb_filters/?$'), self.hbnb_filters),
+        ]
+
+    async def __call__(self, scope, receive, send):
+        """Answers an ASGI lifespan or HTTP event"""
+        if scope['type'] == 'lifespan':
+            await self.lifespan(receive, send)
+            return
+        if scope['type'] != 'http':
+            return
+        if scope['method'] not in ('GET', 'HEAD'):
+            await self.respond(send, 405, 'Method Not Allowed')
+            return
+        for pattern, view in self.routes:
+            match = pattern.match(scope['path'])
+            if match:
+                body = await view(**match.groupdict())
+                await self.respond(send, 200, body,
+                                   scope['method'] == 'HEAD')
+                return
+        await self.respond(send, 404, 'Not Found')
+
+    async def lifespan(self, receive, send):
+        """Closes the connections of storage when the server stops"""
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                if self.storage is not None:
+                    await self.storage.close()
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    @staticmethod
+    async def respond(send, status, body, head=False):
+        """Sends body as the text/html response"""
+        body = body.encode('utf-8')
+        await send({'type': 'http.response.start', 'status': status,
+                    'headers': [
+                        (b'content-type', b'text/html; charset=utf-8'),
+                        (b'content-length', str(len(body)).encode())]})
+        await send({'type': 'http.response.body',
+                    'body': b'' if head else body})
+
+    def db(self):
+        """Returns the AsyncDBStorage, created on first use"""
+        if self.storage is None:
+            from models.engine.async_db_storage import AsyncDBStorage
+            self.storage = AsyncDBStorage()
+        return self.storage
+
+    async def render(self, template, **context):
+        """Renders template asynchronously"""
+        return await self.env.get_template(template).render_async(
+            **context)
+
+    async def states_list(self):
+        """Lists all the State objects, sorted by name"""
+        from models.state import State
+        states = await self.db().filter(State, order_by='name', load=())
+        return await self.render('7-states_list.html', states=states)
+
+    async def cities_by_states(self):
+        """Lists the State objects sorted by name, each with its cities"""
+        from models.state import State
+        states = await self.db().filter(State, order_by='name',
+                                        load=('cities',))
+        return await self.render('8-cities_by_states.html', states=states)
+
+    async def states(self):
+        """Lists all the State objects, sorted by name"""
+        from models.state import State
+        states = await self.db().filter(State, order_by='name', load=())
+        return await self.render('9-states.html', states=states)
+
+    async def state(self, id):
+        """Shows the State object with the given id and its cities"""
+        from models.state import State
+        state = await self.db().get(State, id, load=('cities',))
+        return await self.render('9-states.html', state=state)
+
+    async def hbnb_filters(self):
+        """
+        Lists the State (with their cities) and Amenity objects, sorted by
+        name, as the WSGI view does
+        """
+        from models.amenity import Amenity
+        from models.state import State
+        storage = self.db()
+        # Two independent queries, on two connections at once
+        states, amenities = await asyncio.gather(
+            storage.filter(State, order_by='name', load=('cities',)),
+            storage.filter(Amenity, order_by='name', load=()))
+        return await self.render('10-hbnb_filters.html', states=states,
+                                 amenities=amenities)
+
+
+app = ReadApp()
@@ -0,0 +1,108 @@
+#!/usr/bin/python3
+
+"""
+File: benchmark.py
+Author: TheWatcher01
+Date: 2026-10-18
+Description: Compares the throughput of the sync (wsgi.py, one thread per
+request in flight) and async (web_flask/asgi.py, one event loop) read
+paths on the same database. Both applications are called in process, so
+only the applications are measured, not an HTTP server. Page caching is
+disabled for the sync side. The optional latency is added to every
+request (time.sleep() in a thread, asyncio.sleep() on the loop) to
+stand in for a slow database or a slow client.
+
+Usage: HBNB_TYPE_STORAGE=db HBNB_DB_URL=sqlite:////tmp/hbnb.db \\
+    python3 -m web_flask.benchmark [<requests> [<concurrency> [<threads>
+    [<latency ms>]]]]
+
+An empty database is first loaded from 7-dump.sql.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from werkzeug.test import Client
+import asyncio
+import time
+import sys
+import os
+
+PATHS = ('/states_list', '/cities_by_states', '/hbnb_filters')
+
+
+def run_sync(requests, threads, latency):
+    """Returns the requests per second of the WSGI app on threads"""
+    os.environ['HBNB_PAGE_CACHE_TTL'] = '0'
+    from web_flask import create_app
+    app = create_app()
+
+    def get(number):
+        """Requests one page, after the latency"""
+        time.sleep(latency)
+        response = Client(app).get(PATHS[number % len(PATHS)])
+        assert response.status_code == 200, response.status
+
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(get, range(len(PATHS))))
+        start = time.perf_counter()
+        list(pool.map(get, range(requests)))
+    return requests / (time.perf_counter() - start)
+
+
+async def asgi_get(app, path):
+    """Calls the ASGI app with a GET of path and returns the status"""
+    scope = {'type': 'http', 'method': 'GET', 'path': path,
+             'query_string': b'', 'headers': []}
+    statuses = []
+
+    async def receive():
+        """Returns the empty request body"""
+        return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+    async def send(message):
+        """Records the status of the response"""
+        if message['type'] == 'http.response.start':
+            statuses.append(message['status'])
+
+    await app(scope, receive, send)
+    return statuses[0]
+
+
+async def run_async(requests, concurrency, latency):
+    """Returns the requests per second of the ASGI app on one loop"""
+    from web_flask.asgi import ReadApp
+    app = ReadApp()
+    limit = asyncio.Semaphore(concurrency)
+
+    async def get(number):
+        """Requests one page, after the latency"""
+        async with limit:
+            await asyncio.sleep(latency)
+            status = await asgi_get(app, PATHS[number % len(PATHS)])
+            assert status == 200, status
+
+    await asyncio.gather(*(get(n) for n in range(len(PATHS))))
+    start = time.perf_counter()
+    await asyncio.gather(*(get(n) for n in range(requests)))
+    rate = requests / (time.perf_counter() - start)
+    await app.storage.close()
+    return rate
+
+
+def main(requests=2000, concurrency=50, threads=8, latency=0):
+    """Prints the throughput of both read paths"""
+    from models import storage
+    if storage.count() == 0:
+        from models.engine.dump_loader import load
+        load(os.path.join(os.path.dirname(__file__), '..', '7-dump.sql'),
+             storage)
+    latency /= 1000
+    sync_rate = run_sync(requests, threads, latency)
+    async_rate = asyncio.run(run_async(requests, concurrency, latency))
+    print("{} requests, {:g} ms latency".format(requests, latency * 1000))
+    print("sync:  {:8.1f} req/s ({} threads)".format(sync_rate, threads))
+    print("async: {:8.1f} req/s ({} concurrent)".format(
+        async_rate, concurrency))
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:5]))
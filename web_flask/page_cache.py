@@ -0,0 +1,103 @@
+#!/usr/bin/python3
+"""
+File: page_cache.py
+Author: TheWatcher01
+Date: 2026-10-18
+Description: Response cache for the web_flask views. A view decorated with
+PageCache.cached(State, City) is rendered once per route and query string,
+then served from memory until storage reports a change of one of the
+classes it depends on (storage.generation()), its entry expires (TTL) or
+it is evicted as the least recently used. Every page carries an ETag, so
+clients revalidating with If-None-Match get an empty 304.
+
+The cache size and TTL default to HBNB_PAGE_CACHE_SIZE (128 pages) and
+HBNB_PAGE_CACHE_TTL (60 seconds; 0 disables caching, ETags are still sent).
+The TTL bounds how stale a page can get from writes storage does not see:
+in DB mode, those made by other processes.
+"""
+
+from flask import Response, request
+from collections import OrderedDict
+from functools import wraps
+from os import getenv
+import threading
+import hashlib
+import time
+
+
+class PageCache:
+    """LRU cache of rendered pages, invalidated by storage generations"""
+
+    def __init__(self, maxsize=None, ttl=None):
+        """Starts empty"""
+        if maxsize is None:
+            maxsize = int(getenv('HBNB_PAGE_CACHE_SIZE', '128'))
+        if ttl is None:
+            ttl = float(getenv('HBNB_PAGE_CACHE_TTL', '60'))
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        # key -> (generations, expiry, body, etag, headers), least recently
+        # used first
+        self.__pages = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def cached(self, *classes):
+        """
+        Decorates a view whose page only depends on the objects of classes.
+        The view returns the page as a str, or as a (str, headers) tuple to
+        cache headers with it. A Response it returns (a streamed page) is
+        sent as is, and not cached.
+        """
+        def decorator(view):
+            @wraps(view)
+            def wrapper(*args, **kwargs):
+                return self.__respond(view, classes, args, kwargs)
+            return wrapper
+        return decorator
+
+    def clear(self):
+        """Drops every cached page"""
+        with self.__lock:
+            self.__pages.clear()
+
+    def __len__(self):
+        """Returns the number of cached pages"""
+        return len(self.__pages)
+
+    def __respond(self, view, classes, args, kwargs):
+        """Serves the page of the request from the cache or renders it"""
+        from models import storage
+        key = (request.path, tuple(sorted(request.args.items(multi=True))))
+        generations = tuple(storage.generation(cls) for cls in classes)
+        now = time.monotonic()
+        with self.__lock:
+            entry = self.__pages.get(key)
+            if (entry is not None and entry[0] == generations and
+                    entry[1] > now):
+                self.__pages.move_to_end(key)
+                self.hits += 1
+            else:
+                entry = None
+                self.misses += 1
+        if entry is None:
+            body = view(*args, **kwargs)
+            if isinstance(body, Response):
+                return body
+            headers = {}
+            if isinstance(body, tuple):
+                body, headers = body
+            etag = hashlib.blake2b(body.encode('utf-8'),
+                                   digest_size=16).hexdigest()
+            entry = (generations, now + self.ttl, body, etag, headers)
+            if self.ttl > 0 and self.maxsize > 0:
+                with self.__lock:
+                    self.__pages[key] = entry
+                    self.__pages.move_to_end(key)
+                    while len(self.__pages) > self.maxsize:
+                        self.__pages.popitem(last=False)
+        response = Response(entry[2], mimetype='text/html',
+                            headers=entry[4])
+        response.set_etag(entry[3])
+        return response.make_conditional(request)
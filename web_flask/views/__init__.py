@@ -0,0 +1,9 @@
+#!/usr/bin/python3
+
+"""
+File: __init__.py
+Author: TheWatcher01
+Date: 2026-10-18
+Description: Blueprints of the routes of the web_flask scripts, registered
+together by web_flask.create_app().
+"""
@@ -0,0 +1,168 @@
+#!/usr/bin/python3
+
+"""
+File: api.py
+Author: TheWatcher01
+Date: 2026-10-18
+Description: Blueprint of the JSON API over the models, under /api/v1.
+
+    GET /api/v1/<resource>       lists the objects of a resource: states,
+                                 cities, amenities, places, reviews or
+                                 users
+    GET /api/v1/<resource>/<id>  returns one object
+
+Lists are filtered on columns (?state_id=<id>), sorted with
+?order_by=<column> (-<column> for descending, id by default) and paged
+with ?page and ?limit (see paging.py; HBNB_PAGE_SIZE objects by default).
+?fields=id,name keeps only those keys of each object. Objects are sent in
+the to_dict() format, built by storage.record() (FileStorage serves it
+from the records it already holds), without their password.
+
+Every response carries an ETag, and an object its updated_at as
+Last-Modified. Both are computed from the ids and updated_at of the
+objects, before anything is serialized: a conditional GET that still
+matches gets an empty 304 for the cost of the query alone.
+"""
+
+from flask import Blueprint, Response, abort, request
+from werkzeug.http import is_resource_modified
+from web_flask.views.paging import link_header, page_args
+from models.amenity import Amenity
+from models.review import Review
+from models.place import Place
+from models.state import State
+from models.user import User
+from models.city import City
+from datetime import datetime
+import hashlib
+import json
+
+api = Blueprint('api', __name__, url_prefix='/api/v1')
+
+# Model class of each resource
+RESOURCES = {'states': State, 'cities': City, 'amenities': Amenity,
+             'places': Place, 'reviews': Review, 'users': User}
+# Keys never sent, filtered or sorted on
+HIDDEN = frozenset(['password'])
+# Query parameters that are not filters
+RESERVED = frozenset(['page', 'limit', 'fields', 'order_by'])
+
+
+def model(resource):
+    """Returns the class of resource, or aborts with 404"""
+    cls = RESOURCES.get(resource)
+    if cls is None:
+        abort(404, 'Not found')
+    return cls
+
+
+def column(cls, name):
+    """Returns the column of cls named name, or aborts with 400"""
+    if name not in HIDDEN:
+        for col in cls.__table__.columns:
+            if col.key == name:
+                return col
+    abort(400, 'Unknown column: {}'.format(name))
+
+
+def criteria(cls):
+    """
+    Returns the filters of the request, converted to the Python type of
+    their columns
+    """
+    result = {}
+    for name, value in request.args.items():
+        if name in RESERVED:
+            continue
+        python_type = column(cls, name).type.python_type
+        try:
+            result[name] = (datetime.fromisoformat(value)
+                            if python_type is datetime
+                            else python_type(value))
+        except ValueError:
+            abort(400, 'Invalid value for {}: {}'.format(name, value))
+    return result
+
+
+def fields():
+    """Returns the keys asked for by ?fields, or None for all of them"""
+    value = request.args.get('fields')
+    if not value:
+        return None
+    return [name for name in value.split(',') if name not in HIDDEN]
+
+
+def serialize(storage, obj, keys):
+    """Returns the record of obj, reduced to keys unless they are None"""
+    record = storage.record(obj)
+    if keys is not None:
+        return {key: record[key] for key in keys if key in record}
+    if HIDDEN.isdisjoint(record):
+        return record
+    return {key: value for key, value in record.items()
+            if key not in HIDDEN}
+
+
+def respond(objs, build, last_modified=None, headers=None):
+    """
+    Returns the JSON of build() as the response for objs, or an empty 304
+    when the validators of the request match their ETag or Last-Modified
+    """
+    digest = hashlib.blake2b(request.query_string, digest_size=16)
+    for obj in objs:
+        digest.update('{}|{}\n'.format(obj.id, obj.updated_at).encode())
+    etag = digest.hexdigest()
+    response = Response(mimetype='application/json', headers=headers)
+    response.set_etag(etag)
+    if last_modified is not None:
+        response.last_modified = last_modified
+    if not is_resource_modified(request.environ, etag=etag,
+                                last_modified=last_modified):
+        response.status_code = 304
+        return response
+    response.set_data(json.dumps(build(), separators=(',', ':')))
+    return response
+
+
+@api.route('/<resource>', strict_slashes=False)
+def list_objects(resource):
+    """Lists the objects of resource, filtered, sorted and paged"""
+    from models import storage
+    cls = model(resource)
+    filters = criteria(cls)
+    order_by = request.args.get('order_by', 'id')
+    column(cls, order_by.lstrip('-'))
+    keys = fields()
+    limit, offset = page_args(paged=True)
+    # One more object than the page tells whether a next page exists
+    objs = storage.filter(cls, order_by=order_by, limit=limit + 1,
+                          offset=offset, load=(), **filters)
+    more = len(objs) > limit
+    del objs[limit:]
+    headers = {}
+    links = link_header(limit, offset, more)
+    if links:
+        headers['Link'] = links
+    return respond(objs, lambda: [serialize(storage, obj, keys)
+                                  for obj in objs], headers=headers)
+
+
+@api.route('/<resource>/<id>', strict_slashes=False)
+def get_object(resource, id):
+    """Returns the object of resource with this id"""
+    from models import storage
+    cls = model(resource)
+    keys = fields()
+    obj = storage.get(cls, id, load=())
+    if obj is None:
+        abort(404, 'Not found')
+    return respond([obj], lambda: serialize(storage, obj, keys),
+                   last_modified=obj.updated_at)
+
+
+@api.errorhandler(400)
+@api.errorhandler(404)
+def error(exception):
+    """Returns the error as JSON"""
+    return Response(json.dumps({'error': exception.description}),
+                    exception.code, mimetype='application/json')
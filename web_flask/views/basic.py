@@ -0,0 +1,72 @@
+#!/usr/bin/python3
+
+"""
+File: basic.py
+Author: TheWatcher01
+Date: 2026-10-18
+Description: Blueprint of the routes of 0-hello_route.py to
+6-number_odd_or_even.py, which do not use storage.
+"""
+
+from flask import Blueprint, render_template
+
+basic = Blueprint('basic', __name__)
+
+
+@basic.route('/', strict_slashes=False)
+def hello_hbnb():
+    """
+    Return a string with a message Hello HBNB!
+    """
+    return "Hello HBNB!"
+
+
+@basic.route('/hbnb', strict_slashes=False)
+def hbnb():
+    """
+    Return a string with a message HBNB
+    """
+    return "HBNB"
+
+
+@basic.route('/c/<text>', strict_slashes=False)
+def display_c(text):
+    """
+    Returns "C " followed by text, with underscores replaced by spaces.
+    """
+    return "C " + text.replace("_", " ")
+
+
+@basic.route('/python/', defaults={'text': 'is cool'}, strict_slashes=False)
+@basic.route('/python/<text>', strict_slashes=False)
+def display_python(text):
+    """
+    Returns "Python " followed by text, with underscores replaced by spaces,
+    or "is cool" if text is not provided.
+    """
+    return "Python " + text.replace("_", " ")
+
+
+@basic.route('/number/<int:n>', strict_slashes=False)
+def display_number(n):
+    """
+    Returns "n is a number" only if n is an integer.
+    """
+    return "{} is a number".format(n)
+
+
+@basic.route('/number_template/<int:n>', strict_slashes=False)
+def display_number_template(n):
+    """
+    Returns an HTML page displaying "Number: n" only if n is an integer.
+    """
+    return render_template('5-number.html', n=n)
+
+
+@basic.route('/number_odd_or_even/<int:n>', strict_slashes=False)
+def display_number_odd_or_even(n):
+    """
+    Returns an HTML page displaying "Number: n is odd|even" only if n is an
+    integer.
+    """
+    return render_template('6-number_odd_or_even.html', n=n)
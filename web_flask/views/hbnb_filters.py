@@ -0,0 +1,35 @@
+#!/usr/bin/python3
+
+"""
+File: hbnb_filters.py
+Author: TheWatcher01
+Date: 2026-10-18
+Description: Blueprint of the filters page of 10-hbnb_filters.py. storage
+is imported when the page is rendered, so each worker process creates its
+own. The State and Amenity lists are paged together by ?page and ?limit
+and streamed with ?stream=1 (see paging.py).
+"""
+
+from flask import Blueprint
+from web_flask.views.paging import render_listing
+from web_flask.page_cache import PageCache
+from models.amenity import Amenity
+from models.state import State
+from models.city import City
+
+hbnb_filters = Blueprint('hbnb_filters', __name__)
+# Rendered pages, until the objects they show change
+page_cache = PageCache()
+
+
+@hbnb_filters.route('/hbnb_filters', strict_slashes=False)
+@page_cache.cached(State, City, Amenity)
+def filters():
+    """
+    Fetch the State (with their cities) and Amenity objects from storage,
+    ordered by name by the storage engine, and pass them to the template
+    for rendering.
+    """
+    return render_listing('10-hbnb_filters.html',
+                          states=(State, ('cities',)),
+                          amenities=(Amenity, ()))
@@ -0,0 +1,172 @@
+#!/usr/bin/python3
+
+"""
+File: paging.py
+Author: TheWatcher01
+Date: 2026-10-18
+Description: Pagination and streaming for the listing pages. A request
+with ?page=<n> and/or ?limit=<size> gets one page of the listing, read
+from storage with filter(limit=..., offset=...) and linked to its
+neighbours by a Link header. A request with ?stream=1 gets the page
+streamed: the template is rendered while the objects are read from
+storage in batches, and its output is flushed in chunks. The first bytes
+leave before the last rows are read, and only one batch is held in
+memory.
+
+HBNB_PAGE_SIZE (50) is the limit of a ?page request without ?limit,
+HBNB_PAGE_LIMIT_MAX (1000) the largest limit accepted and
+HBNB_STREAM_BATCH (100) the number of objects read per query when
+streaming.
+"""
+
+from flask import (Response, abort, current_app, render_template, request,
+                   stream_with_context)
+from urllib.parse import urlencode
+from os import getenv
+
+# Template outputs (text runs and expressions) sent as one streamed chunk
+STREAM_BUFFER = 64
+
+
+def page_args(paged=False):
+    """
+    Returns the (limit, offset) of the request: (None, 0) for the whole
+    listing, unless paged, which makes it the first page. Aborts with 400
+    on a page or limit that is not a positive integer, or a limit above
+    HBNB_PAGE_LIMIT_MAX.
+    """
+    page = request.args.get('page', type=int)
+    limit = request.args.get('limit', type=int)
+    if ((page is None and 'page' in request.args) or
+            (limit is None and 'limit' in request.args)):
+        abort(400)
+    if page is None and limit is None and not paged:
+        return None, 0
+    if limit is None:
+        limit = int(getenv('HBNB_PAGE_SIZE', '50'))
+    if page is None:
+        page = 1
+    if page < 1 or limit < 1 or limit > int(
+            getenv('HBNB_PAGE_LIMIT_MAX', '1000')):
+        abort(400)
+    return limit, (page - 1) * limit
+
+
+def streaming():
+    """Returns True if the request asks for a streamed page"""
+    return request.args.get('stream', '0') not in ('', '0', 'false')
+
+
+class Rows:
+    """
+    Lazy listing of storage.filter(cls, ...), read in batches of
+    HBNB_STREAM_BATCH objects when iterated. Its truth value only reads
+    the first batch, for templates testing {% if states %}.
+    """
+
+    def __init__(self, cls, limit=None, offset=0, batch=None, **kwargs):
+        """Lists at most limit objects of cls from offset"""
+        self.cls = cls
+        self.limit = limit
+        self.offset = offset
+        self.batch = batch or int(getenv('HBNB_STREAM_BATCH', '100'))
+        self.kwargs = kwargs
+        self.__first = None
+
+    def __read(self, offset, size):
+        """Returns the objects from offset, at most size of them"""
+        from models import storage
+        return storage.filter(self.cls, limit=size, offset=offset,
+                              **self.kwargs)
+
+    def __size(self, read):
+        """Returns the size of the batch after read objects"""
+        if self.limit is None:
+            return self.batch
+        return min(self.batch, self.limit - read)
+
+    def __bool__(self):
+        """Returns True if the listing has an object"""
+        if self.__first is None:
+            self.__first = self.__read(self.offset, self.__size(0))
+        return bool(self.__first)
+
+    def __iter__(self):
+        """Yields the objects, one batch in memory at a time"""
+        read = 0
+        rows, self.__first = self.__first, None
+        while read != self.limit:
+            size = self.__size(read)
+            if rows is None:
+                rows = self.__read(self.offset + read, size)
+            yield from rows
+            read += len(rows)
+            if len(rows) < size:
+                return
+            rows = None
+
+
+def link_header(limit, offset, more):
+    """
+    Returns the Link header of the page at offset (RFC 8288): the next
+    page if more, the previous one if any
+    """
+    links = []
+    page = offset // limit + 1
+    args = request.args.copy()
+    args['limit'] = limit
+    for rel, number in (('prev', page - 1), ('next', page + 1)):
+        if number < 1 or (rel == 'next' and not more):
+            continue
+        args['page'] = number
+        links.append('<{}?{}>; rel="{}"'.format(
+            request.path, urlencode(list(args.items(multi=True))), rel))
+    return ', '.join(links)
+
+
+def stream_page(template_name, **context):
+    """
+    Returns a Response streaming the rendering of template_name, flushed
+    every STREAM_BUFFER template outputs. The objects of context are read
+    as the template reaches them, within the request: storage stays open
+    until the last chunk is sent.
+    """
+    app = current_app._get_current_object()
+    app.update_template_context(context)
+    stream = app.jinja_env.get_template(template_name).stream(context)
+    stream.enable_buffering(STREAM_BUFFER)
+    return Response(stream_with_context(iter(stream)),
+                    mimetype='text/html')
+
+
+def render_listing(template_name, **listings):
+    """
+    Renders template_name with, for each keyword, the objects of a class
+    sorted by name: listings maps a template variable to (cls, load). The
+    listings are paged together by ?page and ?limit, and streamed with
+    ?stream=1.
+
+    Returns the page, with its Link header when paged, or a streamed
+    Response (which PageCache does not cache).
+    """
+    from models import storage
+    limit, offset = page_args()
+    if streaming():
+        context = {name: Rows(cls, limit, offset, order_by='name',
+                              load=load)
+                   for name, (cls, load) in listings.items()}
+        response = stream_page(template_name, **context)
+    else:
+        context = {name: storage.filter(cls, order_by='name', limit=limit,
+                                        offset=offset, load=load)
+                   for name, (cls, load) in listings.items()}
+        response = render_template(template_name, **context)
+    if limit is None:
+        return response
+    more = any(offset + limit < storage.count(cls)
+               for cls, _ in listings.values())
+    headers = {'Link': link_header(limit, offset, more)}
+    if isinstance(response, Response):
+        response.headers.update(headers)
+        return response
+    return response, headers
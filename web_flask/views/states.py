@@ -0,0 +1,62 @@
+#!/usr/bin/python3
+
+"""
+File: states.py
+Author: TheWatcher01
+Date: 2026-10-18
+Description: Blueprint of the State and City pages of 7-states_list_v2.py,
+8-cities_by_states.py and 9-states.py. storage is imported when a page is
+rendered, so each worker process creates its own. The State listings are
+paged by ?page and ?limit and streamed with ?stream=1 (see paging.py).
+"""
+
+from flask import Blueprint, render_template
+from web_flask.views.paging import render_listing
+from web_flask.page_cache import PageCache
+from models.state import State
+from models.city import City
+
+states = Blueprint('states', __name__)
+# Rendered pages, until the objects they show change
+page_cache = PageCache()
+
+
+@states.route('/states_list', strict_slashes=False)
+@page_cache.cached(State)
+def states_list():
+    """
+    Lists the State objects, sorted by name by the storage engine.
+    """
+    return render_listing('7-states_list.html', states=(State, ()))
+
+
+@states.route('/cities_by_states', strict_slashes=False)
+@page_cache.cached(State, City)
+def cities_by_states():
+    """
+    Lists the State objects sorted by name, each with its cities
+    (State.cities is ordered by name).
+    """
+    return render_listing('8-cities_by_states.html',
+                          states=(State, ('cities',)))
+
+
+@states.route('/states', strict_slashes=False)
+@page_cache.cached(State)
+def states_page():
+    """
+    Lists the State objects, sorted by name by the storage engine.
+    """
+    return render_listing('9-states.html', states=(State, ()))
+
+
+@states.route('/states/<id>', strict_slashes=False)
+@page_cache.cached(State, City)
+def state(id):
+    """
+    Shows the State object with the given id and its cities, ordered by
+    name.
+    """
+    from models import storage
+    state = storage.get(State, id, load=('cities',))
+    return render_template('9-states.html', state=state)
@@ -0,0 +1,20 @@
+#!/usr/bin/python3
+"""
+Module: wsgi.py
+Author: TheWatcher01
+Date: 2026-10-18
+Description: WSGI entry point serving all the web_flask routes from one
+application, for multi-process servers:
+
+    gunicorn -w 4 -b 0.0.0.0:5000 wsgi:app
+    waitress-serve --listen=0.0.0.0:5000 wsgi:app
+
+Run directly, it starts the Flask development server on port 5000.
+"""
+
+from web_flask import create_app
+
+app = create_app()
+
+if __name__ == "__main__":
+    app.run(host="0.0.0.0", port=5000)